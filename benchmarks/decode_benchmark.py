@@ -0,0 +1,124 @@
+"""
+Compare the response decoding paths of the clients.
+
+The fixtures in ``tests/fixtures`` are scaled up to realistic payload sizes, then decoded once with
+``response.json()`` followed by ``model_validate`` and once straight from bytes with ``model_validate_json``.
+The second table compares building public models through DTOs and ``from_dto`` with single-pass decoding.
+
+Run from the repository root:
+
+    python benchmarks/decode_benchmark.py
+"""
+
+import json
+import timeit
+
+from flight_radar.clients.base import _list_adapter
+from flight_radar.dtos import (
+    GetFlightSummaryResponseDto,
+    GetFlightTracksResponseDto,
+    GetLiveFlightPositionLightResponseDto,
+    GetLiveFlightPositionResponseDto,
+)
+from flight_radar.models import FlightPosition, FlightSummary, FlightTrack
+from flight_radar.models.responses import FlightPositionResponse, FlightSummaryResponse, FlightTrackResponse
+
+
+def _load(fixture: str):
+    with open(f'tests/fixtures/{fixture}', 'r') as f:
+        return json.load(f)
+
+
+def _scaled(fixture: str, rows: int) -> bytes:
+    payload = _load(fixture)
+    entries = payload['data']
+    payload['data'] = [entries[i % len(entries)] for i in range(rows)]
+    return json.dumps(payload).encode()
+
+
+def _scaled_tracks(rows: int) -> bytes:
+    payload = _load('get_flight_tracks.json')
+    tracks = payload[0]['tracks']
+    payload[0]['tracks'] = [tracks[i % len(tracks)] for i in range(rows)]
+    return json.dumps(payload).encode()
+
+
+def _report(name: str, content: bytes, current, fast, number: int = 5) -> None:
+    current_time = min(timeit.repeat(lambda: current(content), number=number, repeat=3)) / number
+    fast_time = min(timeit.repeat(lambda: fast(content), number=number, repeat=3)) / number
+    print(
+        f'{name:<40} {len(content) / 1024:>9.0f} KiB '
+        f'{current_time * 1000:>9.1f} ms {fast_time * 1000:>9.1f} ms {current_time / fast_time:>6.2f}x'
+    )
+
+
+def main() -> None:
+    print(f'{"payload":<40} {"size":>13} {"current":>12} {"bytes":>12} {"speedup":>7}')
+
+    for name, fixture, dto_class, rows in [
+        ('live positions full (30,000 rows)', 'get_flight_positions.json', GetLiveFlightPositionResponseDto, 30000),
+        (
+            'live positions light (30,000 rows)',
+            'get_flight_positions_light.json',
+            GetLiveFlightPositionLightResponseDto,
+            30000,
+        ),
+        ('flight summary full (20,000 rows)', 'get_flight_summary.json', GetFlightSummaryResponseDto, 20000),
+    ]:
+        _report(
+            name,
+            _scaled(fixture, rows),
+            lambda content, cls=dto_class: cls.model_validate(json.loads(content)),
+            lambda content, cls=dto_class: cls.model_validate_json(content),
+        )
+
+    _report(
+        'flight tracks (5,000 points)',
+        _scaled_tracks(5000),
+        lambda content: [GetFlightTracksResponseDto.model_validate(entry) for entry in json.loads(content)],
+        lambda content: _list_adapter(GetFlightTracksResponseDto).validate_json(content),
+    )
+
+    print()
+    print(f'{"payload":<40} {"size":>13} {"from_dto":>12} {"1-pass":>12} {"speedup":>7}')
+
+    for name, fixture, dto_class, model_class, envelope_class, rows in [
+        (
+            'live positions full (30,000 rows)',
+            'get_flight_positions.json',
+            GetLiveFlightPositionResponseDto,
+            FlightPosition,
+            FlightPositionResponse,
+            30000,
+        ),
+        (
+            'flight summary full (20,000 rows)',
+            'get_flight_summary.json',
+            GetFlightSummaryResponseDto,
+            FlightSummary,
+            FlightSummaryResponse,
+            20000,
+        ),
+    ]:
+        _report(
+            name,
+            _scaled(fixture, rows),
+            lambda content, dto=dto_class, model=model_class: [
+                model.from_dto(entry) for entry in dto.model_validate_json(content).data
+            ],
+            lambda content, envelope=envelope_class: envelope.model_validate_json(content).data,
+        )
+
+    _report(
+        'flight tracks (5,000 points)',
+        _scaled_tracks(5000),
+        lambda content: [
+            FlightTrack.from_dto(track)
+            for track in _list_adapter(GetFlightTracksResponseDto).validate_json(content)[0].tracks
+        ],
+        lambda content: _list_adapter(FlightTrackResponse).validate_json(content)[0].tracks,
+    )
+
+
+if __name__ == '__main__':
+    main()
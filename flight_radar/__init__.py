@@ -1,7 +1,9 @@
-from .factory import get_flight_radar_client
-from .services import FlightRadarClient
+from .factory import get_async_flight_radar_client, get_flight_radar_client
+from .services import AsyncFlightRadarClient, FlightRadarClient
 
 __all__ = [
     'get_flight_radar_client',
+    'get_async_flight_radar_client',
     'FlightRadarClient',
+    'AsyncFlightRadarClient',
 ]
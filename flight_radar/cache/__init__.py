@@ -0,0 +1,15 @@
+from .backend import CacheBackend, CacheEntry
+from .memory import MemoryCache
+from .shared import SharedSQLiteCache
+from .sqlite import SQLiteCache
+from .stats import CacheStats, CacheStatsRecorder
+
+__all__ = [
+    'CacheBackend',
+    'CacheEntry',
+    'CacheStats',
+    'CacheStatsRecorder',
+    'MemoryCache',
+    'SQLiteCache',
+    'SharedSQLiteCache',
+]
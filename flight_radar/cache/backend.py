@@ -0,0 +1,68 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator
+
+from pydantic import BaseModel, Field
+
+
+class CacheEntry(BaseModel):
+    value: Any = Field(description='Cached value. Backends that persist entries only accept bytes.')
+    stored_at: float = Field(description='Wall-clock time the value was stored at, in epoch seconds.')
+    expires_at: float | None = Field(
+        description='Wall-clock time the value stops being fresh at, in epoch seconds. None never expires.',
+        default=None,
+    )
+    negative: bool = Field(
+        description='Whether the entry records that the looked up value does not exist, rather than the value itself.',
+        default=False,
+    )
+    etag: str | None = Field(description='``ETag`` of the HTTP response the value was taken from.', default=None)
+    last_modified: str | None = Field(
+        description='``Last-Modified`` of the HTTP response the value was taken from.', default=None
+    )
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return self.expires_at is None or (time.time() if now is None else now) < self.expires_at
+
+
+class CacheBackend(ABC):
+    """
+    Key-value storage of cache entries.
+
+    Backends return entries whether or not they are still fresh; deciding what to do with an expired entry is
+    up to the caller. Implementations must be safe to use from several threads at once.
+    """
+
+    _eviction_listeners: tuple[Callable[[str, int], None], ...] = ()
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def entries(self) -> Iterator[tuple[str, int, float]]:
+        """Key, size in bytes and ``stored_at`` of every stored entry. Backends that cannot list them yield none."""
+        return iter(())
+
+    def add_eviction_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Call ``listener`` with the key and size in bytes of every entry a bounded backend evicts to make room."""
+        self._eviction_listeners = (*self._eviction_listeners, listener)
+
+    def _evicted(self, evicted: list[tuple[str, int]]) -> None:
+        for listener in self._eviction_listeners:
+            for key, size in evicted:
+                listener(key, size)
+
+    def close(self) -> None:
+        """Release the resources held by the backend, such as open files."""
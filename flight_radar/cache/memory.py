@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
+from flight_radar.cache.backend import CacheBackend, CacheEntry
+
+
+def _size(entry: CacheEntry) -> int:
+    return len(entry.value) if isinstance(entry.value, bytes) else 0
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache. Values are kept as they are, so decoded models are returned without any copying."""
+
+    def __init__(self, max_entries: int = 10000):
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        evicted = []
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, evicted_entry = self._entries.popitem(last=False)
+                evicted.append((evicted_key, _size(evicted_entry)))
+
+        self._evicted(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def entries(self) -> Iterator[tuple[str, int, float]]:
+        with self._lock:
+            entries = list(self._entries.items())
+
+        for key, entry in entries:
+            yield key, _size(entry), entry.stored_at
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+from flight_radar.cache.sqlite import SQLiteCache
+
+
+class SharedSQLiteCache(SQLiteCache):
+    """
+    ``SQLiteCache`` shared by every process on a host that opens the same file, such as the workers of a server.
+
+    The database runs in WAL mode, so readers never block each other or the writer, and statements run on a pool
+    of connections instead of queueing for a single one. Writers from different processes wait for each other for
+    up to ``busy_timeout`` seconds. Connections are reopened after a fork, so a cache created before the workers
+    are forked is safe to use in all of them.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.time,
+        busy_timeout: float = 5.0,
+        mmap_size: int = 256 * 1024**2,
+        touch_interval: float = 60.0,
+    ):
+        """
+        Args:
+            path: Database file, created when missing
+            max_bytes: Upper bound of the total size of the stored values. None stores without bound.
+            clock: Wall clock used to order entries by their last use
+            busy_timeout: Seconds a write waits for the writers of other processes before failing
+            mmap_size: Bytes of the database that are read through a memory map instead of read calls
+            touch_interval: Seconds a read waits before recording the use of an entry again. Recording a use is a
+                write, so a coarser interval keeps reads of a bounded cache from contending across processes.
+        """
+        if str(path) == ':memory:':
+            raise ValueError('An in-memory database cannot be shared between processes')
+
+        self.busy_timeout = busy_timeout
+        self.mmap_size = mmap_size
+        super().__init__(path, max_bytes, clock)
+        self.touch_interval = touch_interval
+
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        self._idle: list[sqlite3.Connection] = []
+        self._connections: list[sqlite3.Connection] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        # A crash may lose the last commits but never corrupts the database, which is fine for a cache
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+        return connection
+
+    @contextmanager
+    def _use(self) -> Iterator[sqlite3.Connection]:
+        if self._pid != os.getpid():
+            # Connections must not cross a fork, the ones inherited from the parent are left untouched
+            self._lock = threading.Lock()
+            self._open()
+
+        # The lock only guards the pool, statements run without it
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            connection = self._connect()
+            with self._lock:
+                self._connections.append(connection)
+
+        try:
+            yield connection
+        finally:
+            with self._lock:
+                self._idle.append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            connections = self._connections
+            self._idle, self._connections = [], []
+
+        for connection in connections:
+            connection.close()
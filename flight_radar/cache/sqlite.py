@@ -0,0 +1,160 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+from flight_radar.cache.backend import CacheBackend, CacheEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    metadata TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    accessed_at REAL NOT NULL DEFAULT 0
+)
+"""
+_INDEX = 'CREATE INDEX IF NOT EXISTS cache_entries_accessed_at ON cache_entries (accessed_at)'
+# Columns added after the first version of the table, with their definitions
+_ADDED_COLUMNS = {
+    'size': 'INTEGER NOT NULL DEFAULT 0',
+    'accessed_at': 'REAL NOT NULL DEFAULT 0',
+}
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache persisted in a SQLite database, so entries survive process restarts.
+
+    Values must be bytes. The other fields of an entry are stored as JSON next to them. With ``max_bytes``, the
+    least recently used entries are evicted once the values stored exceed it.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int | None = None, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: Database file, created when missing. ``:memory:`` keeps the database in memory.
+            max_bytes: Upper bound of the total size of the stored values. None stores without bound.
+            clock: Wall clock used to order entries by their last use
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be positive')
+
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Seconds that must pass before a read records the use of an entry again
+        self.touch_interval = 0.0
+        self._lock = threading.Lock()
+        self._open()
+        self._create_schema()
+
+    def _open(self) -> None:
+        self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+
+    @contextmanager
+    def _use(self) -> Iterator[sqlite3.Connection]:
+        """Connection to run statements on. The single connection is shared by all threads, one at a time."""
+        with self._lock:
+            yield self._connection
+
+    def _create_schema(self) -> None:
+        with self._use() as connection:
+            connection.execute(_SCHEMA)
+            columns = {row[1] for row in connection.execute('PRAGMA table_info(cache_entries)')}
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in columns:
+                    connection.execute(f'ALTER TABLE cache_entries ADD COLUMN {name} {definition}')
+            connection.execute(_INDEX)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._use() as connection:
+            row = connection.execute(
+                'SELECT value, metadata, accessed_at FROM cache_entries WHERE key = ?', (key,)
+            ).fetchone()
+            # Only a bounded cache needs to know which entries were used last
+            if row is not None and self.max_bytes is not None:
+                now = self._clock()
+                if now - row[2] >= self.touch_interval:
+                    connection.execute('UPDATE cache_entries SET accessed_at = ? WHERE key = ?', (now, key))
+
+        if row is None:
+            return None
+
+        value, metadata, _ = row
+        return CacheEntry(value=bytes(value), **json.loads(metadata))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if not isinstance(entry.value, bytes):
+            raise TypeError(f'SQLiteCache only stores bytes, got {type(entry.value).__name__}')
+
+        metadata = entry.model_dump_json(exclude={'value'})
+        evicted = []
+        with self._use() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'INSERT OR REPLACE INTO cache_entries (key, value, metadata, size, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, entry.value, metadata, len(entry.value), self._clock()),
+                )
+                if self.max_bytes is not None:
+                    evicted = self._evict(connection, self.max_bytes)
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+
+        self._evicted(evicted)
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, max_bytes: int) -> list[tuple[str, int]]:
+        """Delete the least recently used entries until the stored values fit ``max_bytes``, returning them."""
+        (total,) = connection.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entries').fetchone()
+        if total <= max_bytes:
+            return []
+
+        evicted = []
+        for key, size in connection.execute('SELECT key, size FROM cache_entries ORDER BY accessed_at'):
+            if total <= max_bytes:
+                break
+            evicted.append((key, size))
+            total -= size
+
+        connection.executemany('DELETE FROM cache_entries WHERE key = ?', [(key,) for key, _ in evicted])
+        return evicted
+
+    def size(self) -> int:
+        """Total size of the stored values in bytes."""
+        with self._use() as connection:
+            (total,) = connection.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entries').fetchone()
+
+        return total
+
+    def entries(self) -> Iterator[tuple[str, int, float]]:
+        with self._use() as connection:
+            rows = connection.execute('SELECT key, size, metadata FROM cache_entries').fetchall()
+
+        for key, size, metadata in rows:
+            yield key, size, json.loads(metadata)['stored_at']
+
+    def delete(self, key: str) -> None:
+        with self._use() as connection:
+            connection.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        with self._use() as connection:
+            connection.execute('DELETE FROM cache_entries')
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,102 @@
+import threading
+from typing import Iterable
+
+from pydantic import BaseModel, Field
+
+from flight_radar.metrics import MetricsSink, NullMetricsSink
+
+# Counters a cache may record, as opposed to the usage fields measured from its stored entries
+COUNTERS = ('hits', 'misses', 'negative_hits', 'stale_hits', 'revalidations', 'evictions', 'bypassed')
+
+
+class CacheStats(BaseModel):
+    hits: int = Field(description='Lookups answered with a fresh cached value.', default=0)
+    misses: int = Field(description='Lookups that had to go to the API, revalidations included.', default=0)
+    negative_hits: int = Field(description='Lookups answered with a cached ``NotFoundError``.', default=0)
+    stale_hits: int = Field(
+        description='Lookups answered with a stale value, while it was refreshed or because the API failed.',
+        default=0,
+    )
+    revalidations: int = Field(description='Requests the API answered with ``304 Not Modified``.', default=0)
+    evictions: int = Field(description='Entries evicted to make room for new ones.', default=0)
+    bypassed: int = Field(description='Requests sent to the API because the cache could not answer them.', default=0)
+    entries: int = Field(description='Entries currently stored, whether fresh or not.', default=0)
+    bytes_stored: int = Field(
+        description='Size of the stored values in bytes. Values kept in memory as decoded models are not counted.',
+        default=0,
+    )
+    mean_entry_age: float | None = Field(
+        description='Mean number of seconds since the stored entries were fetched. None when nothing is stored.',
+        default=None,
+    )
+
+
+class CacheStatsRecorder:
+    """
+    Per-endpoint statistics of a cache.
+
+    Counters are kept in memory and forwarded to a ``MetricsSink`` as ``cache.<counter>`` as they are recorded.
+    The usage of the stored entries is only measured by ``snapshot``, which reports it to the sink as
+    ``cache.entries``, ``cache.bytes_stored`` and ``cache.mean_entry_age`` gauges. Series are tagged with the name
+    of the cache and the endpoint.
+    """
+
+    def __init__(self, cache: str, metrics: MetricsSink | None = None):
+        """
+        Args:
+            cache: Name of the cache, sent as the ``cache`` tag
+            metrics: Sink the statistics are reported to
+        """
+        self.cache = cache
+        self.metrics = metrics or NullMetricsSink()
+        self._lock = threading.Lock()
+        self._stats: dict[str, CacheStats] = {}
+
+    def _tags(self, endpoint: str) -> dict[str, str]:
+        return {'cache': self.cache, 'endpoint': endpoint}
+
+    def record(self, endpoint: str, counter: str, value: int = 1) -> None:
+        """Add ``value`` to one of the ``COUNTERS`` of ``endpoint``."""
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, CacheStats())
+            setattr(stats, counter, getattr(stats, counter) + value)
+
+        self.metrics.increment(f'cache.{counter}', value, self._tags(endpoint))
+
+    def counters(self) -> dict[str, CacheStats]:
+        """Counters of every endpoint that recorded one, without measuring the stored entries."""
+        with self._lock:
+            return {endpoint: stats.model_copy() for endpoint, stats in self._stats.items()}
+
+    def snapshot(self, entries: Iterable[tuple[str, int, float]], now: float) -> dict[str, CacheStats]:
+        """
+        Statistics of every endpoint that recorded a counter or has entries stored.
+
+        Args:
+            entries: Endpoint, size in bytes and ``stored_at`` of every stored entry
+            now: Wall clock in epoch seconds, the entry ages are measured against it
+
+        Returns:
+            dict[str, CacheStats]: Statistics keyed by endpoint
+        """
+        usage: dict[str, tuple[int, int, float]] = {}
+        for endpoint, size, stored_at in entries:
+            count, total, age = usage.get(endpoint, (0, 0, 0.0))
+            usage[endpoint] = (count + 1, total + size, age + max(now - stored_at, 0.0))
+
+        counters = self.counters()
+        snapshot = {}
+        for endpoint in sorted(counters.keys() | usage.keys()):
+            count, total, age = usage.get(endpoint, (0, 0, 0.0))
+            stats = counters.get(endpoint) or CacheStats()
+            stats.entries, stats.bytes_stored = count, total
+            stats.mean_entry_age = age / count if count else None
+            snapshot[endpoint] = stats
+
+            tags = self._tags(endpoint)
+            self.metrics.gauge('cache.entries', count, tags)
+            self.metrics.gauge('cache.bytes_stored', total, tags)
+            if count:
+                self.metrics.gauge('cache.mean_entry_age', stats.mean_entry_age, tags)
+
+        return snapshot
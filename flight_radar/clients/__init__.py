@@ -1,3 +1,30 @@
 from .api_client import FlightRadarApiClient
+from .async_api_client import AsyncFlightRadarApiClient
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .deadline import TimeoutConfig, deadline, remaining_time
+from .hedging import Hedger, HedgingConfig
+from .http_cache import CachePolicy, ResponseCache
+from .pool import PoolConfig
+from .rate_limiter import RateLimiter, RetryPolicy, TokenBucket
+from .single_flight import AsyncSingleFlight, SingleFlight, SingleFlightStats
 
-__all__ = ['FlightRadarApiClient']
+__all__ = [
+    'FlightRadarApiClient',
+    'AsyncFlightRadarApiClient',
+    'PoolConfig',
+    'RateLimiter',
+    'RetryPolicy',
+    'TokenBucket',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'SingleFlightStats',
+    'CircuitBreaker',
+    'CircuitBreakerConfig',
+    'Hedger',
+    'HedgingConfig',
+    'CachePolicy',
+    'ResponseCache',
+    'TimeoutConfig',
+    'deadline',
+    'remaining_time',
+]
@@ -1,61 +1,245 @@
-from typing import NoReturn, Type, TypeVar
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import count
+from typing import Iterator, Type, TypeVar
 
 import requests
-from pydantic import ValidationError
-
-from flight_radar.enums.enums import HTTPStatus
-from flight_radar.errors import (
-    BadRequestError,
-    InsufficientCredits,
-    InternalServerError,
-    InvalidResponseError,
-    NotFoundError,
-    TooManyRequestsError,
-    UnauthorizedError,
-)
+from urllib3.exceptions import ClosedPoolError, EmptyPoolError, HTTPError
+
+from flight_radar.clients.base import BaseFlightRadarApiClient
+from flight_radar.clients.circuit_breaker import CircuitBreakerConfig
+from flight_radar.clients.deadline import TimeoutConfig
+from flight_radar.clients.endpoints import canonical_request_key, get_endpoint_family
+from flight_radar.clients.hedging import Hedger, HedgingConfig
+from flight_radar.clients.http_cache import ResponseCache
+from flight_radar.clients.pool import PoolConfig
+from flight_radar.clients.rate_limiter import RateLimiter, RetryPolicy
+from flight_radar.clients.single_flight import SingleFlight
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.errors import DeadlineExceededError
+from flight_radar.metrics import MetricsSink
 
 T = TypeVar('T')
 
 
-class FlightRadarApiClient:
-    def __init__(self, session: requests.Session, base_url: str = None, api_key: str = None):
-        session.headers.update({'Authorization': f'Bearer {api_key}', 'Accept-Version': 'v1'})
-        self.base_url = base_url
+class FlightRadarApiClient(BaseFlightRadarApiClient):
+    transport_errors = (requests.RequestException,)
+
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str = None,
+        api_key: str = None,
+        pool_config: PoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        fast_decode: bool = False,
+        coalesce_requests: bool = False,
+        hedging: dict[EndpointFamily, HedgingConfig] | None = None,
+        circuit_breakers: dict[EndpointFamily, CircuitBreakerConfig] | None = None,
+        metrics: MetricsSink | None = None,
+        max_hedge_workers: int = 32,
+        timeout: TimeoutConfig | None = None,
+        family_timeouts: dict[EndpointFamily, TimeoutConfig] | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        session.headers.update(self._default_headers(api_key))
+        if pool_config is not None:
+            adapter = pool_config.to_adapter()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if not pool_config.keep_alive:
+                session.headers['Connection'] = 'close'
+
+        super().__init__(
+            base_url,
+            rate_limiter,
+            retry_policy,
+            fast_decode,
+            hedging,
+            circuit_breakers,
+            metrics,
+            timeout,
+            family_timeouts,
+            response_cache,
+        )
         self.session = session
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=max_hedge_workers, thread_name_prefix='flight-radar-hedge')
+            if hedging
+            else None
+        )
+        self._refresh_executor = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix='flight-radar-refresh') if response_cache else None
+        )
 
-    def _handle_non_success_case(self, response: requests.Response) -> NoReturn:
-        match response.status_code:
-            case HTTPStatus.BAD_REQUEST.value:
-                raise BadRequestError(response.json())
-            case HTTPStatus.UNAUTHORIZED.value:
-                raise UnauthorizedError(response.json())
-            case HTTPStatus.PAYMENT_REQUIRED.value:
-                raise InsufficientCredits(response.json())
-            case HTTPStatus.NOT_FOUND.value:
-                raise NotFoundError(response.json())
-            case HTTPStatus.TOO_MANY_REQUESTS.value:
-                raise TooManyRequestsError(response.json())
-            case HTTPStatus.INTERNAL_SERVER_ERROR.value | _:
-                raise InternalServerError(response.json())
+    def __enter__(self) -> 'FlightRadarApiClient':
+        return self
 
-    def get(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
-        with self.session.get(f'{self.base_url}{url}', params=params) as response:
-            if response.status_code != 200:
-                self._handle_non_success_case(response)
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-            try:
-                dto = response_dto_class.model_validate(response.json())
-                return dto
-            except ValidationError as e:
-                raise InvalidResponseError(e)
+    def close(self) -> None:
+        """Stop the hedging and refresh threads, close the underlying HTTP connection pool and the response cache."""
+        for executor in (self._hedge_executor, self._refresh_executor):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
 
-    def get_many(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
-        with self.session.get(f'{self.base_url}{url}', params=params) as response:
-            if response.status_code != 200:
-                self._handle_non_success_case(response)
+    def prewarm(self, connections: int) -> int:
+        """
+        Open connections to the API host ahead of time, so the first burst of calls skips the TCP and TLS handshakes.
+
+        Args:
+            connections: Number of connections to open. Capped by the pool size of the mounted adapter.
 
+        Returns:
+            int: Number of connections that were opened and returned to the pool
+        """
+        request = requests.Request('GET', self.base_url).prepare()
+        adapter = self.session.get_adapter(request.url)
+        pool = adapter.get_connection_with_tls_context(request, verify=self.session.verify, cert=self.session.cert)
+
+        # urllib3 does not offer a public way to open idle connections, so borrow them from the pool directly
+        borrowed = []
+        try:
+            for _ in range(min(connections, adapter._pool_maxsize)):
+                connection = pool._get_conn()
+                try:
+                    connection.connect()
+                except (OSError, HTTPError):
+                    # Hand the slot back empty, the pool opens a new connection when a request needs it
+                    connection.close()
+                    pool._put_conn(None)
+                    break
+                borrowed.append(connection)
+        except (ClosedPoolError, EmptyPoolError):
+            pass
+        finally:
+            for connection in borrowed:
+                pool._put_conn(connection)
+
+        return len(borrowed)
+
+    @contextmanager
+    def _send(self, url: str, params: dict = None, headers: dict | None = None) -> Iterator[requests.Response]:
+        family = get_endpoint_family(url)
+        extra = {'headers': headers} if headers else {}
+        for attempt in count():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(family)
+
+            connect_timeout, read_timeout, bounded = self._timeouts(family)
             try:
-                dtos = [response_dto_class.model_validate(entry) for entry in response.json()]
-                return dtos
-            except ValidationError as e:
-                raise InvalidResponseError(e)
+                sent = self.session.get(
+                    f'{self.base_url}{url}', params=params, timeout=(connect_timeout, read_timeout), **extra
+                )
+            except requests.Timeout as e:
+                if bounded:
+                    raise DeadlineExceededError(f'Deadline exceeded while waiting for {url}') from e
+                raise
+
+            with sent as response:
+                self._observe(family, response)
+                delay = self._retry_delay(attempt, response)
+                if delay is None:
+                    yield response
+                    return
+
+            time.sleep(delay)
+
+    def _fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        key, entry = self._cache_lookup(url, params)
+        with self._send(url, params, ResponseCache.validators(entry)) as response:
+            return self._result(url, key, entry, response, response_dto_class, many)
+
+    def _hedged_fetch(
+        self, hedger: Hedger, url: str, response_dto_class: Type[T], params: dict | None, many: bool
+    ) -> T:
+        started = time.monotonic()
+        # Worker threads do not inherit context variables, so the deadline of the caller is passed on explicitly
+        primary = self._hedge_executor.submit(
+            contextvars.copy_context().run, self._fetch, url, response_dto_class, params, many
+        )
+        if not wait([primary], timeout=hedger.delay()).done:
+            hedger.record_hedge()
+            hedge = self._hedge_executor.submit(
+                contextvars.copy_context().run, self._fetch, url, response_dto_class, params, many
+            )
+            pending = {primary, hedge}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # The slower request keeps running in the background, its response is discarded
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            hedger.record_hedge_won()
+                        hedger.record_latency(time.monotonic() - started)
+                        return future.result()
+
+        result = primary.result()
+        hedger.record_latency(time.monotonic() - started)
+        return result
+
+    def _guarded_fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        family = get_endpoint_family(url)
+        breaker = self._before_call(family)
+        hedger = self.hedgers.get(family)
+        try:
+            if hedger is None:
+                result = self._fetch(url, response_dto_class, params, many)
+            else:
+                result = self._hedged_fetch(hedger, url, response_dto_class, params, many)
+        except Exception as e:
+            self._after_call(breaker, e)
+            raise
+
+        self._after_call(breaker)
+        return result
+
+    def _coalesced_fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        if self.single_flight is None:
+            return self._guarded_fetch(url, response_dto_class, params, many)
+
+        key = (canonical_request_key(url, params), response_dto_class, many)
+        return self.single_flight.do(key, lambda: self._guarded_fetch(url, response_dto_class, params, many))
+
+    def _refresh(self, key: str, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> None:
+        try:
+            self._coalesced_fetch(url, response_dto_class, params, many)
+        except Exception:
+            # The stale entry keeps being served until its window runs out, the next call retries the refresh
+            pass
+        finally:
+            self.response_cache.end_refresh(key)
+
+    def _call(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        key, entry = self._cache_lookup(url, params)
+        if entry is not None:
+            if self.response_cache.is_fresh(entry):
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'hits')
+            if self.response_cache.serves_while_revalidating(url, entry):
+                # Submitted without the context of the caller, so the refresh is not bound by its deadline
+                if self.response_cache.start_refresh(key):
+                    self._refresh_executor.submit(self._refresh, key, url, response_dto_class, params, many)
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'stale_hits')
+
+        if key is not None:
+            self.response_cache.record(url, 'misses')
+        try:
+            return self._coalesced_fetch(url, response_dto_class, params, many)
+        except Exception as e:
+            if entry is not None and self.may_serve_stale(e) and self.response_cache.serves_on_error(url, entry):
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'stale_hits')
+            raise
+
+    def get(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
+        return self._call(url, response_dto_class, params, many=False)
+
+    def get_many(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
+        return self._call(url, response_dto_class, params, many=True)
@@ -0,0 +1,201 @@
+import asyncio
+import contextvars
+import time
+from itertools import count
+from typing import Type, TypeVar
+
+import httpx
+
+from flight_radar.clients.base import BaseFlightRadarApiClient
+from flight_radar.clients.circuit_breaker import CircuitBreakerConfig
+from flight_radar.clients.deadline import TimeoutConfig, remaining_time
+from flight_radar.clients.endpoints import canonical_request_key, get_endpoint_family
+from flight_radar.clients.hedging import Hedger, HedgingConfig
+from flight_radar.clients.http_cache import ResponseCache
+from flight_radar.clients.rate_limiter import RateLimiter, RetryPolicy
+from flight_radar.clients.single_flight import AsyncSingleFlight
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.errors import DeadlineExceededError
+from flight_radar.metrics import MetricsSink
+
+T = TypeVar('T')
+
+
+class AsyncFlightRadarApiClient(BaseFlightRadarApiClient):
+    """
+    Asyncio counterpart of ``FlightRadarApiClient``.
+
+    All requests share the connection pool of the given ``httpx.AsyncClient``, so a single event loop
+    can keep many requests in flight at once.
+    """
+
+    transport_errors = (httpx.TransportError,)
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str = None,
+        api_key: str = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        fast_decode: bool = False,
+        coalesce_requests: bool = False,
+        hedging: dict[EndpointFamily, HedgingConfig] | None = None,
+        circuit_breakers: dict[EndpointFamily, CircuitBreakerConfig] | None = None,
+        metrics: MetricsSink | None = None,
+        timeout: TimeoutConfig | None = None,
+        family_timeouts: dict[EndpointFamily, TimeoutConfig] | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        client.headers.update(self._default_headers(api_key))
+        super().__init__(
+            base_url,
+            rate_limiter,
+            retry_policy,
+            fast_decode,
+            hedging,
+            circuit_breakers,
+            metrics,
+            timeout,
+            family_timeouts,
+            response_cache,
+        )
+        self.client = client
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self._refresh_tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _clean_params(params: dict | None) -> dict | None:
+        # requests silently drops None values, httpx would send them as empty strings
+        if params is None:
+            return None
+
+        return {key: value for key, value in params.items() if value is not None}
+
+    async def _send(self, url: str, params: dict = None, headers: dict | None = None) -> httpx.Response:
+        family = get_endpoint_family(url)
+        for attempt in count():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(family)
+
+            connect_timeout, read_timeout, bounded = self._timeouts(family)
+            timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout)
+            try:
+                # Unlike the socket timeouts, this also bounds the total time spent on the response
+                async with asyncio.timeout(remaining_time() if bounded else None):
+                    response = await self.client.get(
+                        f'{self.base_url}{url}', params=self._clean_params(params), headers=headers, timeout=timeout
+                    )
+            except (TimeoutError, httpx.TimeoutException) as e:
+                if bounded:
+                    raise DeadlineExceededError(f'Deadline exceeded while waiting for {url}') from e
+                raise
+
+            self._observe(family, response)
+            delay = self._retry_delay(attempt, response)
+            if delay is None:
+                return response
+
+            await asyncio.sleep(delay)
+
+    async def _fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        key, entry = self._cache_lookup(url, params)
+        response = await self._send(url, params, ResponseCache.validators(entry))
+        return self._result(url, key, entry, response, response_dto_class, many)
+
+    async def _hedged_fetch(
+        self, hedger: Hedger, url: str, response_dto_class: Type[T], params: dict | None, many: bool
+    ) -> T:
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._fetch(url, response_dto_class, params, many))
+        done, _ = await asyncio.wait([primary], timeout=hedger.delay())
+        if not done:
+            hedger.record_hedge()
+            hedge = asyncio.ensure_future(self._fetch(url, response_dto_class, params, many))
+            pending = {primary, hedge}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            if task is hedge:
+                                hedger.record_hedge_won()
+                            hedger.record_latency(time.monotonic() - started)
+                            return task.result()
+            finally:
+                # Unlike threads, the slower request can be abandoned mid-flight
+                for task in pending:
+                    task.cancel()
+
+        result = await primary
+        hedger.record_latency(time.monotonic() - started)
+        return result
+
+    async def _guarded_fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        family = get_endpoint_family(url)
+        breaker = self._before_call(family)
+        hedger = self.hedgers.get(family)
+        try:
+            if hedger is None:
+                result = await self._fetch(url, response_dto_class, params, many)
+            else:
+                result = await self._hedged_fetch(hedger, url, response_dto_class, params, many)
+        except Exception as e:
+            self._after_call(breaker, e)
+            raise
+
+        self._after_call(breaker)
+        return result
+
+    async def _coalesced_fetch(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        if self.single_flight is None:
+            return await self._guarded_fetch(url, response_dto_class, params, many)
+
+        key = (canonical_request_key(url, params), response_dto_class, many)
+        return await self.single_flight.do(key, lambda: self._guarded_fetch(url, response_dto_class, params, many))
+
+    async def _refresh(self, key: str, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> None:
+        try:
+            await self._coalesced_fetch(url, response_dto_class, params, many)
+        except Exception:
+            # The stale entry keeps being served until its window runs out, the next call retries the refresh
+            pass
+        finally:
+            self.response_cache.end_refresh(key)
+
+    async def _call(self, url: str, response_dto_class: Type[T], params: dict | None, many: bool) -> T:
+        key, entry = self._cache_lookup(url, params)
+        if entry is not None:
+            if self.response_cache.is_fresh(entry):
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'hits')
+            if self.response_cache.serves_while_revalidating(url, entry):
+                if self.response_cache.start_refresh(key):
+                    # A fresh context keeps the refresh from being bound by the deadline of the caller
+                    task = asyncio.get_running_loop().create_task(
+                        self._refresh(key, url, response_dto_class, params, many), context=contextvars.Context()
+                    )
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'stale_hits')
+
+        if key is not None:
+            self.response_cache.record(url, 'misses')
+        try:
+            return await self._coalesced_fetch(url, response_dto_class, params, many)
+        except Exception as e:
+            if entry is not None and self.may_serve_stale(e) and self.response_cache.serves_on_error(url, entry):
+                return self._serve_cached(url, key, entry, response_dto_class, many, 'stale_hits')
+            raise
+
+    async def get(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
+        return await self._call(url, response_dto_class, params, many=False)
+
+    async def get_many(self, url: str, response_dto_class: Type[T], params: dict = None) -> T:
+        return await self._call(url, response_dto_class, params, many=True)
+
+    async def aclose(self) -> None:
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        await self.client.aclose()
+        if self.response_cache is not None:
+            self.response_cache.close()
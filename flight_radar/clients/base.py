@@ -0,0 +1,234 @@
+from functools import lru_cache
+from typing import Any, NoReturn, Type, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from flight_radar.cache import CacheEntry
+from flight_radar.clients.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from flight_radar.clients.deadline import TimeoutConfig, remaining_time
+from flight_radar.clients.hedging import Hedger, HedgingConfig
+from flight_radar.clients.http_cache import ResponseCache
+from flight_radar.clients.rate_limiter import RateLimiter, RetryPolicy, parse_retry_after
+from flight_radar.enums.enums import EndpointFamily, HTTPStatus
+from flight_radar.errors import (
+    BadRequestError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    InsufficientCredits,
+    InternalServerError,
+    InvalidResponseError,
+    NotFoundError,
+    TooManyRequestsError,
+    UnauthorizedError,
+)
+from flight_radar.metrics import MetricsSink, NullMetricsSink
+
+T = TypeVar('T')
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(response_dto_class: type) -> TypeAdapter:
+    return TypeAdapter(list[response_dto_class])
+
+
+class BaseFlightRadarApiClient:
+    """Transport-agnostic behaviour shared by the sync and async API clients."""
+
+    # Errors raised by the transport when the upstream could not be reached at all
+    transport_errors: tuple[type[Exception], ...] = ()
+
+    def __init__(
+        self,
+        base_url: str = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        fast_decode: bool = False,
+        hedging: dict[EndpointFamily, HedgingConfig] | None = None,
+        circuit_breakers: dict[EndpointFamily, CircuitBreakerConfig] | None = None,
+        metrics: MetricsSink | None = None,
+        timeout: TimeoutConfig | None = None,
+        family_timeouts: dict[EndpointFamily, TimeoutConfig] | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.fast_decode = fast_decode
+        self.metrics = metrics or NullMetricsSink()
+        self.hedgers = {family: Hedger(family, config, self.metrics) for family, config in (hedging or {}).items()}
+        self.circuit_breakers = {
+            family: CircuitBreaker(family, config, self.metrics) for family, config in (circuit_breakers or {}).items()
+        }
+        self.timeout = timeout or TimeoutConfig()
+        self.family_timeouts = family_timeouts or {}
+        self.response_cache = response_cache
+
+    @staticmethod
+    def _default_headers(api_key: str) -> dict:
+        return {'Authorization': f'Bearer {api_key}', 'Accept-Version': 'v1'}
+
+    def _observe(self, family: EndpointFamily | None, response: Any) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(family, response.status_code, response.headers)
+
+    def _retry_delay(self, attempt: int, response: Any) -> float | None:
+        """Seconds to wait before retrying a rate limited response, or None when it must not be retried."""
+        if response.status_code != HTTPStatus.TOO_MANY_REQUESTS.value or self.retry_policy is None:
+            return None
+        if attempt >= self.retry_policy.max_retries:
+            return None
+
+        delay = self.retry_policy.delay(attempt, parse_retry_after(response.headers))
+        remaining = remaining_time()
+        # A retry that cannot even start before the deadline would only delay the inevitable error
+        if remaining is not None and delay >= remaining:
+            return None
+
+        return delay
+
+    def _timeouts(self, family: EndpointFamily | None) -> tuple[float, float, bool]:
+        """
+        Connect and read timeouts of the next attempt, shortened to what is left of the current deadline.
+
+        Returns:
+            tuple[float, float, bool]: Connect timeout, read timeout and whether the deadline shortened them
+        """
+        timeout = self.family_timeouts.get(family, self.timeout)
+        remaining = remaining_time()
+        if remaining is None or remaining >= max(timeout.connect, timeout.read):
+            return timeout.connect, timeout.read, False
+        if remaining <= 0:
+            raise DeadlineExceededError('Deadline exceeded before the request could be sent')
+
+        return min(timeout.connect, remaining), min(timeout.read, remaining), True
+
+    def _is_upstream_failure(self, error: Exception) -> bool:
+        """Whether an error means the upstream is unhealthy, as opposed to a problem with the request itself."""
+        return isinstance(error, (InternalServerError, *self.transport_errors))
+
+    def may_serve_stale(self, error: Exception) -> bool:
+        """Whether an error is an upstream incident that a stale cached response may stand in for."""
+        return isinstance(error, (TooManyRequestsError, CircuitOpenError, DeadlineExceededError)) or (
+            self._is_upstream_failure(error)
+        )
+
+    def _before_call(self, family: EndpointFamily | None) -> CircuitBreaker | None:
+        breaker = self.circuit_breakers.get(family)
+        if breaker is not None:
+            breaker.before_call()
+
+        return breaker
+
+    def _after_call(self, breaker: CircuitBreaker | None, error: Exception | None = None) -> None:
+        if breaker is None:
+            return
+
+        if isinstance(error, DeadlineExceededError):
+            # The time budget of the caller ran out, which says nothing about the health of the upstream
+            breaker.record_abandoned()
+        elif error is not None and self._is_upstream_failure(error):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def _handle_non_success_case(self, response: Any) -> NoReturn:
+        match response.status_code:
+            case HTTPStatus.BAD_REQUEST.value:
+                raise BadRequestError(response.json())
+            case HTTPStatus.UNAUTHORIZED.value:
+                raise UnauthorizedError(response.json())
+            case HTTPStatus.PAYMENT_REQUIRED.value:
+                raise InsufficientCredits(response.json())
+            case HTTPStatus.NOT_FOUND.value:
+                raise NotFoundError(response.json())
+            case HTTPStatus.TOO_MANY_REQUESTS.value:
+                raise TooManyRequestsError(response.json())
+            case HTTPStatus.INTERNAL_SERVER_ERROR.value | _:
+                raise InternalServerError(response.json())
+
+    @staticmethod
+    def _parse(payload: Any, response_dto_class: Type[T]) -> T:
+        try:
+            return response_dto_class.model_validate(payload)
+        except ValidationError as e:
+            raise InvalidResponseError(e)
+
+    @staticmethod
+    def _parse_many(payload: Any, response_dto_class: Type[T]) -> list[T]:
+        try:
+            return [response_dto_class.model_validate(entry) for entry in payload]
+        except ValidationError as e:
+            raise InvalidResponseError(e)
+
+    def _decode(self, response: Any, response_dto_class: Type[T]) -> T:
+        if not self.fast_decode:
+            return self._parse(response.json(), response_dto_class)
+
+        # Validate the raw bytes in pydantic-core instead of building an intermediate dict tree first
+        try:
+            return response_dto_class.model_validate_json(response.content)
+        except ValidationError as e:
+            raise InvalidResponseError(e)
+
+    def _decode_content(self, content: bytes, response_dto_class: Type[T], many: bool) -> T:
+        try:
+            if many:
+                return _list_adapter(response_dto_class).validate_json(content)
+            return response_dto_class.model_validate_json(content)
+        except ValidationError as e:
+            raise InvalidResponseError(e)
+
+    def _cache_lookup(self, url: str, params: dict | None) -> tuple[str | None, CacheEntry | None]:
+        if self.response_cache is None:
+            return None, None
+
+        return self.response_cache.lookup(url, params)
+
+    def _serve_cached(
+        self, url: str, key: str, entry: CacheEntry, response_dto_class: Type[T], many: bool, counter: str
+    ) -> T:
+        self.response_cache.record(url, counter)
+        return self._cached_result(key, entry, response_dto_class, many)
+
+    def _cached_result(self, key: str, entry: CacheEntry, response_dto_class: Type[T], many: bool) -> T:
+        return self.response_cache.decoded(
+            key,
+            entry,
+            response_dto_class,
+            many,
+            lambda content: self._decode_content(content, response_dto_class, many),
+        )
+
+    def _result(
+        self,
+        url: str,
+        key: str | None,
+        entry: CacheEntry | None,
+        response: Any,
+        response_dto_class: Type[T],
+        many: bool,
+    ) -> T:
+        """Turn a response into a result, answering ``304 Not Modified`` from the cache and storing new bodies."""
+        if response.status_code == HTTPStatus.NOT_MODIFIED.value and entry is not None:
+            entry = self.response_cache.revalidated(key, url, entry, response.headers)
+            return self._serve_cached(url, key, entry, response_dto_class, many, 'revalidations')
+
+        if response.status_code != 200:
+            self._handle_non_success_case(response)
+
+        result = self._decode_many(response, response_dto_class) if many else self._decode(response, response_dto_class)
+        if key is not None:
+            stored = self.response_cache.store(key, url, response.headers, response.content)
+            if stored is not None:
+                self.response_cache.remember(key, stored, response_dto_class, many, result)
+
+        return result
+
+    def _decode_many(self, response: Any, response_dto_class: Type[T]) -> list[T]:
+        if not self.fast_decode:
+            return self._parse_many(response.json(), response_dto_class)
+
+        try:
+            return _list_adapter(response_dto_class).validate_json(response.content)
+        except ValidationError as e:
+            raise InvalidResponseError(e)
@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Callable
+
+from pydantic import BaseModel, Field
+
+from flight_radar.enums.enums import CircuitState, EndpointFamily
+from flight_radar.errors import CircuitOpenError
+from flight_radar.metrics import MetricsSink, NullMetricsSink
+
+_STATE_GAUGE = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreakerConfig(BaseModel):
+    failure_threshold: int = Field(
+        description='Consecutive upstream failures that open the circuit.',
+        default=5,
+        ge=1,
+    )
+    recovery_timeout: float = Field(
+        description='Seconds the circuit stays open before a probe request is let through.',
+        default=30.0,
+        gt=0,
+    )
+    half_open_max_calls: int = Field(
+        description='Number of concurrent probe requests allowed while the circuit is half open.',
+        default=1,
+        ge=1,
+    )
+
+
+class CircuitBreaker:
+    """
+    Fails fast with ``CircuitOpenError`` while an endpoint family keeps failing upstream.
+
+    After ``failure_threshold`` consecutive failures the circuit opens. Once ``recovery_timeout`` has passed, a
+    limited number of probe requests are let through; the first success closes the circuit again, a failure
+    re-opens it.
+    """
+
+    def __init__(
+        self,
+        family: EndpointFamily | None,
+        config: CircuitBreakerConfig,
+        metrics: MetricsSink | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.family = family
+        self.config = config
+        self._metrics = metrics or NullMetricsSink()
+        self._tags = {'family': family.value if family else 'other'}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._metrics.gauge('circuit_breaker.state', _STATE_GAUGE[state], self._tags)
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self._metrics.increment('circuit_breaker.opened', tags=self._tags)
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` if the call must not be sent upstream."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.config.recovery_timeout:
+                self._transition(CircuitState.HALF_OPEN)
+                self._probes = 0
+
+            if self._state == CircuitState.HALF_OPEN and self._probes < self.config.half_open_max_calls:
+                self._probes += 1
+                return
+
+            if self._state != CircuitState.CLOSED:
+                self._metrics.increment('circuit_breaker.rejected', tags=self._tags)
+                raise CircuitOpenError(f'Circuit for {self._tags["family"]} endpoints is {self._state.value}')
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state != CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def record_abandoned(self) -> None:
+        """Release the probe of a call that ended without telling whether the upstream is healthy."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self._failures >= self.config.failure_threshold
+            ):
+                self._transition(CircuitState.OPEN)
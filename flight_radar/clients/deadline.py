@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from pydantic import BaseModel, Field
+
+_deadline: ContextVar[float | None] = ContextVar('flight_radar_deadline', default=None)
+
+
+class TimeoutConfig(BaseModel):
+    connect: float = Field(
+        description='Seconds to wait for a connection to the API to be established.', default=5.0, gt=0
+    )
+    read: float = Field(
+        description='Seconds to wait for the API to send data, between any two bytes of the response.',
+        default=30.0,
+        gt=0,
+    )
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Give every API call made inside the block, including retries and concurrent sub-requests, a shared time budget.
+
+    Deadlines nest: an inner block can only shorten the budget of the outer one. Calls that cannot finish in
+    the remaining time raise ``DeadlineExceededError``.
+
+    Args:
+        seconds: Time budget of the block
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(expires_at if outer is None else min(outer, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline, or None outside of a ``deadline`` block."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+
+    return expires_at - time.monotonic()
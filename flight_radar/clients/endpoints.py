@@ -0,0 +1,45 @@
+from flight_radar.enums.enums import EndpointFamily
+
+_PREFIXES = (
+    ('/live/', EndpointFamily.LIVE),
+    ('/historic/', EndpointFamily.HISTORIC),
+    ('/static/', EndpointFamily.STATIC),
+    ('/flight-summary/', EndpointFamily.SUMMARY),
+    ('/flight-tracks', EndpointFamily.TRACKS),
+    ('/usage', EndpointFamily.USAGE),
+)
+
+
+def get_endpoint_family(url: str) -> EndpointFamily | None:
+    """Map an API path, such as ``/live/flight-positions/full``, to the family its policies are configured by."""
+    for prefix, family in _PREFIXES:
+        if url.startswith(prefix):
+            return family
+
+    return None
+
+
+# Comma separated parameters whose values are positional rather than a set of alternatives
+_ORDERED_PARAMS = frozenset({'bounds'})
+
+
+def _canonical_param(name: str, value) -> str:
+    if name in _ORDERED_PARAMS or not isinstance(value, str) or ',' not in value:
+        return str(value)
+
+    return ','.join(sorted(set(value.split(','))))
+
+
+def canonical_request_key(url: str, params: dict | None = None) -> str:
+    """
+    Build a stable key for a request, independent of the order its query parameters were given in.
+
+    List filters are sent as comma separated values that the API ORs, so their values are sorted as well.
+    """
+    if not params:
+        return url
+
+    query = '&'.join(
+        f'{name}={_canonical_param(name, value)}' for name, value in sorted(params.items()) if value is not None
+    )
+    return f'{url}?{query}'
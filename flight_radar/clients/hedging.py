@@ -0,0 +1,61 @@
+import threading
+from collections import deque
+
+from pydantic import BaseModel, Field
+
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.metrics import MetricsSink, NullMetricsSink
+
+
+class HedgingConfig(BaseModel):
+    percentile: float = Field(
+        description='Latency percentile of recent requests after which a duplicate request is sent.',
+        default=95.0,
+        gt=0,
+        lt=100,
+    )
+    initial_delay: float = Field(
+        description='Hedge delay in seconds used until enough latencies have been observed.',
+        default=1.0,
+        gt=0,
+    )
+    min_delay: float = Field(description='Lower bound of the hedge delay in seconds.', default=0.05, ge=0)
+    max_delay: float = Field(description='Upper bound of the hedge delay in seconds.', default=5.0, gt=0)
+    window: int = Field(description='Number of recent latencies the percentile is computed over.', default=200, ge=1)
+    min_samples: int = Field(
+        description='Latencies that must be observed before the percentile replaces the initial delay.',
+        default=20,
+        ge=1,
+    )
+
+
+class Hedger:
+    """Tracks recent latencies of an endpoint family and decides when a hedged duplicate request is sent."""
+
+    def __init__(self, family: EndpointFamily | None, config: HedgingConfig, metrics: MetricsSink | None = None):
+        self.family = family
+        self.config = config
+        self._metrics = metrics or NullMetricsSink()
+        self._tags = {'family': family.value if family else 'other'}
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=config.window)
+
+    def delay(self) -> float:
+        with self._lock:
+            if len(self._latencies) < self.config.min_samples:
+                return self.config.initial_delay
+
+            ordered = sorted(self._latencies)
+
+        index = min(len(ordered) - 1, int(len(ordered) * self.config.percentile / 100))
+        return min(max(ordered[index], self.config.min_delay), self.config.max_delay)
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record_hedge(self) -> None:
+        self._metrics.increment('hedging.sent', tags=self._tags)
+
+    def record_hedge_won(self) -> None:
+        self._metrics.increment('hedging.won', tags=self._tags)
@@ -0,0 +1,265 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.cache import CacheBackend, CacheEntry, CacheStats, CacheStatsRecorder, MemoryCache
+from flight_radar.clients.endpoints import canonical_request_key, get_endpoint_family
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.metrics import MetricsSink
+
+T = TypeVar('T')
+
+
+class CachePolicy(BaseModel):
+    enabled: bool = Field(description='Whether responses of the endpoint family are cached at all.', default=True)
+    default_max_age: float = Field(
+        description="""Seconds a response without ``Cache-Control: max-age`` or ``Expires`` is served without asking
+        the API. Zero revalidates it on every call, which only pays off when the API sends ``ETag`` or
+        ``Last-Modified``.""",
+        default=0.0,
+        ge=0,
+    )
+    stale_while_revalidate: float = Field(
+        description="""Seconds after a response went stale during which it is still returned immediately, while a
+        fresh one is fetched in the background.""",
+        default=0.0,
+        ge=0,
+    )
+    stale_if_error: float = Field(
+        description="""Seconds after a response went stale during which it is returned instead of raising when the
+        API fails, rate limits the client, times out or its circuit is open.""",
+        default=0.0,
+        ge=0,
+    )
+
+
+def _cache_control(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives = {}
+    for directive in (headers.get('Cache-Control') or '').split(','):
+        name, _, value = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    return directives
+
+
+def _seconds(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """
+    HTTP cache of raw response bodies, keyed by the canonical request.
+
+    Responses are served without a request while ``Cache-Control: max-age`` or ``Expires`` says they are fresh.
+    Afterwards they are revalidated with ``If-None-Match`` and ``If-Modified-Since``, and a ``304 Not Modified``
+    is answered from the stored body. The policy of an endpoint family may allow stale responses to be served
+    while they are refreshed in the background, or when the API fails. Decoded results are kept next to the
+    bodies, so a revalidated response is not decoded again. Like coalesced calls, they are shared between callers
+    and must not be mutated. Statistics are kept per endpoint family, see ``endpoint_stats``.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        policies: dict[EndpointFamily, CachePolicy] | None = None,
+        default_policy: CachePolicy | None = None,
+        max_decoded: int = 1024,
+        clock: Callable[[], float] = time.time,
+        metrics: MetricsSink | None = None,
+    ):
+        """
+        Args:
+            backend: Storage of the response bodies, defaults to a ``MemoryCache``
+            policies: Policies of individual endpoint families
+            default_policy: Policy of the families without one of their own
+            max_decoded: Number of decoded results kept in memory
+            clock: Wall clock in epoch seconds
+            metrics: Sink the statistics are reported to, tagged with ``cache=http``
+        """
+        self.backend = MemoryCache() if backend is None else backend
+        self.backend.add_eviction_listener(self._count_eviction)
+        self.policies = policies or {}
+        self.default_policy = default_policy or CachePolicy()
+        self._decoded = MemoryCache(max_decoded)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._stats = CacheStatsRecorder('http', metrics)
+
+    def policy(self, url: str) -> CachePolicy:
+        return self.policies.get(get_endpoint_family(url), self.default_policy)
+
+    def lookup(self, url: str, params: dict | None) -> tuple[str | None, CacheEntry | None]:
+        """
+        Find the stored response of a request.
+
+        Returns:
+            tuple[str | None, CacheEntry | None]: Cache key, None when the endpoint is not cached, and the stored
+            entry, whether fresh or not
+        """
+        if not self.policy(url).enabled:
+            return None, None
+
+        key = canonical_request_key(url, params)
+        return key, self.backend.get(key)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.is_fresh(self._clock())
+
+    def _stale_for(self, entry: CacheEntry, window: float) -> bool:
+        return window > 0 and entry.expires_at is not None and self._clock() < entry.expires_at + window
+
+    def serves_while_revalidating(self, url: str, entry: CacheEntry) -> bool:
+        """Whether a stale entry may be returned while it is refreshed in the background."""
+        return self._stale_for(entry, self.policy(url).stale_while_revalidate)
+
+    def serves_on_error(self, url: str, entry: CacheEntry) -> bool:
+        """Whether a stale entry may be returned in place of an upstream error."""
+        return self._stale_for(entry, self.policy(url).stale_if_error)
+
+    def start_refresh(self, key: str) -> bool:
+        """Claim the background refresh of ``key``. Returns False when one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    @staticmethod
+    def validators(entry: CacheEntry | None) -> dict[str, str] | None:
+        """Conditional request headers that let the API answer with ``304 Not Modified``."""
+        if entry is None:
+            return None
+
+        headers = {}
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        return headers or None
+
+    def _lifetime(self, policy: CachePolicy, headers: Mapping[str, str], now: float) -> float | None:
+        """Seconds a response stays fresh, or None when it must not be stored."""
+        directives = _cache_control(headers)
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0.0
+
+        if 'max-age' in directives:
+            lifetime = _seconds(directives['max-age']) or 0.0
+        elif headers.get('Expires'):
+            try:
+                lifetime = parsedate_to_datetime(headers['Expires']).timestamp() - now
+            except (TypeError, ValueError):
+                lifetime = 0.0
+        else:
+            lifetime = policy.default_max_age
+
+        return max(lifetime - (_seconds(headers.get('Age')) or 0.0), 0.0)
+
+    def store(self, key: str, url: str, headers: Mapping[str, str], content: bytes) -> CacheEntry | None:
+        """
+        Store the body of a successful response.
+
+        Returns:
+            CacheEntry | None: The stored entry, or None when the response can neither be reused nor revalidated
+        """
+        now = self._clock()
+        policy = self.policy(url)
+        lifetime = self._lifetime(policy, headers, now)
+        etag, last_modified = headers.get('ETag'), headers.get('Last-Modified')
+        if lifetime is None:
+            return None
+        if lifetime == 0 and etag is None and last_modified is None:
+            if not policy.stale_while_revalidate and not policy.stale_if_error:
+                return None
+
+        entry = CacheEntry(
+            value=bytes(content),
+            stored_at=now,
+            expires_at=now + lifetime,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self.backend.set(key, entry)
+        return entry
+
+    def revalidated(self, key: str, url: str, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Extend the freshness of an entry the API answered with ``304 Not Modified``."""
+        now = self._clock()
+        lifetime = self._lifetime(self.policy(url), headers, now)
+        if lifetime is None:
+            self.backend.delete(key)
+            return entry
+
+        # The body is unchanged, so stored_at is kept and the decoded result stays valid
+        entry = entry.model_copy(
+            update={
+                'expires_at': now + lifetime,
+                'etag': headers.get('ETag') or entry.etag,
+                'last_modified': headers.get('Last-Modified') or entry.last_modified,
+            }
+        )
+        self.backend.set(key, entry)
+        return entry
+
+    def decoded(
+        self, key: str, entry: CacheEntry, response_dto_class: type, many: bool, decode: Callable[[bytes], T]
+    ) -> T:
+        """Decoded result of a stored body, decoding it only when it is not already in memory."""
+        memo = self._decoded.get((key, response_dto_class, many))
+        if memo is not None and memo.stored_at == entry.stored_at:
+            return memo.value
+
+        value = decode(entry.value)
+        self.remember(key, entry, response_dto_class, many, value)
+        return value
+
+    def remember(self, key: str, entry: CacheEntry, response_dto_class: type, many: bool, value: Any) -> None:
+        self._decoded.set((key, response_dto_class, many), CacheEntry(value=value, stored_at=entry.stored_at))
+
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        family = get_endpoint_family(url)
+        return family.value if family else 'other'
+
+    def record(self, url: str, counter: str) -> None:
+        """Count a lookup of ``url``, see ``CacheStats`` for the counters."""
+        self._stats.record(self._endpoint(url), counter)
+
+    def _count_eviction(self, key: str, size: int) -> None:
+        # Keys start with the path of the request, so they map to the same family
+        self._stats.record(self._endpoint(key), 'evictions')
+
+    def endpoint_stats(self) -> dict[str, CacheStats]:
+        """
+        Statistics of every endpoint family, measuring the stored entries and reporting them to the metrics sink.
+
+        Listing the entries of a persistent backend scans all of them, so poll this no more than every few seconds.
+
+        Returns:
+            dict[str, CacheStats]: Statistics keyed by endpoint family, ``other`` for paths outside the families
+        """
+        entries = ((self._endpoint(key), size, stored_at) for key, size, stored_at in self.backend.entries())
+        return self._stats.snapshot(entries, self._clock())
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self._decoded.clear()
+
+    def close(self) -> None:
+        self.backend.close()
@@ -0,0 +1,95 @@
+import socket
+
+import httpx
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class PoolConfig(BaseModel):
+    pool_connections: int = Field(
+        description='Number of per-host connection pools kept by the session.',
+        default=10,
+        ge=1,
+    )
+    pool_maxsize: int = Field(
+        description='Maximum number of connections kept open per host. Size it to the number of worker threads.',
+        default=10,
+        ge=1,
+    )
+    pool_block: bool = Field(
+        description="""Block when all connections of a host are in use instead of opening a throw-away connection
+        that is discarded once the request finishes.""",
+        default=False,
+    )
+    keep_alive: bool = Field(
+        description='Reuse connections between requests. Disabling it closes the connection after every response.',
+        default=True,
+    )
+    keep_alive_idle: int | None = Field(
+        description='Seconds a connection may stay idle before TCP keep-alive probes are sent.',
+        default=60,
+        ge=1,
+    )
+    keep_alive_interval: int | None = Field(
+        description='Seconds between TCP keep-alive probes.',
+        default=10,
+        ge=1,
+    )
+    keep_alive_count: int | None = Field(
+        description='Number of unanswered TCP keep-alive probes before the connection is dropped.',
+        default=6,
+        ge=1,
+    )
+    keep_alive_expiry: float = Field(
+        description='Seconds an idle connection is kept in the async client pool.',
+        default=60.0,
+        gt=0,
+    )
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keep_alive:
+            return options
+
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Not every platform exposes the fine grained keep-alive knobs
+        for name, value in (
+            ('TCP_KEEPIDLE', self.keep_alive_idle),
+            ('TCP_KEEPINTVL', self.keep_alive_interval),
+            ('TCP_KEEPCNT', self.keep_alive_count),
+        ):
+            if value is not None and hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+        return options
+
+    def to_adapter(self) -> 'KeepAliveHTTPAdapter':
+        return KeepAliveHTTPAdapter(
+            socket_options=self.socket_options(),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def to_httpx_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.pool_connections * self.pool_maxsize if self.pool_block else None,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+            keepalive_expiry=self.keep_alive_expiry,
+        )
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that applies socket options, such as TCP keep-alive, to every pooled connection."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, socket_options: list[tuple[int, int, int]] | None = None, **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
@@ -0,0 +1,216 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping
+
+from pydantic import BaseModel, Field
+
+from flight_radar.clients.deadline import remaining_time
+from flight_radar.enums.enums import ApiPlan, EndpointFamily
+from flight_radar.errors import DeadlineExceededError
+
+PLAN_REQUESTS_PER_MINUTE = {
+    ApiPlan.EXPLORER: 10,
+    ApiPlan.ESSENTIAL: 30,
+    ApiPlan.ADVANCED: 90,
+}
+
+# Values above this are absolute epoch seconds rather than a number of seconds to wait
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def parse_retry_after(headers: Mapping[str, str], now: Callable[[], float] = time.time) -> float | None:
+    """
+    Extract how long to wait before the next request from ``Retry-After`` or rate-limit reset headers.
+
+    Args:
+        headers: Response headers
+        now: Wall clock used to turn absolute dates into a delay
+
+    Returns:
+        float | None: Seconds to wait, or None when the response does not say
+    """
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - now(), 0.0)
+            except (TypeError, ValueError):
+                return None
+
+    for name in ('X-RateLimit-Reset', 'RateLimit-Reset'):
+        reset = headers.get(name)
+        if reset:
+            try:
+                value = float(reset)
+            except ValueError:
+                continue
+            return max(value - now(), 0.0) if value > _EPOCH_THRESHOLD else max(value, 0.0)
+
+    return None
+
+
+def _remaining(headers: Mapping[str, str]) -> int | None:
+    for name in ('X-RateLimit-Remaining', 'RateLimit-Remaining'):
+        remaining = headers.get(name)
+        if remaining is not None:
+            try:
+                return int(remaining)
+            except ValueError:
+                continue
+
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it. Tokens may go negative, which queues callers
+    behind each other instead of letting them all wake up and race for the same refill.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity < 1:
+            raise ValueError('rate must be positive and capacity at least 1')
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take ``tokens`` from the bucket and return the number of seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            # Refilling only resumes once a pause requested by the server is over
+            return max(self._updated_at - now, 0.0) + max(-self._tokens, 0.0) / self.rate
+
+    def release(self, tokens: float = 1) -> None:
+        """Give back ``tokens`` that were reserved but will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and hold off refilling for ``seconds``, for example after a 429 with ``Retry-After``."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0)
+            self._updated_at = max(self._updated_at, now + seconds)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with one bucket for the whole API plan and optional buckets per endpoint family.
+
+    Requests are throttled before they are sent, and the buckets are adjusted from ``Retry-After`` and
+    rate-limit headers returned by the API.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: int | None = None,
+        family_requests_per_minute: dict[EndpointFamily, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._global = TokenBucket(requests_per_minute / 60, burst or max(1, int(requests_per_minute / 60)), clock)
+        self._families = {
+            family: TokenBucket(limit / 60, max(1, int(limit / 60)), clock)
+            for family, limit in (family_requests_per_minute or {}).items()
+        }
+
+    @classmethod
+    def for_plan(
+        cls,
+        plan: ApiPlan,
+        family_requests_per_minute: dict[EndpointFamily, float] | None = None,
+        **kwargs,
+    ) -> 'RateLimiter':
+        return cls(PLAN_REQUESTS_PER_MINUTE[plan], family_requests_per_minute=family_requests_per_minute, **kwargs)
+
+    def requests_per_minute(self, family: EndpointFamily | None = None) -> float:
+        """Sustained number of requests of ``family`` that may be sent per minute."""
+        return min(bucket.rate for bucket in self._buckets(family)) * 60
+
+    def _buckets(self, family: EndpointFamily | None) -> list[TokenBucket]:
+        family_bucket = self._families.get(family)
+        return [self._global, family_bucket] if family_bucket else [self._global]
+
+    def reserve(self, family: EndpointFamily | None) -> float:
+        return max(bucket.reserve() for bucket in self._buckets(family))
+
+    def _reserve_within_deadline(self, family: EndpointFamily | None) -> float:
+        wait = self.reserve(family)
+        remaining = remaining_time()
+        # Waiting past the deadline would only delay the inevitable error, and hold a token another caller can use
+        if remaining is not None and wait > remaining:
+            for bucket in self._buckets(family):
+                bucket.release()
+            raise DeadlineExceededError(f'Deadline exceeded while waiting {wait:.3f}s for the rate limiter')
+
+        return wait
+
+    def acquire(self, family: EndpointFamily | None) -> None:
+        """
+        Block the calling thread until a request of ``family`` may be sent.
+
+        Raises:
+            DeadlineExceededError: The wait would outlast the current deadline
+        """
+        wait = self._reserve_within_deadline(family)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, family: EndpointFamily | None) -> None:
+        """
+        Suspend the calling task until a request of ``family`` may be sent.
+
+        Raises:
+            DeadlineExceededError: The wait would outlast the current deadline
+        """
+        wait = self._reserve_within_deadline(family)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, family: EndpointFamily | None, status_code: int, headers: Mapping[str, str]) -> None:
+        """Feed a response back into the limiter so that it backs off when the API asks it to."""
+        retry_after = parse_retry_after(headers)
+        if status_code == 429:
+            for bucket in self._buckets(family):
+                bucket.pause(retry_after or 0.0)
+        elif _remaining(headers) == 0 and retry_after:
+            for bucket in self._buckets(family):
+                bucket.pause(retry_after)
+
+
+class RetryPolicy(BaseModel):
+    max_retries: int = Field(description='How many times a rate limited request is retried.', default=3, ge=0)
+    backoff_base: float = Field(description='Backoff of the first retry in seconds.', default=1.0, gt=0)
+    backoff_max: float = Field(description='Upper bound of a single backoff in seconds.', default=60.0, gt=0)
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (starting at 0).
+
+        Uses full jitter exponential backoff, and never waits less than the server asked for in ``Retry-After``.
+        """
+        backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if retry_after is None:
+            return backoff
+
+        return retry_after + random.uniform(0, self.backoff_base)
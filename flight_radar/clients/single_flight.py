@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar('T')
+
+
+class SingleFlightStats(BaseModel):
+    executed: int = Field(description='Calls that were sent upstream.', default=0)
+    coalesced: int = Field(
+        description='Calls that shared the result of an identical call already in flight.', default=0
+    )
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls made from different threads.
+
+    The first caller for a key runs the call, every caller arriving while it is in flight waits for it and
+    receives the same result or exception. Results are shared, not copied, so they must not be mutated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._stats = SingleFlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats.executed += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+
+class AsyncSingleFlight:
+    """Coalesces identical concurrent calls made from tasks running on the same event loop."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is not None:
+            self._stats.coalesced += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self._stats.executed += 1
+
+        # A caller giving up must not cancel the call for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: Any) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def stats(self) -> SingleFlightStats:
+        return self._stats.model_copy()
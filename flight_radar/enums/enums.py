@@ -24,6 +24,7 @@ class FlightCategory(Enum):
 
 
 class HTTPStatus(Enum):
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     PAYMENT_REQUIRED = 402
@@ -59,3 +60,24 @@ class HistoricFlightEventTypes(Enum):
     DESCENT = 'descent'
     LANDED = 'landed'
     GATE_ARRIVAL = 'gate_arrival'
+
+
+class EndpointFamily(Enum):
+    LIVE = 'live'
+    HISTORIC = 'historic'
+    STATIC = 'static'
+    SUMMARY = 'summary'
+    TRACKS = 'tracks'
+    USAGE = 'usage'
+
+
+class ApiPlan(Enum):
+    EXPLORER = 'explorer'
+    ESSENTIAL = 'essential'
+    ADVANCED = 'advanced'
+
+
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
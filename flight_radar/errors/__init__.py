@@ -1,5 +1,7 @@
 from .api_client import (
     BadRequestError,
+    CircuitOpenError,
+    DeadlineExceededError,
     InsufficientCredits,
     InternalServerError,
     InvalidResponseError,
@@ -16,4 +18,6 @@ __all__ = [
     'InternalServerError',
     'InvalidResponseError',
     'TooManyRequestsError',
+    'CircuitOpenError',
+    'DeadlineExceededError',
 ]
@@ -24,3 +24,11 @@ class InvalidResponseError(Exception):
 
 class TooManyRequestsError(Exception):
     pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class DeadlineExceededError(Exception):
+    pass
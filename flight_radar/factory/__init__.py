@@ -1,3 +1,3 @@
-from .factory import get_flight_radar_client
+from .factory import get_async_flight_radar_client, get_flight_radar_client
 
-__all__ = ['get_flight_radar_client']
+__all__ = ['get_flight_radar_client', 'get_async_flight_radar_client']
@@ -1,14 +1,116 @@
 import os
+
+import httpx
 from requests import Session
+
 from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.circuit_breaker import CircuitBreakerConfig
+from flight_radar.clients.deadline import TimeoutConfig
+from flight_radar.clients.hedging import HedgingConfig
+from flight_radar.clients.http_cache import ResponseCache
+from flight_radar.clients.pool import PoolConfig
+from flight_radar.clients.rate_limiter import RateLimiter, RetryPolicy
+from flight_radar.enums.enums import ApiPlan, EndpointFamily
+from flight_radar.metrics import MetricsSink
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.historic_cache import HistoricResultCache
+from flight_radar.services.live_snapshot import LiveSnapshotCache
+from flight_radar.services.reference_data import ReferenceDataCache
 from flight_radar.services.service import FlightRadarClient
 
 
 def get_flight_radar_client(  # pragma: no cover
     base_url: str = os.getenv('FLIGHT_RADAR_BASE_URL', ''),
     api_key: str = os.getenv('FLIGHT_RADAR_API_KEY', ''),
+    pool_config: PoolConfig | None = None,
+    prewarm_connections: int = 0,
+    plan: ApiPlan | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    fast_decode: bool = False,
+    single_pass_decode: bool = False,
+    coalesce_requests: bool = False,
+    hedging: dict[EndpointFamily, HedgingConfig] | None = None,
+    circuit_breakers: dict[EndpointFamily, CircuitBreakerConfig] | None = None,
+    metrics: MetricsSink | None = None,
+    timeout: TimeoutConfig | None = None,
+    family_timeouts: dict[EndpointFamily, TimeoutConfig] | None = None,
+    response_cache: ResponseCache | None = None,
+    reference_data: ReferenceDataCache | None = None,
+    historic_cache: HistoricResultCache | None = None,
+    live_snapshot: LiveSnapshotCache | None = None,
 ) -> FlightRadarClient:
     session = Session()
-    api_client = FlightRadarApiClient(session=session, base_url=base_url, api_key=api_key)
+    api_client = FlightRadarApiClient(
+        session=session,
+        base_url=base_url,
+        api_key=api_key,
+        pool_config=pool_config,
+        rate_limiter=rate_limiter or (RateLimiter.for_plan(plan) if plan else None),
+        retry_policy=retry_policy,
+        fast_decode=fast_decode,
+        coalesce_requests=coalesce_requests,
+        hedging=hedging,
+        circuit_breakers=circuit_breakers,
+        metrics=metrics,
+        timeout=timeout,
+        family_timeouts=family_timeouts,
+        response_cache=response_cache,
+    )
+    if prewarm_connections:
+        api_client.prewarm(prewarm_connections)
+
+    return FlightRadarClient(
+        api_client,
+        single_pass_decode=single_pass_decode,
+        reference_data=reference_data,
+        historic_cache=historic_cache,
+        live_snapshot=live_snapshot,
+    )
+
+
+def get_async_flight_radar_client(  # pragma: no cover
+    base_url: str = os.getenv('FLIGHT_RADAR_BASE_URL', ''),
+    api_key: str = os.getenv('FLIGHT_RADAR_API_KEY', ''),
+    pool_config: PoolConfig | None = None,
+    plan: ApiPlan | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    fast_decode: bool = False,
+    single_pass_decode: bool = False,
+    coalesce_requests: bool = False,
+    hedging: dict[EndpointFamily, HedgingConfig] | None = None,
+    circuit_breakers: dict[EndpointFamily, CircuitBreakerConfig] | None = None,
+    metrics: MetricsSink | None = None,
+    timeout: TimeoutConfig | None = None,
+    family_timeouts: dict[EndpointFamily, TimeoutConfig] | None = None,
+    response_cache: ResponseCache | None = None,
+    reference_data: ReferenceDataCache | None = None,
+    historic_cache: HistoricResultCache | None = None,
+    live_snapshot: LiveSnapshotCache | None = None,
+) -> AsyncFlightRadarClient:
+    client = httpx.AsyncClient(limits=pool_config.to_httpx_limits()) if pool_config else httpx.AsyncClient()
+    api_client = AsyncFlightRadarApiClient(
+        client=client,
+        base_url=base_url,
+        api_key=api_key,
+        rate_limiter=rate_limiter or (RateLimiter.for_plan(plan) if plan else None),
+        retry_policy=retry_policy,
+        fast_decode=fast_decode,
+        coalesce_requests=coalesce_requests,
+        hedging=hedging,
+        circuit_breakers=circuit_breakers,
+        metrics=metrics,
+        timeout=timeout,
+        family_timeouts=family_timeouts,
+        response_cache=response_cache,
+    )
 
-    return FlightRadarClient(api_client)
+    return AsyncFlightRadarClient(
+        api_client,
+        single_pass_decode=single_pass_decode,
+        reference_data=reference_data,
+        historic_cache=historic_cache,
+        live_snapshot=live_snapshot,
+    )
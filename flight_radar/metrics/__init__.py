@@ -0,0 +1,3 @@
+from .sink import InMemoryMetricsSink, MetricsSink, MetricsSnapshot, NullMetricsSink
+
+__all__ = ['MetricsSink', 'NullMetricsSink', 'InMemoryMetricsSink', 'MetricsSnapshot']
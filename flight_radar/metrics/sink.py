@@ -0,0 +1,59 @@
+import threading
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, Field
+
+
+def _series(name: str, tags: dict[str, str] | None) -> str:
+    if not tags:
+        return name
+
+    labels = ','.join(f'{key}={value}' for key, value in sorted(tags.items()))
+    return f'{name}{{{labels}}}'
+
+
+class MetricsSink(ABC):
+    """Receives counters and gauges emitted by the clients. Implement it to forward them to StatsD, Prometheus, etc."""
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1, tags: dict[str, str] | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        pass
+
+
+class NullMetricsSink(MetricsSink):
+    def increment(self, name: str, value: float = 1, tags: dict[str, str] | None = None) -> None:
+        pass
+
+    def gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        pass
+
+
+class MetricsSnapshot(BaseModel):
+    counters: dict[str, float] = Field(description='Counter totals keyed by series, e.g. hedging.sent{family=live}.')
+    gauges: dict[str, float] = Field(description='Latest gauge values keyed by series.')
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Thread-safe sink that keeps totals in memory, for tests and for polling with ``snapshot``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1, tags: dict[str, str] | None = None) -> None:
+        series = _series(name, tags)
+        with self._lock:
+            self._counters[series] = self._counters.get(series, 0) + value
+
+    def gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        with self._lock:
+            self._gauges[_series(name, tags)] = value
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(counters=dict(self._counters), gauges=dict(self._gauges))
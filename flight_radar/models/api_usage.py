@@ -2,9 +2,10 @@ from pydantic import BaseModel, Field
 
 from flight_radar.dtos import ApiUsageBaseRequestDto, ApiUsageDto
 from flight_radar.enums.enums import TimePeriod
+from flight_radar.models.common import CanonicalRequest
 
 
-class ApiUsageRequest(BaseModel):
+class ApiUsageRequest(CanonicalRequest):
     period: TimePeriod = TimePeriod.DAY
 
     def to_dto(self) -> ApiUsageBaseRequestDto:
@@ -1,6 +1,8 @@
-from typing import Annotated, List, TypeAlias
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, Any, List, TypeAlias
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr
 
 from flight_radar.enums.enums import Direction
 
@@ -9,6 +11,81 @@ MAX_LIST_LENGTH = 15
 
 ConstrainedStringList: TypeAlias = Annotated[List[str], Field(max_length=MAX_LIST_LENGTH)]
 
+# The API sends empty strings for unknown datetimes, which are mapped to None like in the from_dto mappers
+OptionalDatetime: TypeAlias = Annotated[datetime | None, BeforeValidator(lambda value: value or None)]
+
+
+def canonical_value(value: Any) -> Any:
+    """
+    Normalize a request field into a hashable value that is equal for semantically identical filters.
+
+    Lists are filters whose values are ORed, so they become sorted tuples without duplicates. Aware datetimes are
+    converted to UTC, and all datetimes are truncated to whole seconds like the API does.
+    """
+    if isinstance(value, list):
+        return tuple(sorted({canonical_value(item) for item in value}))
+    if isinstance(value, tuple):
+        return tuple(canonical_value(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.replace(microsecond=0)
+    if isinstance(value, BaseModel):
+        return str(value)
+
+    return value
+
+
+class CanonicalRequest(BaseModel):
+    """
+    Frozen request model that is hashable and compared by its canonical key.
+
+    Requests that differ only in the order of list values, in bounds below the precision sent to the API, or in
+    the timezone of their timestamps have the same key, so they can be used directly as dict and cache keys.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    _canonical_key: tuple | None = PrivateAttr(default=None)
+
+    def _canonical_field(self, name: str, value: Any) -> Any:
+        return canonical_value(value)
+
+    def canonical_key(self) -> tuple:
+        """
+        Normalized key of the request, computed once and cached.
+
+        Returns:
+            tuple: Name of the request type followed by the sorted ``(field, value)`` pairs of the fields that are set
+        """
+        if self._canonical_key is None:
+            fields = tuple(
+                (name, self._canonical_field(name, value))
+                for name, value in sorted(self.__dict__.items())
+                if value is not None
+            )
+            self._canonical_key = (type(self).__name__, fields)
+
+        return self._canonical_key
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._canonical_key = None
+
+        return copied
+
+    def __hash__(self) -> int:
+        return hash(self.canonical_key())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CanonicalRequest):
+            return NotImplemented
+
+        return self.canonical_key() == other.canonical_key()
+
 
 class AirportWithDirection(BaseModel):
     airport: str = Field(description='Airport IATA or ICAO code.')
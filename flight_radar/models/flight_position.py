@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Annotated, List
+from typing import Annotated, Any, List
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -15,13 +15,15 @@ from flight_radar.dtos import (
 )
 from flight_radar.enums.enums import DataSources, FlightCategory
 from flight_radar.models.common import (
+    CanonicalRequest,
     ConstrainedAirportWithDirectionList,
     ConstrainedRouteList,
     ConstrainedStringList,
+    OptionalDatetime,
 )
 
 
-class FlightPositionBaseRequest(BaseModel):
+class FlightPositionBaseRequest(CanonicalRequest):
     bounds: tuple[float, float, float, float] | None = None
     flights: ConstrainedStringList | None = None
     callsigns: ConstrainedStringList | None = None
@@ -66,17 +68,27 @@ class FlightPositionBaseRequest(BaseModel):
 
         return self
 
-    def _map_bounds(self):
-        if not self.bounds:
-            return None
-
+    def _snap_bounds(self) -> tuple[str, ...]:
         result = []
         for bound in self.bounds:
             decimal_value = Decimal(str(bound))
             rounded_bound = decimal_value.quantize(Decimal('0.001'), rounding=ROUND_HALF_UP)
             result.append(str(rounded_bound))
 
-        return ','.join(result)
+        return tuple(result)
+
+    def _map_bounds(self):
+        if not self.bounds:
+            return None
+
+        return ','.join(self._snap_bounds())
+
+    def _canonical_field(self, name: str, value: Any) -> Any:
+        # Bounds are compared at the precision they are sent to the API with
+        if name == 'bounds':
+            return self._snap_bounds()
+
+        return super()._canonical_field(name, value)
 
     def _map_categories(self):
         if not self.categories:
@@ -200,7 +212,10 @@ class FlightPositionLight(BaseModel):
     )
     gspeed: int = Field(description='Speed relative to the ground expressed in knots.')
     vspeed: int = Field(description='The rate at which the aircraft is ascending or descending in feet per minute.')
-    squawk: str = Field(description='4 digit unique identifying code for ATC expressed in octal format.')
+    squawk: str = Field(
+        description='4 digit unique identifying code for ATC expressed in octal format.',
+        coerce_numbers_to_str=True,
+    )
     timestamp: datetime = Field(description='Timestamp of the flight position in UTC.')
     source: str = Field(description='Data source of the provided flight position.')
 
@@ -251,7 +266,7 @@ class FlightPosition(FlightPositionLight):
         description='ICAO code for the destination airport.',
         default=None,
     )
-    eta: datetime | None = Field(
+    eta: OptionalDatetime = Field(
         description='Estimated time of arrival',
         default=None,
     )
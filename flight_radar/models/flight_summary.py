@@ -11,13 +11,15 @@ from flight_radar.dtos import (
 )
 from flight_radar.enums.enums import Sort
 from flight_radar.models.common import (
+    CanonicalRequest,
     ConstrainedAirportWithDirectionList,
     ConstrainedRouteList,
     ConstrainedStringList,
+    OptionalDatetime,
 )
 
 
-class FlightSummaryBaseRequest(BaseModel):
+class FlightSummaryBaseRequest(CanonicalRequest):
     flight_ids: ConstrainedStringList | None = Field(
         description='fr24_ids (maximum 15 IDs). Cannot be combined with flight_datetime',
         default=None,
@@ -83,7 +85,7 @@ class FlightSummaryBaseRequest(BaseModel):
             raise ValueError('At least one filter parameter must be provided')
 
         if self.flight_datetime_from and self.flight_datetime_to:
-            if self.flight_datetime_from < datetime.now(tz=timezone.utc) - timedelta(days=14):
+            if self.flight_datetime_from < datetime.now(tz=timezone.utc) - MAX_FLIGHT_SUMMARY_LOOKBACK:
                 raise ValueError('flight_datetime_from must be within the last 14 days')
             if self.flight_datetime_from > self.flight_datetime_to:
                 raise ValueError('flight_datetime_from must be before flight_datetime_to')
@@ -107,6 +109,7 @@ class FlightSummaryBaseRequest(BaseModel):
 
 
 MAX_FLIGHT_SUMMARY_LIMIT = 20000
+MAX_FLIGHT_SUMMARY_LOOKBACK = timedelta(days=14)
 
 
 class FlightSummaryRequest(FlightSummaryBaseRequest):
@@ -155,12 +158,12 @@ class FlightSummaryLight(BaseModel):
         default=None,
     )
     orig_icao: str | None = Field(description='Origin airport ICAO code.', default=None)
-    datetime_takeoff: datetime | None = Field(description='Datetime of takeoff in UTC', default=None)
+    datetime_takeoff: OptionalDatetime = Field(description='Datetime of takeoff in UTC', default=None)
     dest_icao: str | None = Field(
         description='Destination airport ICAO code.',
         default=None,
     )
-    datetime_landed: datetime | None = Field(
+    datetime_landed: OptionalDatetime = Field(
         description='Datetime of landing in UTC',
         default=None,
     )
@@ -168,11 +171,11 @@ class FlightSummaryLight(BaseModel):
         description='24 bit Mode-S identifier expressed in hexadecimal format.',
         default=None,
     )
-    first_seen: datetime | None = Field(
+    first_seen: OptionalDatetime = Field(
         description='Datetime when the aircraft was first detected for this flight leg (UTC)',
         default=None,
     )
-    last_seen: datetime | None = Field(
+    last_seen: OptionalDatetime = Field(
         description='Datetime when the aircraft was last detected for this flight leg (UTC)',
         default=None,
     )
@@ -1,10 +1,11 @@
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 
 from flight_radar.dtos import FlightTrackDto, GetFlightTracksBaseRequestDto
+from flight_radar.models.common import CanonicalRequest
 
 
-class FlightTrackRequest(BaseModel):
+class FlightTrackRequest(CanonicalRequest):
     flight_id: str = Field(description='Unique identifier assigned by Flightradar24 to the flight leg.')
 
     def to_dto(self) -> GetFlightTracksBaseRequestDto:
@@ -15,12 +16,19 @@ class FlightTrackRequest(BaseModel):
 
 class FlightTrack(BaseModel):
     timestamp: datetime = Field(description='Timestamp of the flight position expressed in UTC (ISO 8601 date format).')
-    latitude: float = Field(description='Latest latitude expressed in decimal degrees')
-    longitude: float = Field(description='Latest longitude expressed in decimal degrees')
+    latitude: float = Field(
+        description='Latest latitude expressed in decimal degrees',
+        validation_alias=AliasChoices('latitude', 'lat'),
+    )
+    longitude: float = Field(
+        description='Latest longitude expressed in decimal degrees',
+        validation_alias=AliasChoices('longitude', 'lon'),
+    )
     altitude: int = Field(
         description="""Barometric pressure altitude above mean sea level (AMSL)
         reported at a standard atmospheric pressure (1013.25 hPa / 29.92 in. Hg.)
-        expressed in feet."""
+        expressed in feet.""",
+        validation_alias=AliasChoices('altitude', 'alt'),
     )
     gspeed: int = Field(description='Speed relative to the ground expressed in knots.')
     vspeed: int = Field(
@@ -35,10 +43,16 @@ class FlightTrack(BaseModel):
     callsign: str = Field(
         description="""The last known callsign used by Air Traffic Control to denote a
         specific flight, as sent by the aircraft transponder. This callsign is
-        consistent across all reported positions."""
+        consistent across all reported positions.""",
+        default='',
     )
     source: str = Field(description='Data source of the provided flight position.')
 
+    @field_validator('callsign', mode='before')
+    @classmethod
+    def _map_missing_callsign(cls, value):
+        return value or ''
+
     @staticmethod
     def from_dto(dto: FlightTrackDto) -> 'FlightTrack':
         return FlightTrack(
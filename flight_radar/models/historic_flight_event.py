@@ -11,10 +11,10 @@ from flight_radar.dtos import (
     HistoricFlightEventResponseEntryDto,
 )
 from flight_radar.enums.enums import HistoricFlightEventTypes
-from flight_radar.models.common import ConstrainedStringList
+from flight_radar.models.common import CanonicalRequest, ConstrainedStringList
 
 
-class HistoricFlightEventRequest(BaseModel):
+class HistoricFlightEventRequest(CanonicalRequest):
     flight_ids: ConstrainedStringList = Field(
         description='List of fr24_ids (maximum 15 IDs). Cannot be combined with event_datetime.',
     )
@@ -0,0 +1,45 @@
+"""
+Response envelopes that decode API payloads straight into the public models.
+
+They are used by the clients in single-pass decode mode, which skips validating a DTO first and then
+validating the public model a second time in ``from_dto``.
+"""
+
+from pydantic import BaseModel
+
+from flight_radar.models.flight_position import FlightPosition, FlightPositionLight
+from flight_radar.models.flight_summary import FlightSummary, FlightSummaryLight
+from flight_radar.models.flight_track import FlightTrack
+from flight_radar.models.historic_flight_event import (
+    HistoricFlightEventLightResponseEntry,
+    HistoricFlightEventResponseEntry,
+)
+
+
+class FlightPositionLightResponse(BaseModel):
+    data: list[FlightPositionLight]
+
+
+class FlightPositionResponse(BaseModel):
+    data: list[FlightPosition]
+
+
+class FlightSummaryLightResponse(BaseModel):
+    data: list[FlightSummaryLight]
+
+
+class FlightSummaryResponse(BaseModel):
+    data: list[FlightSummary]
+
+
+class FlightTrackResponse(BaseModel):
+    fr24_id: str
+    tracks: list[FlightTrack]
+
+
+class HistoricFlightEventLightResponse(BaseModel):
+    data: list[HistoricFlightEventLightResponseEntry]
+
+
+class HistoricFlightEventResponse(BaseModel):
+    data: list[HistoricFlightEventResponseEntry]
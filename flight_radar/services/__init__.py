@@ -1,3 +1,36 @@
+from .async_service import AsyncFlightRadarClient
+from .batch import BatchResult
+from .bulk_events import AsyncBulkEventStream, BulkEventStream, BulkProgress, ChunkProgress
+from .historic_cache import HistoricCacheConfig, HistoricResultCache
+from .live_snapshot import LiveSnapshotCache, LiveSnapshotConfig, LiveSnapshotStats
+from .planner import AsyncQueryPlanner, PlannerConfig, QueryPlan, QueryPlanner
+from .reference_data import ReferenceDataCache, ReferenceDataConfig, ReferenceDataStats
 from .service import FlightRadarClient
+from .sweep import PositionFrame
+from .tiling import TilingConfig
+from .windowing import WindowingConfig
 
-__all__ = ['FlightRadarClient']
+__all__ = [
+    'FlightRadarClient',
+    'AsyncFlightRadarClient',
+    'BatchResult',
+    'BulkEventStream',
+    'AsyncBulkEventStream',
+    'BulkProgress',
+    'ChunkProgress',
+    'PositionFrame',
+    'HistoricCacheConfig',
+    'HistoricResultCache',
+    'LiveSnapshotCache',
+    'LiveSnapshotConfig',
+    'LiveSnapshotStats',
+    'PlannerConfig',
+    'QueryPlan',
+    'QueryPlanner',
+    'AsyncQueryPlanner',
+    'ReferenceDataCache',
+    'ReferenceDataConfig',
+    'ReferenceDataStats',
+    'TilingConfig',
+    'WindowingConfig',
+]
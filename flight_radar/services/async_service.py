@@ -0,0 +1,984 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, TypeVar
+
+from pydantic import BaseModel
+
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.dtos import (
+    GetAirlineLightResponseDto,
+    GetAirportLightResponseDto,
+    GetAirportResponseDto,
+    GetApiUsageResponseDto,
+    GetFlightSummaryCountResponseDto,
+    GetFlightSummaryLightResponseDto,
+    GetFlightSummaryResponseDto,
+    GetFlightTracksResponseDto,
+    GetHistoricFlightPositionCountResponseDto,
+    GetHistoricFlightPositionLightResponseDto,
+    GetHistoricFlightPositionResponseDto,
+    GetLiveFlightPositionCountResponseDto,
+    GetLiveFlightPositionLightResponseDto,
+    GetLiveFlightPositionResponseDto,
+    HistoricFlightEventLightResponseDto,
+    HistoricFlightEventResponseDto,
+)
+
+from flight_radar.enums.enums import HistoricFlightEventTypes
+from flight_radar.models import (
+    Airline,
+    Airport,
+    AirportLight,
+    ApiUsage,
+    ApiUsageRequest,
+    CountResponse,
+    FlightPosition,
+    FlightPositionLight,
+    FlightSummary,
+    FlightSummaryCountRequest,
+    FlightSummaryLight,
+    FlightSummaryRequest,
+    FlightTrack,
+    FlightTrackRequest,
+    HistoricFlightPositionCountRequest,
+    HistoricFlightPositionRequest,
+    LiveFlightPositionCountRequest,
+    LiveFlightPositionRequest,
+    HistoricFlightEventLightResponseEntry,
+    HistoricFlightEventRequest,
+    HistoricFlightEventResponseEntry,
+)
+from flight_radar.models.responses import (
+    FlightPositionLightResponse,
+    FlightPositionResponse,
+    FlightSummaryLightResponse,
+    FlightSummaryResponse,
+    FlightTrackResponse,
+    HistoricFlightEventLightResponse,
+    HistoricFlightEventResponse,
+)
+from flight_radar.services.base import BaseFlightRadarClient
+from flight_radar.services.batch import BatchResult, map_in_tasks
+from flight_radar.services.bulk_events import AsyncBulkEventStream, stream_events_async
+from flight_radar.services.fan_out import fan_out_async, merge_summaries, split_request
+from flight_radar.services.historic_cache import HistoricResultCache
+from flight_radar.services.live_snapshot import LiveSnapshotCache
+from flight_radar.services.planner import AsyncQueryPlanner, PlannerConfig
+from flight_radar.services.projection import (
+    FLIGHT_SUMMARY,
+    HISTORIC_FLIGHT_EVENTS,
+    HISTORIC_FLIGHT_POSITIONS,
+    LIVE_FLIGHT_POSITIONS,
+    resolve,
+)
+from flight_radar.services.reference_data import ReferenceDataCache, reference_key
+from flight_radar.services.sweep import PositionFrame, sweep_async
+from flight_radar.services.tiling import TilingConfig, fetch_tiled_async, merge_positions
+from flight_radar.services.windowing import WindowingConfig, fetch_windowed_async
+
+M = TypeVar('M', bound=BaseModel)
+P = TypeVar('P', bound=FlightPositionLight)
+R = TypeVar('R')
+T = TypeVar('T')
+
+
+class AsyncFlightRadarClient(BaseFlightRadarClient):
+    """
+    Asyncio variant of ``FlightRadarClient``. Every method is a coroutine returning the same models.
+
+    Use it as an async context manager so that the underlying connection pool and the caches it was given are
+    closed afterwards.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncFlightRadarApiClient,
+        single_pass_decode: bool = False,
+        reference_data: ReferenceDataCache | None = None,
+        historic_cache: HistoricResultCache | None = None,
+        live_snapshot: LiveSnapshotCache | None = None,
+    ):
+        """
+        Args:
+            api_client: API client used to send the requests
+            single_pass_decode: Decode list responses straight into the public models, skipping the
+                intermediate DTOs and their ``from_dto`` mapping
+            reference_data: Cache answering airport and airline lookups
+            historic_cache: Cache of historic results that no longer change
+            live_snapshot: Shared snapshot answering live position requests inside its region
+        """
+        self.api_client = api_client
+        self.single_pass_decode = single_pass_decode
+        self.reference_data = reference_data
+        self.historic_cache = historic_cache
+        self.live_snapshot = live_snapshot
+
+    async def __aenter__(self) -> 'AsyncFlightRadarClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def map(
+        self, method: Callable[[R], Awaitable[T]], requests: Iterable[R], concurrency: int = 8, ordered: bool = True
+    ) -> AsyncIterator[BatchResult[R, T]]:
+        """
+        Call a client method for many requests concurrently, with at most ``concurrency`` calls in flight
+
+        A failing call is reported in its result instead of aborting the batch.
+
+        Args:
+            method: Client method to call, e.g. ``client.get_flight_tracks``
+            requests: Arguments to call the method with, one call per item
+            concurrency: Number of calls in flight at once
+            ordered: Yield results in the order of ``requests`` instead of as soon as they complete
+
+        Returns:
+            AsyncIterator[BatchResult]: One result per request, holding either the return value or the error
+        """
+        return map_in_tasks(method, requests, concurrency, ordered)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool and every cache the client was given, see ``FlightRadarClient``."""
+        await self.api_client.aclose()
+        for cache in (self.reference_data, self.historic_cache, self.live_snapshot):
+            if cache is not None:
+                cache.close()
+
+    def planner(self, config: PlannerConfig | None = None) -> AsyncQueryPlanner:
+        """
+        Dry-run planner estimating the rows, credits, sub-requests and duration of a query before running it
+
+        Args:
+            config: Credits per row of each endpoint and the latency model used for the estimates
+
+        Returns:
+            AsyncQueryPlanner: Planner sending only count requests through this client
+        """
+        return AsyncQueryPlanner(self, config)
+
+    async def _reference(self, kind: str, code: str, model_class: type[M], fetch: Callable[[str], Awaitable[M]]) -> M:
+        if self.reference_data is None:
+            return await fetch(code)
+
+        return await self.reference_data.get_or_fetch_async(
+            reference_key(kind, code), model_class, lambda: fetch(code), self.api_client.may_serve_stale
+        )
+
+    async def prewarm_airports(
+        self, codes: Iterable[str], light: bool = False, concurrency: int = 8
+    ) -> List[BatchResult[str, Airport | AirportLight]]:
+        """
+        Load airports into the reference data cache concurrently
+
+        Codes that are already cached are answered from the cache without a request.
+
+        Args:
+            codes: ICAO or IATA codes of the airports
+            light: Load the light variant, as returned by ``get_airports_light``
+            concurrency: Number of requests in flight at once
+
+        Returns:
+            List[BatchResult]: One result per code, holding either the airport or the error
+        """
+        method = self.get_airports_light if light else self.get_airports
+        return [result async for result in map_in_tasks(method, codes, concurrency, ordered=True)]
+
+    async def prewarm_airlines(self, codes: Iterable[str], concurrency: int = 8) -> List[BatchResult[str, Airline]]:
+        """
+        Load airlines into the reference data cache concurrently, see ``prewarm_airports``
+
+        Args:
+            codes: ICAO codes of the airlines
+            concurrency: Number of requests in flight at once
+
+        Returns:
+            List[BatchResult]: One result per code, holding either the airline or the error
+        """
+        return [result async for result in map_in_tasks(self.get_airlines_light, codes, concurrency, ordered=True)]
+
+    async def _historic(self, endpoint: str, request: Any, result_type: Any, fetch: Callable, final: Callable) -> Any:
+        if self.historic_cache is None:
+            return await fetch(request)
+
+        def store(result: Any) -> None:
+            if final(self.historic_cache, request, result):
+                self.historic_cache.set(key, result_type, result)
+
+        # The cache lives in SQLite, whose reads and writes may wait on the locks of other processes
+        key = HistoricResultCache.key(endpoint, request)
+        result = await asyncio.to_thread(self.historic_cache.get, key, result_type)
+        if result is None:
+            result = await fetch(request)
+            await asyncio.to_thread(store, result)
+
+        return result
+
+    async def get_airlines_light(self, icao: str) -> Airline:
+        """
+        Get airline light data
+
+        Args:
+            icao: ICAO code of the airline
+
+        Returns:
+            Airline: Airline model
+        """
+        return await self._reference('airlines/light', icao, Airline, self._get_airlines_light)
+
+    async def _get_airlines_light(self, icao: str) -> Airline:
+        dto = await self.api_client.get(
+            f'/static/airlines/{icao}/light',
+            GetAirlineLightResponseDto,
+        )
+
+        return Airline.from_dto(dto)
+
+    async def get_airports_light(self, code: str) -> AirportLight:
+        """
+        Get airport light data
+
+        Args:
+            code: ICAO code of the airport
+
+        Returns:
+            AirportLight: Airport light model
+        """
+        return await self._reference('airports/light', code, AirportLight, self._get_airports_light)
+
+    async def _get_airports_light(self, code: str) -> AirportLight:
+        dto = await self.api_client.get(
+            f'/static/airports/{code}/light',
+            GetAirportLightResponseDto,
+        )
+
+        return AirportLight.from_dto(dto)
+
+    async def get_airports(self, code: str) -> Airport:
+        """
+        Get airport data
+
+        Args:
+            code: ICAO code of the airport
+
+        Returns:
+            Airport: Airport model
+        """
+        return await self._reference('airports/full', code, Airport, self._get_airports)
+
+    async def _get_airports(self, code: str) -> Airport:
+        dto = await self.api_client.get(
+            f'/static/airports/{code}/full',
+            GetAirportResponseDto,
+        )
+
+        return Airport.from_dto(dto)
+
+    async def _live(
+        self,
+        variant: str,
+        request: LiveFlightPositionRequest,
+        fetch: Callable[[LiveFlightPositionRequest], Awaitable[List[P]]],
+    ) -> List[P]:
+        if self.live_snapshot is None:
+            return await fetch(request)
+        if not self.live_snapshot.covers(request):
+            self.live_snapshot.bypass(variant)
+            return await fetch(request)
+
+        async def load() -> List[P]:
+            snapshot_request = self.live_snapshot.snapshot_request(request)
+            return await fetch_tiled_async(
+                fetch, self.get_live_flight_position_count, snapshot_request, self.live_snapshot.config.tiling
+            )
+
+        key = self.live_snapshot.key(variant, request)
+        return await self.live_snapshot.get_async(key, request, load)
+
+    async def get_live_flight_positions_light(self, request: LiveFlightPositionRequest) -> List[FlightPositionLight]:
+        """
+        Get live flight positions light data
+
+        Args:
+            request: LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: List of flight position light models
+        """
+        return await self._live('light', request, self._get_live_flight_positions_light)
+
+    async def _get_live_flight_positions_light(self, request: LiveFlightPositionRequest) -> List[FlightPositionLight]:
+        url = '/live/flight-positions/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightPositionLightResponse, params)).data
+
+        dto = await self.api_client.get(url, GetLiveFlightPositionLightResponseDto, params)
+
+        return [FlightPositionLight.from_dto(flight_position) for flight_position in dto.data]
+
+    async def get_live_flight_positions(self, request: LiveFlightPositionRequest) -> List[FlightPosition]:
+        """
+        Get live flight positions data
+
+        Args:
+            request: LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: List of flight position models
+        """
+        return await self._live('full', request, self._get_live_flight_positions)
+
+    async def _get_live_flight_positions(self, request: LiveFlightPositionRequest) -> List[FlightPosition]:
+        url = '/live/flight-positions/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightPositionResponse, params)).data
+
+        dto = await self.api_client.get(url, GetLiveFlightPositionResponseDto, params)
+
+        return [FlightPosition.from_dto(flight_position) for flight_position in dto.data]
+
+    async def get_live_flight_positions_projected(
+        self, request: LiveFlightPositionRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get live flight positions holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: LiveFlightPositionRequest
+            fields: Names of the fields to return, e.g. ``['lat', 'lon', 'alt']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(LIVE_FLIGHT_POSITIONS, fields)
+        return (await self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True))).data
+
+    async def get_live_flight_position_count(self, request: LiveFlightPositionCountRequest) -> CountResponse:
+        """
+        Get live flight positions count
+
+        Args:
+            request: LiveFlightPositionCountRequest
+
+        Returns:
+            CountResponse: Count response model
+        """
+        dto = await self.api_client.get(
+            '/live/flight-positions/count',
+            GetLiveFlightPositionCountResponseDto,
+            request.to_dto().model_dump(),
+        )
+
+        return CountResponse.from_dto(dto)
+
+    async def get_live_flight_positions_light_tiled(
+        self, request: LiveFlightPositionRequest, config: TilingConfig | None = None
+    ) -> List[FlightPositionLight]:
+        """
+        Get a complete snapshot of live flight positions light data, even when it exceeds the per-request limit
+
+        The bounds of the request, or the whole world when it has none, are split into quadrants until every tile
+        holds fewer flights than the limit. The tiles are then fetched concurrently and merged.
+
+        Args:
+            request: LiveFlightPositionRequest, its ``limit`` caps the merged result
+            config: Tile sizing and concurrency
+
+        Returns:
+            List[FlightPositionLight]: Flight positions deduplicated on ``fr24_id``
+        """
+        return await fetch_tiled_async(
+            self.get_live_flight_positions_light, self.get_live_flight_position_count, request, config or TilingConfig()
+        )
+
+    async def get_live_flight_positions_tiled(
+        self, request: LiveFlightPositionRequest, config: TilingConfig | None = None
+    ) -> List[FlightPosition]:
+        """
+        Get a complete snapshot of live flight positions data, even when it exceeds the per-request limit
+
+        Args:
+            request: LiveFlightPositionRequest, its ``limit`` caps the merged result
+            config: Tile sizing and concurrency
+
+        Returns:
+            List[FlightPosition]: Flight positions deduplicated on ``fr24_id``
+        """
+        return await fetch_tiled_async(
+            self.get_live_flight_positions, self.get_live_flight_position_count, request, config or TilingConfig()
+        )
+
+    async def get_live_flight_positions_light_batched(
+        self, max_workers: int = 8, **filters: Any
+    ) -> List[FlightPositionLight]:
+        """
+        Get live flight positions light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: FlightPositionLight models deduplicated on ``fr24_id``
+        """
+        requests = split_request(LiveFlightPositionRequest, **filters)
+        chunks = await fan_out_async(self.get_live_flight_positions_light, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    async def get_live_flight_positions_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightPosition]:
+        """
+        Get live flight positions data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: FlightPosition models deduplicated on ``fr24_id``
+        """
+        requests = split_request(LiveFlightPositionRequest, **filters)
+        chunks = await fan_out_async(self.get_live_flight_positions, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    async def get_historic_positions_light(self, request: HistoricFlightPositionRequest) -> List[FlightPositionLight]:
+        """
+        Get historic flight positions light data
+
+        Args:
+            request: HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: List of flight position light models
+        """
+        return await self._historic(
+            '/historic/flight-positions/light',
+            request,
+            List[FlightPositionLight],
+            self._get_historic_positions_light,
+            HistoricResultCache.positions_are_final,
+        )
+
+    async def _get_historic_positions_light(self, request: HistoricFlightPositionRequest) -> List[FlightPositionLight]:
+        url = '/historic/flight-positions/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightPositionLightResponse, params)).data
+
+        dto = await self.api_client.get(url, GetHistoricFlightPositionLightResponseDto, params)
+
+        return [FlightPositionLight.from_dto(flight_position) for flight_position in dto.data]
+
+    async def get_historic_positions(self, request: HistoricFlightPositionRequest) -> List[FlightPosition]:
+        """
+        Get historic flight positions data
+
+        Args:
+            request: HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: List of flight position models
+        """
+        return await self._historic(
+            '/historic/flight-positions/full',
+            request,
+            List[FlightPosition],
+            self._get_historic_positions,
+            HistoricResultCache.positions_are_final,
+        )
+
+    async def _get_historic_positions(self, request: HistoricFlightPositionRequest) -> List[FlightPosition]:
+        url = '/historic/flight-positions/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightPositionResponse, params)).data
+
+        dto = await self.api_client.get(url, GetHistoricFlightPositionResponseDto, params)
+
+        return [FlightPosition.from_dto(flight_position) for flight_position in dto.data]
+
+    async def get_historic_positions_projected(
+        self, request: HistoricFlightPositionRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get historic flight positions holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: HistoricFlightPositionRequest
+            fields: Names of the fields to return, e.g. ``['lat', 'lon', 'alt']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(HISTORIC_FLIGHT_POSITIONS, fields)
+        return (await self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True))).data
+
+    async def get_historic_positions_count(self, request: HistoricFlightPositionCountRequest) -> CountResponse:
+        """
+        Get historic flight positions count
+
+        Args:
+            request: HistoricFlightPositionCountRequest
+
+        Returns:
+            CountResponse: Count response model
+        """
+        dto = await self.api_client.get(
+            '/historic/flight-positions/count',
+            GetHistoricFlightPositionCountResponseDto,
+            request.to_dto().model_dump(exclude_none=True),
+        )
+
+        return CountResponse.from_dto(dto)
+
+    async def get_historic_positions_light_batched(
+        self, max_workers: int = 8, **filters: Any
+    ) -> List[FlightPositionLight]:
+        """
+        Get historic flight positions light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: FlightPositionLight models deduplicated on ``fr24_id``
+        """
+        requests = split_request(HistoricFlightPositionRequest, **filters)
+        chunks = await fan_out_async(self.get_historic_positions_light, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    async def get_historic_positions_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightPosition]:
+        """
+        Get historic flight positions data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: FlightPosition models deduplicated on ``fr24_id``
+        """
+        requests = split_request(HistoricFlightPositionRequest, **filters)
+        chunks = await fan_out_async(self.get_historic_positions, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    def sweep_historic_positions_light(
+        self, start: datetime, end: datetime, step: timedelta, concurrency: int = 8, **filters: Any
+    ) -> AsyncIterator[PositionFrame[FlightPositionLight]]:
+        """
+        Stream snapshots of historic flight positions light data at every ``step`` from ``start`` up to ``end``
+
+        Snapshots are fetched concurrently, at most ``concurrency`` ahead of the consumer, and yielded in
+        timestamp order.
+
+        Args:
+            start: Timestamp of the first snapshot
+            end: End of the sweep, excluded
+            step: Time between two snapshots
+            concurrency: Number of snapshots fetched at once
+            filters: Other fields of a HistoricFlightPositionRequest, except ``timestamp``
+
+        Returns:
+            AsyncIterator[PositionFrame]: One frame per timestamp
+        """
+        return sweep_async(self.get_historic_positions_light, start, end, step, concurrency, **filters)
+
+    def sweep_historic_positions(
+        self, start: datetime, end: datetime, step: timedelta, concurrency: int = 8, **filters: Any
+    ) -> AsyncIterator[PositionFrame[FlightPosition]]:
+        """
+        Stream snapshots of historic flight positions data at every ``step`` from ``start`` up to ``end``
+
+        Snapshots are fetched concurrently, at most ``concurrency`` ahead of the consumer, and yielded in
+        timestamp order.
+
+        Args:
+            start: Timestamp of the first snapshot
+            end: End of the sweep, excluded
+            step: Time between two snapshots
+            concurrency: Number of snapshots fetched at once
+            filters: Other fields of a HistoricFlightPositionRequest, except ``timestamp``
+
+        Returns:
+            AsyncIterator[PositionFrame]: One frame per timestamp
+        """
+        return sweep_async(self.get_historic_positions, start, end, step, concurrency, **filters)
+
+    async def get_flight_summary_light(self, request: FlightSummaryRequest) -> List[FlightSummaryLight]:
+        """
+        Get flight summary light data
+
+        Args:
+            request: FlightSummaryRequest
+
+        Returns:
+            List[FlightSummaryLight]: List of flight summary light models
+        """
+        return await self._historic(
+            '/flight-summary/light',
+            request,
+            List[FlightSummaryLight],
+            self._get_flight_summary_light,
+            HistoricResultCache.summaries_are_final,
+        )
+
+    async def _get_flight_summary_light(self, request: FlightSummaryRequest) -> List[FlightSummaryLight]:
+        url = '/flight-summary/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightSummaryLightResponse, params)).data
+
+        dto = await self.api_client.get(url, GetFlightSummaryLightResponseDto, params)
+
+        return [FlightSummaryLight.from_dto(flight_summary) for flight_summary in dto.data]
+
+    async def get_flight_summary(self, request: FlightSummaryRequest) -> List[FlightSummary]:
+        """
+        Get flight summary data
+
+        Args:
+            request: FlightSummaryRequest
+
+        Returns:
+            List[FlightSummary]: List of flight summary models
+        """
+        return await self._historic(
+            '/flight-summary/full',
+            request,
+            List[FlightSummary],
+            self._get_flight_summary,
+            HistoricResultCache.summaries_are_final,
+        )
+
+    async def _get_flight_summary(self, request: FlightSummaryRequest) -> List[FlightSummary]:
+        url = '/flight-summary/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, FlightSummaryResponse, params)).data
+
+        dto = await self.api_client.get(url, GetFlightSummaryResponseDto, params)
+
+        return [FlightSummary.from_dto(flight_summary) for flight_summary in dto.data]
+
+    async def get_flight_summary_projected(
+        self, request: FlightSummaryRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get flight summaries holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: FlightSummaryRequest
+            fields: Names of the fields to return, e.g. ``['fr24_id', 'orig_icao', 'dest_icao']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(FLIGHT_SUMMARY, fields)
+        return (await self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True))).data
+
+    async def get_flight_summary_count(self, request: FlightSummaryCountRequest) -> CountResponse:
+        """
+        Get flight summary count
+
+        Args:
+            request: FlightSummaryCountRequest
+
+        Returns:
+            CountResponse: Count response model
+        """
+        dto = await self.api_client.get(
+            '/flight-summary/count',
+            GetFlightSummaryCountResponseDto,
+            request.to_dto().model_dump(exclude_none=True),
+        )
+
+        return CountResponse.from_dto(dto)
+
+    async def get_flight_summary_light_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightSummaryLight]:
+        """
+        Get flight summary light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``sort`` and ``limit`` are applied to the
+        merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a FlightSummaryRequest
+
+        Returns:
+            List[FlightSummaryLight]: FlightSummaryLight models deduplicated on ``fr24_id`` and sorted by ``first_seen``
+        """
+        requests = split_request(FlightSummaryRequest, **filters)
+        chunks = await fan_out_async(self.get_flight_summary_light, requests, max_workers)
+        return merge_summaries(chunks, filters.get('limit'), filters.get('sort'))
+
+    async def get_flight_summary_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightSummary]:
+        """
+        Get flight summary data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``sort`` and ``limit`` are applied to the
+        merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a FlightSummaryRequest
+
+        Returns:
+            List[FlightSummary]: FlightSummary models deduplicated on ``fr24_id`` and sorted by ``first_seen``
+        """
+        requests = split_request(FlightSummaryRequest, **filters)
+        chunks = await fan_out_async(self.get_flight_summary, requests, max_workers)
+        return merge_summaries(chunks, filters.get('limit'), filters.get('sort'))
+
+    def get_flight_summary_light_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        config: WindowingConfig | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[FlightSummaryLight]:
+        """
+        Stream flight summary light data for a date range, without the 20,000 results cap
+
+        The range is cut into windows, and windows holding too many flights according to
+        ``get_flight_summary_count`` are bisected. The windows are fetched concurrently. Like single requests, the
+        range must start within the last 14 days, otherwise a ``ValueError`` is raised before any request is sent.
+
+        Args:
+            flight_datetime_from: Start of the range, matched against ``first_seen``
+            flight_datetime_to: End of the range
+            config: Window sizing and concurrency
+            filters: Other fields of a FlightSummaryRequest, except ``limit`` and ``sort``
+
+        Returns:
+            AsyncIterator[FlightSummaryLight]: FlightSummaryLight models in ascending ``first_seen`` order
+        """
+        return fetch_windowed_async(
+            self.get_flight_summary_light,
+            self.get_flight_summary_count,
+            flight_datetime_from,
+            flight_datetime_to,
+            config or WindowingConfig(),
+            **filters,
+        )
+
+    def get_flight_summary_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        config: WindowingConfig | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[FlightSummary]:
+        """
+        Stream flight summary data for a date range, without the 20,000 results cap
+
+        The range is cut into windows, and windows holding too many flights according to
+        ``get_flight_summary_count`` are bisected. The windows are fetched concurrently. Like single requests, the
+        range must start within the last 14 days, otherwise a ``ValueError`` is raised before any request is sent.
+
+        Args:
+            flight_datetime_from: Start of the range, matched against ``first_seen``
+            flight_datetime_to: End of the range
+            config: Window sizing and concurrency
+            filters: Other fields of a FlightSummaryRequest, except ``limit`` and ``sort``
+
+        Returns:
+            AsyncIterator[FlightSummary]: FlightSummary models in ascending ``first_seen`` order
+        """
+        return fetch_windowed_async(
+            self.get_flight_summary,
+            self.get_flight_summary_count,
+            flight_datetime_from,
+            flight_datetime_to,
+            config or WindowingConfig(),
+            **filters,
+        )
+
+    async def get_flight_tracks(self, request: FlightTrackRequest) -> tuple[str, List[FlightTrack]]:
+        """
+        Get flight tracks
+
+        Args:
+            request: FlightTrackRequest
+
+        Returns:
+            tuple[str, List[FlightTrack]]: Tuple containing the flight ID and list of flight tracks
+        """
+        return await self._historic(
+            '/flight-tracks',
+            request,
+            tuple[str, List[FlightTrack]],
+            self._get_flight_tracks,
+            HistoricResultCache.tracks_are_final,
+        )
+
+    async def _get_flight_tracks(self, request: FlightTrackRequest) -> tuple[str, List[FlightTrack]]:
+        url = '/flight-tracks'
+        params = request.to_dto().model_dump()
+        if self.single_pass_decode:
+            response = await self.api_client.get_many(url, FlightTrackResponse, params)
+            return (response[0].fr24_id, response[0].tracks)
+
+        dto = await self.api_client.get_many(url, GetFlightTracksResponseDto, params)
+
+        return (dto[0].fr24_id, [FlightTrack.from_dto(track) for track in dto[0].tracks])
+
+    async def get_api_usage(self, request: ApiUsageRequest) -> List[ApiUsage]:
+        """
+        Get API usage
+
+        Args:
+            request: ApiUsageRequest
+
+        Returns:
+            List[ApiUsage]: List of API usage models
+        """
+        dto = await self.api_client.get(
+            '/usage',
+            GetApiUsageResponseDto,
+            request.to_dto().model_dump(),
+        )
+
+        return [ApiUsage.from_dto(usage) for usage in dto.data]
+
+    async def get_historic_flight_events_light(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventLightResponseEntry]:
+        """
+        Get historic flight events light data
+
+        Args:
+            request: HistoricFlightEventRequest
+
+        Returns:
+            List[HistoricFlightEventLightResponseEntry]: List of historic flight events light models
+        """
+        return await self._historic(
+            '/historic/flight-events/light',
+            request,
+            List[HistoricFlightEventLightResponseEntry],
+            self._get_historic_flight_events_light,
+            HistoricResultCache.events_are_final,
+        )
+
+    async def _get_historic_flight_events_light(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventLightResponseEntry]:
+        url = '/historic/flight-events/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, HistoricFlightEventLightResponse, params)).data
+
+        dto = await self.api_client.get(url, HistoricFlightEventLightResponseDto, params)
+
+        return [HistoricFlightEventLightResponseEntry.from_dto(event) for event in dto.data]
+
+    async def get_historic_flight_events(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventResponseEntry]:
+        """
+        Get historic flight events data
+
+        Args:
+            request: HistoricFlightEventRequest
+
+        Returns:
+            List[HistoricFlightEventResponse]: List of historic flight events models
+        """
+        return await self._historic(
+            '/historic/flight-events/full',
+            request,
+            List[HistoricFlightEventResponseEntry],
+            self._get_historic_flight_events,
+            HistoricResultCache.events_are_final,
+        )
+
+    async def _get_historic_flight_events(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventResponseEntry]:
+        url = '/historic/flight-events/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return (await self.api_client.get(url, HistoricFlightEventResponse, params)).data
+
+        dto = await self.api_client.get(url, HistoricFlightEventResponseDto, params)
+
+        return [HistoricFlightEventResponseEntry.from_dto(event) for event in dto.data]
+
+    async def get_historic_flight_events_projected(
+        self, request: HistoricFlightEventRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get historic flight events holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: HistoricFlightEventRequest
+            fields: Names of the fields to return, e.g. ``['fr24_id', 'events']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(HISTORIC_FLIGHT_EVENTS, fields)
+        return (await self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True))).data
+
+    def get_historic_flight_events_light_bulk(
+        self,
+        flight_ids: Iterable[str],
+        event_types: List[HistoricFlightEventTypes] | None = None,
+        concurrency: int = 8,
+    ) -> AsyncBulkEventStream[HistoricFlightEventLightResponseEntry]:
+        """
+        Stream historic flight events light data for any number of flights
+
+        The flight IDs are sent in chunks of 15 concurrently, and entries are streamed as chunks complete. A failing
+        chunk does not stop the stream, its error is recorded in the ``progress`` of the returned stream.
+
+        Args:
+            flight_ids: fr24_ids of the flights
+            event_types: Event types to filter by
+            concurrency: Number of chunks in flight at once
+
+        Returns:
+            AsyncBulkEventStream[HistoricFlightEventLightResponseEntry]: Entries of every chunk, with per chunk progress
+        """
+        return stream_events_async(self.get_historic_flight_events_light, flight_ids, event_types, concurrency)
+
+    def get_historic_flight_events_bulk(
+        self,
+        flight_ids: Iterable[str],
+        event_types: List[HistoricFlightEventTypes] | None = None,
+        concurrency: int = 8,
+    ) -> AsyncBulkEventStream[HistoricFlightEventResponseEntry]:
+        """
+        Stream historic flight events data for any number of flights
+
+        The flight IDs are sent in chunks of 15 concurrently, and entries are streamed as chunks complete. A failing
+        chunk does not stop the stream, its error is recorded in the ``progress`` of the returned stream.
+
+        Args:
+            flight_ids: fr24_ids of the flights
+            event_types: Event types to filter by
+            concurrency: Number of chunks in flight at once
+
+        Returns:
+            AsyncBulkEventStream[HistoricFlightEventResponseEntry]: Entries of every chunk, with per chunk progress
+        """
+        return stream_events_async(self.get_historic_flight_events, flight_ids, event_types, concurrency)
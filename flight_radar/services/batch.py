@@ -0,0 +1,152 @@
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+R = TypeVar('R')
+T = TypeVar('T')
+
+
+class BatchResult(BaseModel, Generic[R, T]):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description='Position of the request in the input iterable.')
+    request: R = Field(description='The request the result belongs to.')
+    result: T | None = Field(description='Return value of the call, None when it failed.', default=None)
+    error: Exception | None = Field(description='Exception raised by the call, None when it succeeded.', default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run(fn: Callable[[R], T], index: int, request: R) -> BatchResult[R, T]:
+    try:
+        return BatchResult(index=index, request=request, result=fn(request))
+    except Exception as e:
+        return BatchResult(index=index, request=request, error=e)
+
+
+def map_in_threads(
+    fn: Callable[[R], T], requests: Iterable[R], max_workers: int, ordered: bool
+) -> Iterator[BatchResult[R, T]]:
+    """
+    Call ``fn`` for every request on a bounded thread pool and yield the results as they become available.
+
+    Requests are pulled from the iterable lazily, so at most ``2 * max_workers`` of them are pending at once.
+
+    Args:
+        fn: Function called with each request
+        requests: Requests to run
+        max_workers: Number of threads
+        ordered: Yield results in the order of the requests instead of in the order they complete
+
+    Returns:
+        Iterator[BatchResult]: One result per request
+
+    Raises:
+        ValueError: ``max_workers`` is below 1. Raised by the call, not on iteration
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+
+    return _map_in_threads(fn, requests, max_workers, ordered)
+
+
+def _map_in_threads(
+    fn: Callable[[R], T], requests: Iterable[R], max_workers: int, ordered: bool
+) -> Iterator[BatchResult[R, T]]:
+    pending: deque[Future] = deque()
+    items = enumerate(requests)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='flight-radar-batch')
+
+    def submit() -> bool:
+        for index, request in items:
+            # Worker threads do not inherit context variables, such as the current deadline
+            pending.append(executor.submit(contextvars.copy_context().run, _run, fn, index, request))
+            return True
+        return False
+
+    try:
+        while len(pending) < 2 * max_workers and submit():
+            pass
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+
+            for future in done:
+                submit()
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def map_in_tasks(
+    fn: Callable[[R], Awaitable[T]], requests: Iterable[R], concurrency: int, ordered: bool
+) -> AsyncIterator[BatchResult[R, T]]:
+    """
+    Await ``fn`` for every request with at most ``concurrency`` calls in flight on the running event loop.
+
+    Args:
+        fn: Coroutine function called with each request
+        requests: Requests to run
+        concurrency: Maximum number of calls in flight
+        ordered: Yield results in the order of the requests instead of in the order they complete
+
+    Returns:
+        AsyncIterator[BatchResult]: One result per request
+
+    Raises:
+        ValueError: ``concurrency`` is below 1. Raised by the call, not on iteration
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+
+    return _map_in_tasks(fn, requests, concurrency, ordered)
+
+
+async def _map_in_tasks(
+    fn: Callable[[R], Awaitable[T]], requests: Iterable[R], concurrency: int, ordered: bool
+) -> AsyncIterator[BatchResult[R, T]]:
+    async def run(index: int, request: R) -> BatchResult[R, T]:
+        try:
+            return BatchResult(index=index, request=request, result=await fn(request))
+        except Exception as e:
+            return BatchResult(index=index, request=request, error=e)
+
+    pending: deque[asyncio.Task] = deque()
+    items = enumerate(requests)
+
+    def submit() -> bool:
+        for index, request in items:
+            pending.append(asyncio.ensure_future(run(index, request)))
+            return True
+        return False
+
+    try:
+        while len(pending) < concurrency and submit():
+            pass
+
+        while pending:
+            if ordered:
+                done: Any = [pending.popleft()]
+                await done[0]
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.remove(task)
+
+            for task in done:
+                submit()
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
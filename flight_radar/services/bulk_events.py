@@ -0,0 +1,121 @@
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterable, Iterator, List, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from flight_radar.enums.enums import HistoricFlightEventTypes
+from flight_radar.models import HistoricFlightEventLightResponseEntry, HistoricFlightEventRequest
+from flight_radar.models.common import MAX_LIST_LENGTH
+from flight_radar.services.batch import BatchResult, map_in_tasks, map_in_threads
+
+E = TypeVar('E', bound=HistoricFlightEventLightResponseEntry)
+
+
+class ChunkProgress(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description='Position of the chunk among all chunks.')
+    flight_ids: List[str] = Field(description='Flight IDs requested by the chunk.')
+    done: bool = Field(description='Whether the chunk has completed, successfully or not.', default=False)
+    entries: int = Field(description='Entries received for the chunk.', default=0)
+    error: Exception | None = Field(description='Exception raised by the chunk, None unless it failed.', default=None)
+
+
+class BulkProgress(BaseModel):
+    chunks: List[ChunkProgress] = Field(description='Progress of every chunk, in the order of the flight IDs.')
+
+    @property
+    def completed(self) -> int:
+        return sum(chunk.done for chunk in self.chunks)
+
+    @property
+    def entries(self) -> int:
+        return sum(chunk.entries for chunk in self.chunks)
+
+    @property
+    def failed(self) -> List[ChunkProgress]:
+        return [chunk for chunk in self.chunks if chunk.error is not None]
+
+    @property
+    def failed_flight_ids(self) -> List[str]:
+        return [flight_id for chunk in self.failed for flight_id in chunk.flight_ids]
+
+
+def chunk_event_requests(
+    flight_ids: Iterable[str], event_types: List[HistoricFlightEventTypes] | None = None
+) -> List[HistoricFlightEventRequest]:
+    """Split flight IDs, without duplicates, into requests of at most ``MAX_LIST_LENGTH`` IDs."""
+    unique = list(dict.fromkeys(flight_ids))
+    return [
+        HistoricFlightEventRequest(flight_ids=unique[start : start + MAX_LIST_LENGTH], event_types=event_types)
+        for start in range(0, len(unique), MAX_LIST_LENGTH)
+    ]
+
+
+def _record(progress: BulkProgress, result: BatchResult) -> List[E]:
+    chunk = progress.chunks[result.index]
+    chunk.done = True
+    if not result.ok:
+        chunk.error = result.error
+        return []
+
+    chunk.entries = len(result.result)
+    return result.result
+
+
+class BulkEventStream(Generic[E]):
+    """
+    Iterator over the entries of a bulk events query, in the order the chunks complete.
+
+    A failed chunk does not stop the stream. Its error is kept in ``progress``, which is updated as the stream is
+    consumed.
+    """
+
+    def __init__(self, results: Iterator[BatchResult], progress: BulkProgress):
+        self.progress = progress
+        self._entries = (entry for result in results for entry in _record(progress, result))
+
+    def __iter__(self) -> 'BulkEventStream[E]':
+        return self
+
+    def __next__(self) -> E:
+        return next(self._entries)
+
+
+class AsyncBulkEventStream(Generic[E]):
+    """Asyncio variant of ``BulkEventStream``."""
+
+    def __init__(self, results: AsyncIterator[BatchResult], progress: BulkProgress):
+        self.progress = progress
+        self._entries = (entry async for result in results for entry in _record(progress, result))
+
+    def __aiter__(self) -> 'AsyncBulkEventStream[E]':
+        return self
+
+    async def __anext__(self) -> E:
+        return await anext(self._entries)
+
+
+def _progress(requests: List[HistoricFlightEventRequest]) -> BulkProgress:
+    return BulkProgress(
+        chunks=[ChunkProgress(index=index, flight_ids=request.flight_ids) for index, request in enumerate(requests)]
+    )
+
+
+def stream_events(
+    fetch: Callable[[HistoricFlightEventRequest], List[E]],
+    flight_ids: Iterable[str],
+    event_types: List[HistoricFlightEventTypes] | None,
+    max_workers: int,
+) -> BulkEventStream[E]:
+    requests = chunk_event_requests(flight_ids, event_types)
+    return BulkEventStream(map_in_threads(fetch, requests, max_workers, ordered=False), _progress(requests))
+
+
+def stream_events_async(
+    fetch: Callable[[HistoricFlightEventRequest], Awaitable[List[E]]],
+    flight_ids: Iterable[str],
+    event_types: List[HistoricFlightEventTypes] | None,
+    concurrency: int,
+) -> AsyncBulkEventStream[E]:
+    requests = chunk_event_requests(flight_ids, event_types)
+    return AsyncBulkEventStream(map_in_tasks(fetch, requests, concurrency, ordered=False), _progress(requests))
@@ -0,0 +1,87 @@
+from itertools import product
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+from pydantic import BaseModel
+
+from flight_radar.enums.enums import Sort
+from flight_radar.models import FlightSummaryLight
+from flight_radar.models.common import MAX_LIST_LENGTH
+from flight_radar.services.batch import map_in_tasks, map_in_threads
+
+Q = TypeVar('Q', bound=BaseModel)
+S = TypeVar('S', bound=FlightSummaryLight)
+T = TypeVar('T')
+
+# Filters the API accepts at most MAX_LIST_LENGTH values for. Values of one filter are ORed, filters are ANDed.
+FAN_OUT_FIELDS = (
+    'flight_ids',
+    'flights',
+    'callsigns',
+    'registrations',
+    'painted_as',
+    'operating_as',
+    'airports',
+    'routes',
+    'aircraft',
+)
+
+
+def split_request(request_cls: type[Q], **fields: Any) -> List[Q]:
+    """
+    Build the requests needed to query filter lists of any length.
+
+    Every list longer than ``MAX_LIST_LENGTH`` is cut into chunks, and one request is built per combination of
+    chunks, so the union of their results is the result of the unsplit query.
+
+    Args:
+        request_cls: Request model to build, e.g. ``FlightSummaryRequest``
+        fields: Fields of the request, with filter lists of any length
+
+    Returns:
+        List: Requests that each pass the validation of ``request_cls``
+    """
+    chunks = {
+        name: [values[start : start + MAX_LIST_LENGTH] for start in range(0, len(values), MAX_LIST_LENGTH)]
+        for name, values in ((name, list(fields[name])) for name in FAN_OUT_FIELDS if fields.get(name))
+        if name in request_cls.model_fields
+    }
+    return [request_cls(**(fields | dict(zip(chunks, combination)))) for combination in product(*chunks.values())]
+
+
+def merge_summaries(chunks: Iterable[List[S]], limit: int | None = None, sort: Sort | None = None) -> List[S]:
+    """Merge flight summaries of several requests, deduplicated on ``fr24_id`` and sorted by ``first_seen``."""
+    merged: dict[str, S] = {}
+    for chunk in chunks:
+        for summary in chunk:
+            merged.setdefault(summary.fr24_id, summary)
+
+    # Summaries without first_seen go last, whatever the direction
+    known = sorted(
+        (summary for summary in merged.values() if summary.first_seen is not None),
+        key=lambda summary: summary.first_seen,
+        reverse=sort == Sort.DESC,
+    )
+    summaries = known + [summary for summary in merged.values() if summary.first_seen is None]
+    return summaries[:limit] if limit else summaries
+
+
+def fan_out(fetch: Callable[[Q], T], requests: List[Q], max_workers: int) -> List[T]:
+    """Run ``fetch`` for every request concurrently and return the results, raising the first error."""
+    results = []
+    for result in map_in_threads(fetch, requests, max_workers, ordered=True):
+        if not result.ok:
+            raise result.error
+        results.append(result.result)
+
+    return results
+
+
+async def fan_out_async(fetch: Callable[[Q], Awaitable[T]], requests: List[Q], max_workers: int) -> List[T]:
+    """Asyncio variant of ``fan_out``."""
+    results = []
+    async for result in map_in_tasks(fetch, requests, max_workers, ordered=True):
+        if not result.ok:
+            raise result.error
+        results.append(result.result)
+
+    return results
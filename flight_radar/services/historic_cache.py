@@ -0,0 +1,155 @@
+import hashlib
+import time
+import zlib
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, List
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from flight_radar.cache import CacheBackend, CacheEntry, CacheStats, CacheStatsRecorder, SharedSQLiteCache
+from flight_radar.metrics import MetricsSink
+from flight_radar.models import (
+    FlightSummaryLight,
+    FlightSummaryRequest,
+    FlightTrackRequest,
+    HistoricFlightPositionRequest,
+)
+from flight_radar.models.common import CanonicalRequest
+from flight_radar.models.historic_flight_event import HistoricFlightEventRequest
+
+
+class HistoricCacheConfig(BaseModel):
+    path: Path = Field(description='SQLite database the results are stored in.')
+    max_bytes: int = Field(
+        description='Upper bound of the compressed results stored. The least recently used are evicted beyond it.',
+        default=1024**3,
+        ge=1,
+    )
+    compression_level: int = Field(description='zlib compression level of the stored results.', default=6, ge=0, le=9)
+    settle_time: timedelta = Field(
+        description='Age a historic position snapshot must have before it is treated as final.',
+        default=timedelta(hours=1),
+    )
+
+
+@lru_cache(maxsize=None)
+def _adapter(result_type: Any) -> TypeAdapter:
+    return TypeAdapter(result_type)
+
+
+def _ended_key(flight_id: str) -> str:
+    return f'ended:{flight_id}'
+
+
+def _endpoint(key: str) -> str:
+    return key.rpartition(':')[0]
+
+
+class HistoricResultCache:
+    """
+    Content-addressed cache of results that never change once they are in the past.
+
+    Results are stored compressed under the SHA-256 of the endpoint and the canonical key of the request, and are
+    never expired; only the size cap evicts them. The cache also remembers which flights are known to have ended,
+    so that their tracks and events can be cached too. Its statistics report these markers as the ``ended``
+    endpoint.
+    """
+
+    def __init__(
+        self,
+        config: HistoricCacheConfig,
+        backend: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+        metrics: MetricsSink | None = None,
+    ):
+        """
+        Args:
+            config: Cache configuration
+            backend: Backend to store the results in, defaults to a ``SharedSQLiteCache`` at ``config.path``
+            clock: Wall clock in epoch seconds
+            metrics: Sink the statistics are reported to, tagged with ``cache=historic``
+        """
+        self.config = config
+        self.backend = SharedSQLiteCache(config.path, max_bytes=config.max_bytes) if backend is None else backend
+        self._clock = clock
+        self._stats = CacheStatsRecorder('historic', metrics)
+        self.backend.add_eviction_listener(lambda key, size: self._stats.record(_endpoint(key), 'evictions'))
+
+    @staticmethod
+    def key(endpoint: str, request: CanonicalRequest) -> str:
+        """Content address of the result of ``request`` on ``endpoint``, prefixed with the endpoint."""
+        digest = hashlib.sha256(repr((endpoint, request.canonical_key())).encode()).hexdigest()
+        return f'{endpoint}:{digest}'
+
+    def get(self, key: str, result_type: Any) -> Any | None:
+        """
+        Look up a stored result.
+
+        Args:
+            key: Content address, see ``key``
+            result_type: Type the result was stored as, e.g. ``List[FlightPositionLight]``
+
+        Returns:
+            Any | None: The decoded result, or None when it is not stored
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            self._stats.record(_endpoint(key), 'misses')
+            return None
+
+        self._stats.record(_endpoint(key), 'hits')
+        return _adapter(result_type).validate_json(zlib.decompress(entry.value))
+
+    def set(self, key: str, result_type: Any, result: Any) -> None:
+        payload = zlib.compress(_adapter(result_type).dump_json(result), self.config.compression_level)
+        self.backend.set(key, CacheEntry(value=payload, stored_at=self._clock()))
+
+    def is_settled(self, timestamp: float) -> bool:
+        """Whether data at ``timestamp``, in epoch seconds, is old enough to be final."""
+        return timestamp <= self._clock() - self.config.settle_time.total_seconds()
+
+    def mark_ended(self, flight_ids: Iterable[str]) -> None:
+        for flight_id in flight_ids:
+            self.backend.set(_ended_key(flight_id), CacheEntry(value=b'', stored_at=self._clock()))
+
+    def has_ended(self, flight_ids: Iterable[str]) -> bool:
+        """Whether all of the flights are known to have ended."""
+        return all(self.backend.get(_ended_key(flight_id)) is not None for flight_id in flight_ids)
+
+    def positions_are_final(self, request: HistoricFlightPositionRequest, positions: Any) -> bool:
+        return self.is_settled(request.timestamp.timestamp())
+
+    def summaries_are_final(self, request: FlightSummaryRequest, summaries: List[FlightSummaryLight]) -> bool:
+        """
+        Remember the flights that ended, and whether the summaries can be cached because all of them did.
+
+        A time range must also have settled, otherwise flights that have yet to take off inside it would be missed.
+        """
+        self.mark_ended(summary.fr24_id for summary in summaries if summary.flight_ended)
+        if not summaries or not all(summary.flight_ended for summary in summaries):
+            return False
+        if request.flight_ids:
+            return True
+
+        return request.flight_datetime_to is not None and self.is_settled(request.flight_datetime_to.timestamp())
+
+    def tracks_are_final(self, request: FlightTrackRequest, tracks: Any) -> bool:
+        return self.has_ended([request.flight_id])
+
+    def events_are_final(self, request: HistoricFlightEventRequest, entries: Any) -> bool:
+        return self.has_ended(request.flight_ids)
+
+    def endpoint_stats(self) -> dict[str, CacheStats]:
+        """
+        Statistics of every endpoint, reporting them to the metrics sink as well.
+
+        Returns:
+            dict[str, CacheStats]: Statistics keyed by endpoint path
+        """
+        entries = ((_endpoint(key), size, stored_at) for key, size, stored_at in self.backend.entries())
+        return self._stats.snapshot(entries, self._clock())
+
+    def close(self) -> None:
+        self.backend.close()
@@ -0,0 +1,232 @@
+import asyncio
+import math
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, List, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.cache import CacheStats, CacheStatsRecorder
+from flight_radar.metrics import MetricsSink
+from flight_radar.models import FlightPositionLight, LiveFlightPositionRequest
+from flight_radar.models.flight_position import FlightPositionBaseRequest
+from flight_radar.services.tiling import WORLD_BOUNDS, Bounds, TilingConfig
+
+P = TypeVar('P', bound=FlightPositionLight)
+
+# Filters that can be applied to decoded positions. Positions do not carry their category, so requests filtering
+# on categories are answered from a snapshot fetched with the same categories.
+LOCAL_FILTERS = frozenset({'bounds', 'altitude_ranges', 'gspeed', 'squawks', 'categories'})
+
+
+class LiveSnapshotConfig(BaseModel):
+    bounds: Bounds = Field(
+        description='Region the snapshot holds, as north, south, west and east. Requests inside it are served locally.',
+    )
+    max_age: float = Field(description='Seconds a snapshot is used before it is fetched again.', default=5.0, gt=0)
+    cell_size: float = Field(description='Side of the cells of the spatial index, in degrees.', default=1.0, gt=0)
+    tiling: TilingConfig = Field(description='Tiling used to fetch the snapshot.', default_factory=TilingConfig)
+
+
+class LiveSnapshotStats(BaseModel):
+    hits: int = Field(description='Requests answered from a snapshot that was already fetched.', default=0)
+    refreshes: int = Field(description='Snapshots fetched from the API.', default=0)
+    bypassed: int = Field(description='Requests sent upstream because a snapshot could not answer them.', default=0)
+
+
+def _endpoint(variant: str) -> str:
+    return f'/live/flight-positions/{variant}'
+
+
+def _inside(inner: Bounds, outer: Bounds) -> bool:
+    return outer[1] <= inner[1] <= inner[0] <= outer[0] and outer[2] <= inner[2] <= inner[3] <= outer[3]
+
+
+class LiveSnapshot(Generic[P]):
+    """Decoded positions of a region, indexed on a grid of ``cell_size`` degrees."""
+
+    def __init__(self, positions: Iterable[P], bounds: Bounds, fetched_at: float, cell_size: float):
+        self.bounds = bounds
+        self.fetched_at = fetched_at
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[P]] = defaultdict(list)
+        for position in positions:
+            self.cells[self._cell(position.lat, position.lon)].append(position)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lon / self.cell_size)
+
+    def __len__(self) -> int:
+        return sum(len(cell) for cell in self.cells.values())
+
+    def query(self, request: LiveFlightPositionRequest) -> List[P]:
+        """Positions matching the bounds, altitude ranges, ground speed and squawks of ``request``."""
+        north, south, west, east = request.bounds or self.bounds
+        top, left = self._cell(north, west)
+        bottom, right = self._cell(south, east)
+        squawks = set(request.squawks) if request.squawks else None
+        # A ground speed of 0 is not sent upstream either, so it does not filter
+        if isinstance(request.gspeed, tuple):
+            slowest, fastest = request.gspeed
+        elif request.gspeed:
+            slowest = fastest = request.gspeed
+
+        positions = []
+        for row in range(bottom, top + 1):
+            for column in range(left, right + 1):
+                for position in self.cells.get((row, column), ()):
+                    if not (south <= position.lat <= north and west <= position.lon <= east):
+                        continue
+                    if request.altitude_ranges and not any(
+                        low <= position.alt <= high for low, high in request.altitude_ranges
+                    ):
+                        continue
+                    if request.gspeed and not slowest <= position.gspeed <= fastest:
+                        continue
+                    if squawks is not None and position.squawk not in squawks:
+                        continue
+                    positions.append(position)
+
+        return positions[: request.limit] if request.limit else positions
+
+
+class LiveSnapshotCache:
+    """
+    Micro-cache answering live position requests from a shared snapshot of a region.
+
+    The snapshot is fetched tiled, so it is complete even beyond the per-request limit, and is used for
+    ``config.max_age`` seconds. Requests that fall inside the region and only filter on bounds, altitude ranges,
+    ground speed, squawks and categories are filtered locally; any other request is sent upstream. Callers arriving
+    while a snapshot is being fetched wait for it instead of fetching their own.
+    """
+
+    def __init__(
+        self,
+        config: LiveSnapshotConfig,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: MetricsSink | None = None,
+    ):
+        """
+        Args:
+            config: Cache configuration, holding the region of the snapshot
+            clock: Monotonic clock in seconds
+            metrics: Sink the statistics are reported to, tagged with ``cache=live_snapshot``
+        """
+        self.config = config
+        self._clock = clock
+        self._snapshots: dict[Hashable, LiveSnapshot] = {}
+        self._locks: dict[Hashable, threading.Lock] = defaultdict(threading.Lock)
+        # asyncio locks belong to the loop they are first used on, so every loop gets its own
+        self._async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Lock]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._stats = CacheStatsRecorder('live_snapshot', metrics)
+
+    def covers(self, request: LiveFlightPositionRequest) -> bool:
+        """Whether ``request`` can be answered from a snapshot."""
+        for name in FlightPositionBaseRequest.model_fields:
+            if name not in LOCAL_FILTERS and getattr(request, name) is not None:
+                return False
+
+        return _inside(request.bounds or WORLD_BOUNDS, self.config.bounds)
+
+    @staticmethod
+    def key(variant: str, request: LiveFlightPositionRequest) -> Hashable:
+        categories = tuple(sorted({category.value for category in request.categories or ()}))
+        return variant, categories
+
+    def snapshot_request(self, request: LiveFlightPositionRequest) -> LiveFlightPositionRequest:
+        """Request fetching the whole snapshot region with the categories of ``request``."""
+        return LiveFlightPositionRequest(bounds=self.config.bounds, categories=request.categories)
+
+    def _fresh(self, key: Hashable) -> LiveSnapshot | None:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or self._clock() - snapshot.fetched_at >= self.config.max_age:
+            return None
+
+        return snapshot
+
+    def _store(self, key: Hashable, positions: List[P]) -> LiveSnapshot[P]:
+        snapshot = LiveSnapshot(positions, self.config.bounds, self._clock(), self.config.cell_size)
+        self._snapshots[key] = snapshot
+        self._stats.record(_endpoint(key[0]), 'misses')
+        return snapshot
+
+    def _thread_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._locks[key]
+
+    def _async_lock(self, key: Hashable) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._async_locks.setdefault(loop, {}).setdefault(key, asyncio.Lock())
+
+    def bypass(self, variant: str) -> None:
+        """Count a request of ``variant`` that was sent upstream because the cache does not cover it."""
+        self._stats.record(_endpoint(variant), 'bypassed')
+
+    def get(self, key: Hashable, request: LiveFlightPositionRequest, load: Callable[[], List[P]]) -> List[P]:
+        """
+        Answer ``request`` from the snapshot under ``key``, calling ``load`` to fetch it when it is stale.
+
+        Args:
+            key: Snapshot key, see ``key``
+            request: Request to answer, it must be covered by the cache
+            load: Function fetching the positions of ``snapshot_request(request)``
+
+        Returns:
+            List[P]: Positions matching the request
+        """
+        snapshot = self._fresh(key)
+        if snapshot is None:
+            with self._thread_lock(key):
+                snapshot = self._fresh(key)
+                if snapshot is None:
+                    return self._store(key, load()).query(request)
+
+        self._stats.record(_endpoint(key[0]), 'hits')
+        return snapshot.query(request)
+
+    async def get_async(
+        self, key: Hashable, request: LiveFlightPositionRequest, load: Callable[[], Awaitable[List[P]]]
+    ) -> List[P]:
+        """Asyncio variant of ``get``."""
+        snapshot = self._fresh(key)
+        if snapshot is None:
+            async with self._async_lock(key):
+                snapshot = self._fresh(key)
+                if snapshot is None:
+                    return self._store(key, await load()).query(request)
+
+        self._stats.record(_endpoint(key[0]), 'hits')
+        return snapshot.query(request)
+
+    def stats(self) -> LiveSnapshotStats:
+        """Requests of both variants added up, see ``endpoint_stats`` for the statistics of each."""
+        counters = self._stats.counters().values()
+        return LiveSnapshotStats(
+            hits=sum(stats.hits for stats in counters),
+            refreshes=sum(stats.misses for stats in counters),
+            bypassed=sum(stats.bypassed for stats in counters),
+        )
+
+    def endpoint_stats(self) -> dict[str, CacheStats]:
+        """
+        Statistics of the light and full variants, reporting them to the metrics sink as well. Snapshots are counted
+        as entries; as they hold decoded models, no bytes are reported for them.
+
+        Returns:
+            dict[str, CacheStats]: Statistics keyed by endpoint path, refreshed snapshots counted as misses
+        """
+        entries = [(_endpoint(key[0]), 0, snapshot.fetched_at) for key, snapshot in list(self._snapshots.items())]
+        return self._stats.snapshot(entries, self._clock())
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def close(self) -> None:
+        # Snapshots hold no connections or threads, closing only releases them
+        self.clear()
@@ -0,0 +1,290 @@
+import math
+from datetime import datetime
+from typing import Iterable
+
+from pydantic import BaseModel, Field
+
+from flight_radar.clients.endpoints import get_endpoint_family
+from flight_radar.clients.rate_limiter import RateLimiter
+from flight_radar.models import (
+    FlightSummaryCountRequest,
+    FlightSummaryRequest,
+    HistoricFlightPositionCountRequest,
+    HistoricFlightPositionRequest,
+    LiveFlightPositionCountRequest,
+    LiveFlightPositionRequest,
+)
+from flight_radar.models.common import MAX_LIST_LENGTH
+from flight_radar.models.flight_position import MAX_LIMIT, FlightPositionBaseRequest
+from flight_radar.models.flight_summary import MAX_FLIGHT_SUMMARY_LIMIT, FlightSummaryBaseRequest
+from flight_radar.services.tiling import TilingConfig, plan_tiles, plan_tiles_async
+from flight_radar.services.windowing import WindowingConfig, plan_windows, plan_windows_async
+
+# Rough figures for the published plans. Check the credit usage of your own plan and override them in PlannerConfig.
+DEFAULT_CREDITS_PER_ROW = {
+    '/live/flight-positions/light': 6,
+    '/live/flight-positions/full': 8,
+    '/historic/flight-positions/light': 6,
+    '/historic/flight-positions/full': 8,
+    '/flight-summary/light': 2,
+    '/flight-summary/full': 3,
+    '/flight-tracks': 40,
+    '/historic/flight-events/light': 2,
+    '/historic/flight-events/full': 3,
+}
+
+
+class PlannerConfig(BaseModel):
+    credits_per_row: dict[str, float] = Field(
+        description='Credits charged per returned row, keyed by endpoint path.',
+        default_factory=lambda: dict(DEFAULT_CREDITS_PER_ROW),
+    )
+    request_latency: float = Field(description='Expected round trip of one request in seconds.', default=0.5, ge=0)
+    row_latency: float = Field(
+        description='Expected transfer and decoding time per returned row in seconds.',
+        default=0.00002,
+        ge=0,
+    )
+    max_workers: int = Field(description='Number of sub-requests expected to run at once.', default=8, ge=1)
+
+
+class QueryPlan(BaseModel):
+    endpoint: str = Field(description='Path of the endpoint the query reads from.')
+    expected_rows: int = Field(description='Rows the query is expected to return.')
+    expected_credits: float = Field(description='Credits the query is expected to cost.')
+    sub_requests: int = Field(description='Requests sent to run the query, after tiling, windowing or chunking.')
+    count_requests: int = Field(description='Count requests the planner sent to size the query.')
+    estimated_seconds: float = Field(description='Estimated wall-clock time of the query in seconds.')
+
+
+def estimate(
+    endpoint: str,
+    expected_rows: int,
+    sub_requests: int,
+    count_requests: int,
+    config: PlannerConfig,
+    rate_limiter: RateLimiter | None = None,
+) -> QueryPlan:
+    """
+    Turn the size of a query into its expected cost and duration.
+
+    The duration is the larger of the time needed to run the sub-requests ``config.max_workers`` at a time, and
+    the time the rate limiter needs to let them all through.
+    """
+    waves = math.ceil(sub_requests / config.max_workers)
+    seconds = waves * config.request_latency + expected_rows * config.row_latency / min(
+        sub_requests or 1, config.max_workers
+    )
+    if rate_limiter is not None:
+        seconds = max(seconds, sub_requests * 60 / rate_limiter.requests_per_minute(get_endpoint_family(endpoint)))
+
+    return QueryPlan(
+        endpoint=endpoint,
+        expected_rows=expected_rows,
+        expected_credits=expected_rows * config.credits_per_row.get(endpoint, 0),
+        sub_requests=sub_requests,
+        count_requests=count_requests,
+        estimated_seconds=seconds,
+    )
+
+
+def _variant(light: bool) -> str:
+    return 'light' if light else 'full'
+
+
+def _filters(request: BaseModel, base: type[BaseModel]) -> dict:
+    return {name: getattr(request, name) for name in base.model_fields}
+
+
+class QueryPlanner:
+    """
+    Dry-run planner that estimates rows, credits, sub-requests and duration of a query before running it.
+
+    Only count requests are sent, which are cheap compared to the queries they size.
+    """
+
+    def __init__(self, client, config: PlannerConfig | None = None):
+        """
+        Args:
+            client: FlightRadarClient the queries would run on
+            config: Credits table and latency model
+        """
+        self.client = client
+        self.config = config or PlannerConfig()
+
+    def _estimate(self, endpoint: str, expected_rows: int, sub_requests: int, count_requests: int) -> QueryPlan:
+        return estimate(
+            endpoint, expected_rows, sub_requests, count_requests, self.config, self.client.api_client.rate_limiter
+        )
+
+    def plan_live_flight_positions(
+        self, request: LiveFlightPositionRequest, light: bool = False, tiling: TilingConfig | None = None
+    ) -> QueryPlan:
+        """
+        Plan a live flight positions query
+
+        Args:
+            request: LiveFlightPositionRequest
+            light: Plan the light variant of the endpoint
+            tiling: Plan the tiled query with this configuration instead of a single request
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        endpoint = f'/live/flight-positions/{_variant(light)}'
+        if tiling is None:
+            count = self.client.get_live_flight_position_count(
+                LiveFlightPositionCountRequest(**_filters(request, FlightPositionBaseRequest))
+            )
+            return self._estimate(endpoint, min(count.record_count, request.limit or MAX_LIMIT), 1, 1)
+
+        counted = []
+
+        def count(count_request: LiveFlightPositionCountRequest):
+            counted.append(count_request)
+            return self.client.get_live_flight_position_count(count_request)
+
+        tiles = plan_tiles(count, request, tiling)
+        rows = sum(tiles.values())
+        return self._estimate(endpoint, min(rows, request.limit) if request.limit else rows, len(tiles), len(counted))
+
+    def plan_historic_positions(self, request: HistoricFlightPositionRequest, light: bool = False) -> QueryPlan:
+        """
+        Plan a historic flight positions query
+
+        Args:
+            request: HistoricFlightPositionRequest
+            light: Plan the light variant of the endpoint
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        count = self.client.get_historic_positions_count(
+            HistoricFlightPositionCountRequest(
+                **_filters(request, FlightPositionBaseRequest), timestamp=request.timestamp
+            )
+        )
+        endpoint = f'/historic/flight-positions/{_variant(light)}'
+        return self._estimate(endpoint, min(count.record_count, request.limit or MAX_LIMIT), 1, 1)
+
+    def plan_flight_summary(self, request: FlightSummaryRequest, light: bool = False) -> QueryPlan:
+        """
+        Plan a flight summary query
+
+        Args:
+            request: FlightSummaryRequest
+            light: Plan the light variant of the endpoint
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        count = self.client.get_flight_summary_count(
+            FlightSummaryCountRequest(**_filters(request, FlightSummaryBaseRequest))
+        )
+        endpoint = f'/flight-summary/{_variant(light)}'
+        return self._estimate(endpoint, min(count.record_count, request.limit or MAX_FLIGHT_SUMMARY_LIMIT), 1, 1)
+
+    def plan_flight_summary_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        light: bool = False,
+        config: WindowingConfig | None = None,
+        **filters,
+    ) -> QueryPlan:
+        """
+        Plan a windowed flight summary query, see ``FlightRadarClient.get_flight_summary_windowed``
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        counted = []
+
+        def count(count_request: FlightSummaryCountRequest):
+            counted.append(count_request)
+            return self.client.get_flight_summary_count(count_request)
+
+        windows = plan_windows(count, flight_datetime_from, flight_datetime_to, config or WindowingConfig(), **filters)
+        rows = sum(min(record_count, MAX_FLIGHT_SUMMARY_LIMIT) for record_count in windows.values())
+        return self._estimate(f'/flight-summary/{_variant(light)}', rows, len(windows), len(counted))
+
+    def plan_flight_tracks(self, flight_ids: Iterable[str]) -> QueryPlan:
+        """
+        Plan fetching the tracks of flights, one request per flight
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        flights = len(set(flight_ids))
+        return self._estimate('/flight-tracks', flights, flights, 0)
+
+    def plan_historic_flight_events(self, flight_ids: Iterable[str], light: bool = False) -> QueryPlan:
+        """
+        Plan fetching the events of flights in chunks of 15, see ``FlightRadarClient.get_historic_flight_events_bulk``
+
+        Returns:
+            QueryPlan: Expected size, cost and duration
+        """
+        flights = len(set(flight_ids))
+        endpoint = f'/historic/flight-events/{_variant(light)}'
+        return self._estimate(endpoint, flights, math.ceil(flights / MAX_LIST_LENGTH), 0)
+
+
+class AsyncQueryPlanner(QueryPlanner):
+    """Asyncio counterpart of ``QueryPlanner``, planning queries on an ``AsyncFlightRadarClient``."""
+
+    async def plan_live_flight_positions(
+        self, request: LiveFlightPositionRequest, light: bool = False, tiling: TilingConfig | None = None
+    ) -> QueryPlan:
+        endpoint = f'/live/flight-positions/{_variant(light)}'
+        if tiling is None:
+            count = await self.client.get_live_flight_position_count(
+                LiveFlightPositionCountRequest(**_filters(request, FlightPositionBaseRequest))
+            )
+            return self._estimate(endpoint, min(count.record_count, request.limit or MAX_LIMIT), 1, 1)
+
+        counted = []
+
+        async def count(count_request: LiveFlightPositionCountRequest):
+            counted.append(count_request)
+            return await self.client.get_live_flight_position_count(count_request)
+
+        tiles = await plan_tiles_async(count, request, tiling)
+        rows = sum(tiles.values())
+        return self._estimate(endpoint, min(rows, request.limit) if request.limit else rows, len(tiles), len(counted))
+
+    async def plan_historic_positions(self, request: HistoricFlightPositionRequest, light: bool = False) -> QueryPlan:
+        count = await self.client.get_historic_positions_count(
+            HistoricFlightPositionCountRequest(
+                **_filters(request, FlightPositionBaseRequest), timestamp=request.timestamp
+            )
+        )
+        endpoint = f'/historic/flight-positions/{_variant(light)}'
+        return self._estimate(endpoint, min(count.record_count, request.limit or MAX_LIMIT), 1, 1)
+
+    async def plan_flight_summary(self, request: FlightSummaryRequest, light: bool = False) -> QueryPlan:
+        count = await self.client.get_flight_summary_count(
+            FlightSummaryCountRequest(**_filters(request, FlightSummaryBaseRequest))
+        )
+        endpoint = f'/flight-summary/{_variant(light)}'
+        return self._estimate(endpoint, min(count.record_count, request.limit or MAX_FLIGHT_SUMMARY_LIMIT), 1, 1)
+
+    async def plan_flight_summary_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        light: bool = False,
+        config: WindowingConfig | None = None,
+        **filters,
+    ) -> QueryPlan:
+        counted = []
+
+        async def count(count_request: FlightSummaryCountRequest):
+            counted.append(count_request)
+            return await self.client.get_flight_summary_count(count_request)
+
+        windows = await plan_windows_async(
+            count, flight_datetime_from, flight_datetime_to, config or WindowingConfig(), **filters
+        )
+        rows = sum(min(record_count, MAX_FLIGHT_SUMMARY_LIMIT) for record_count in windows.values())
+        return self._estimate(f'/flight-summary/{_variant(light)}', rows, len(windows), len(counted))
@@ -0,0 +1,85 @@
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
+from pydantic import BaseModel, create_model
+
+from flight_radar.models import FlightPosition, FlightPositionLight, FlightSummary, FlightSummaryLight
+from flight_radar.models.historic_flight_event import (
+    HistoricFlightEventLightResponseEntry,
+    HistoricFlightEventResponseEntry,
+)
+
+
+class EndpointVariant(NamedTuple):
+    url: str
+    model: type[BaseModel]
+
+
+# Variants of each endpoint, cheapest first
+LIVE_FLIGHT_POSITIONS = (
+    EndpointVariant('/live/flight-positions/light', FlightPositionLight),
+    EndpointVariant('/live/flight-positions/full', FlightPosition),
+)
+HISTORIC_FLIGHT_POSITIONS = (
+    EndpointVariant('/historic/flight-positions/light', FlightPositionLight),
+    EndpointVariant('/historic/flight-positions/full', FlightPosition),
+)
+FLIGHT_SUMMARY = (
+    EndpointVariant('/flight-summary/light', FlightSummaryLight),
+    EndpointVariant('/flight-summary/full', FlightSummary),
+)
+HISTORIC_FLIGHT_EVENTS = (
+    EndpointVariant('/historic/flight-events/light', HistoricFlightEventLightResponseEntry),
+    EndpointVariant('/historic/flight-events/full', HistoricFlightEventResponseEntry),
+)
+
+
+def select_variant(variants: Iterable[EndpointVariant], fields: Iterable[str]) -> EndpointVariant:
+    """
+    Pick the cheapest endpoint variant whose model holds every requested field.
+
+    Raises:
+        ValueError: No variant holds all of the fields
+    """
+    requested = set(fields)
+    variants = list(variants)
+    for variant in variants:
+        if requested <= variant.model.model_fields.keys():
+            return variant
+
+    unknown = requested - variants[-1].model.model_fields.keys()
+    raise ValueError(f'Unknown fields for {variants[-1].url}: {", ".join(sorted(unknown))}')
+
+
+@lru_cache(maxsize=None)
+def projected_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """
+    Model holding only ``fields`` of ``model``, validated exactly like the original fields.
+
+    Keys of the payload outside of ``fields`` are skipped while decoding, so no objects are built for them.
+    """
+    return create_model(
+        f'{model.__name__}Projection',
+        **{name: (field.annotation, field) for name, field in model.model_fields.items() if name in fields},
+    )
+
+
+@lru_cache(maxsize=None)
+def projected_response(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Response envelope decoding the ``data`` list of a payload straight into ``projected_model``."""
+    return create_model(f'{model.__name__}ProjectionResponse', data=(list[projected_model(model, fields)], ...))
+
+
+def resolve(variants: Iterable[EndpointVariant], fields: Iterable[str]) -> tuple[str, type[BaseModel]]:
+    """
+    Endpoint to call and response envelope to decode with for a projection.
+
+    Returns:
+        tuple[str, type[BaseModel]]: URL of the cheapest variant covering ``fields`` and its projected envelope
+    """
+    fields = frozenset(fields)
+    if not fields:
+        raise ValueError('At least one field must be requested')
+
+    variant = select_variant(variants, fields)
+    return variant.url, projected_response(variant.model, fields)
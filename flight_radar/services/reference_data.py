@@ -0,0 +1,354 @@
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.cache import CacheBackend, CacheEntry, CacheStats, CacheStatsRecorder, MemoryCache, SharedSQLiteCache
+from flight_radar.errors import NotFoundError
+from flight_radar.metrics import MetricsSink
+
+M = TypeVar('M', bound=BaseModel)
+
+
+class ReferenceDataConfig(BaseModel):
+    ttl: timedelta = Field(
+        description='How long airports and airlines are served from the cache.', default=timedelta(days=30)
+    )
+    negative_ttl: timedelta = Field(
+        description="""How long a code the API answered with 404 is answered with ``NotFoundError`` from the cache.
+        Zero disables negative caching.""",
+        default=timedelta(hours=1),
+    )
+    stale_while_revalidate: timedelta = Field(
+        description="""How long after ``ttl`` a model is still returned immediately, while a fresh one is fetched in
+        the background.""",
+        default=timedelta(0),
+    )
+    stale_if_error: timedelta = Field(
+        description="""How long after ``ttl`` a model is returned instead of raising when the API fails, rate limits
+        the client, times out or its circuit is open.""",
+        default=timedelta(days=7),
+    )
+    max_entries: int = Field(description='Number of decoded models kept in memory.', default=10000, ge=1)
+    path: Path | None = Field(
+        description='SQLite database backing the in-memory cache, so entries survive restarts. None keeps memory only.',
+        default=None,
+    )
+
+
+class ReferenceDataStats(BaseModel):
+    hits: int = Field(description='Lookups answered with a cached model.', default=0)
+    negative_hits: int = Field(description='Lookups answered with a cached ``NotFoundError``.', default=0)
+    misses: int = Field(description='Lookups that had to go to the API.', default=0)
+
+
+def reference_key(kind: str, code: str) -> str:
+    """Cache key of an airport or airline. Codes are case-insensitive."""
+    return f'{kind}:{code.upper()}'
+
+
+def _kind(key: str) -> str:
+    return key.partition(':')[0]
+
+
+class ReferenceDataCache:
+    """
+    Two-tier cache of airports and airlines.
+
+    Decoded models are kept in an in-process LRU, so hits cost a dict lookup. Behind it, models are stored as JSON
+    in an optional persistent backend, from which the LRU is refilled after a restart. Expired models are kept, so
+    ``get_or_fetch`` can fall back to them while they are refreshed or when the API fails.
+    """
+
+    def __init__(
+        self,
+        config: ReferenceDataConfig | None = None,
+        disk: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+        metrics: MetricsSink | None = None,
+    ):
+        """
+        Args:
+            config: Cache configuration
+            disk: Persistent backend, defaults to a ``SharedSQLiteCache`` at ``config.path`` when one is set
+            clock: Wall clock in epoch seconds
+            metrics: Sink the statistics are reported to, tagged with ``cache=reference_data``
+        """
+        self.config = config or ReferenceDataConfig()
+        self.memory = MemoryCache(self.config.max_entries)
+        if disk is None and self.config.path is not None:
+            disk = SharedSQLiteCache(self.config.path)
+        self.disk = disk
+        self._clock = clock
+        self._endpoint_stats = CacheStatsRecorder('reference_data', metrics)
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        self._refresh_tasks: set[asyncio.Task] = set()
+        # Entries only disappear for good when the last tier evicts them
+        self._store.add_eviction_listener(lambda key, size: self._endpoint_stats.record(_kind(key), 'evictions'))
+
+    @property
+    def _store(self) -> CacheBackend:
+        return self.memory if self.disk is None else self.disk
+
+    def _fresh_in_memory(self, key: str) -> CacheEntry | None:
+        entry = self.memory.get(key)
+        return entry if entry is not None and entry.is_fresh(self._clock()) else None
+
+    def _lookup(self, key: str, model_class: type[M]) -> CacheEntry | None:
+        """The entry of ``key``, whether fresh or not, preferring the persistent tier over expired memory."""
+        entry = self.memory.get(key)
+        if self.disk is None or (entry is not None and entry.is_fresh(self._clock())):
+            return entry
+
+        stored = self.disk.get(key)
+        if stored is None:
+            return entry
+
+        # Negative entries keep the arguments of the error, so it can be raised again as it was
+        value = tuple(json.loads(stored.value)) if stored.negative else model_class.model_validate_json(stored.value)
+        entry = stored.model_copy(update={'value': value})
+        self.memory.set(key, entry)
+        return entry
+
+    def _count(self, key: str, stat: str) -> None:
+        self._endpoint_stats.record(_kind(key), stat)
+
+    def get(self, key: str, model_class: type[M]) -> M | None:
+        """
+        Look up a fresh model.
+
+        Args:
+            key: Cache key, see ``reference_key``
+            model_class: Model the value was stored as
+
+        Returns:
+            M | None: The cached model, or None when it is missing or expired
+
+        Raises:
+            NotFoundError: When the API recently answered the same lookup with a 404
+        """
+        entry = self._lookup(key, model_class)
+        if entry is None or not entry.is_fresh(self._clock()):
+            self._count(key, 'misses')
+            return None
+
+        return self._serve(key, entry)
+
+    def _serve(self, key: str, entry: CacheEntry) -> Any:
+        if entry.negative:
+            self._count(key, 'negative_hits')
+            raise NotFoundError(*entry.value)
+
+        self._count(key, 'hits')
+        return entry.value
+
+    def _stale_for(self, entry: CacheEntry | None, window: timedelta) -> bool:
+        """Whether an expired model, never a remembered 404, is still within ``window`` past its expiry."""
+        if entry is None or entry.negative or window <= timedelta(0):
+            return False
+
+        return self._clock() < entry.expires_at + window.total_seconds()
+
+    def _start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+
+            self._refreshing.add(key)
+            return True
+
+    def _store_fetched(self, key: str, fetch: Callable[[], M]) -> M:
+        try:
+            model = fetch()
+        except NotFoundError as e:
+            self.set_missing(key, e)
+            raise
+        self.set(key, model)
+        return model
+
+    def _refresh(self, key: str, fetch: Callable[[], M]) -> None:
+        try:
+            self._store_fetched(key, fetch)
+        except Exception:
+            # The stale model keeps being served until its window runs out, the next lookup retries the refresh
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        model_class: type[M],
+        fetch: Callable[[], M],
+        may_serve_stale: Callable[[Exception], bool],
+    ) -> M:
+        """
+        Answer a lookup from the cache, calling ``fetch`` when the model is missing or expired.
+
+        Within ``config.stale_while_revalidate`` of its expiry, an expired model is returned right away and fetched
+        again in a background thread. Within ``config.stale_if_error``, it is returned instead of the errors
+        ``may_serve_stale`` accepts. A ``NotFoundError`` is remembered for ``config.negative_ttl``.
+
+        Args:
+            key: Cache key, see ``reference_key``
+            model_class: Model the value is stored as
+            fetch: Function fetching the model from the API
+            may_serve_stale: Whether an error of ``fetch`` may be answered with an expired model
+
+        Returns:
+            M: The cached or fetched model
+
+        Raises:
+            NotFoundError: When the API answers, or recently answered, the lookup with a 404
+        """
+        entry = self._lookup(key, model_class)
+        if entry is not None and entry.is_fresh(self._clock()):
+            return self._serve(key, entry)
+
+        if self._stale_for(entry, self.config.stale_while_revalidate):
+            if self._start_refresh(key):
+                with self._lock:
+                    if self._refresh_executor is None:
+                        self._refresh_executor = ThreadPoolExecutor(
+                            max_workers=2, thread_name_prefix='flight-radar-reference-refresh'
+                        )
+                # Worker threads do not inherit the deadline of the caller, which the refresh must outlive
+                self._refresh_executor.submit(self._refresh, key, fetch)
+            self._count(key, 'stale_hits')
+            return entry.value
+
+        self._count(key, 'misses')
+        try:
+            return self._store_fetched(key, fetch)
+        except NotFoundError:
+            raise
+        except Exception as e:
+            if may_serve_stale(e) and self._stale_for(entry, self.config.stale_if_error):
+                self._count(key, 'stale_hits')
+                return entry.value
+            raise
+
+    async def _offload(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run ``function`` in a worker thread when it may touch the persistent tier."""
+        if self.disk is None:
+            return function(*args)
+
+        return await asyncio.to_thread(function, *args)
+
+    async def _store_fetched_async(self, key: str, fetch: Callable[[], Awaitable[M]]) -> M:
+        try:
+            model = await fetch()
+        except NotFoundError as e:
+            await self._offload(self.set_missing, key, e)
+            raise
+        await self._offload(self.set, key, model)
+        return model
+
+    async def _refresh_async(self, key: str, fetch: Callable[[], Awaitable[M]]) -> None:
+        try:
+            await self._store_fetched_async(key, fetch)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def get_or_fetch_async(
+        self,
+        key: str,
+        model_class: type[M],
+        fetch: Callable[[], Awaitable[M]],
+        may_serve_stale: Callable[[Exception], bool],
+    ) -> M:
+        """Asyncio variant of ``get_or_fetch``. Work on the persistent tier runs in a worker thread."""
+        entry = self._fresh_in_memory(key) or await self._offload(self._lookup, key, model_class)
+        if entry is not None and entry.is_fresh(self._clock()):
+            return self._serve(key, entry)
+
+        if self._stale_for(entry, self.config.stale_while_revalidate):
+            if self._start_refresh(key):
+                # A fresh context keeps the refresh from being bound by the deadline of the caller
+                task = asyncio.get_running_loop().create_task(
+                    self._refresh_async(key, fetch), context=contextvars.Context()
+                )
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            self._count(key, 'stale_hits')
+            return entry.value
+
+        self._count(key, 'misses')
+        try:
+            return await self._store_fetched_async(key, fetch)
+        except NotFoundError:
+            raise
+        except Exception as e:
+            if may_serve_stale(e) and self._stale_for(entry, self.config.stale_if_error):
+                self._count(key, 'stale_hits')
+                return entry.value
+            raise
+
+    def set(self, key: str, model: BaseModel) -> None:
+        """Store a model in both tiers for ``config.ttl``."""
+        now = self._clock()
+        entry = CacheEntry(value=model, stored_at=now, expires_at=now + self.config.ttl.total_seconds())
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            self.disk.set(key, entry.model_copy(update={'value': model.model_dump_json().encode()}))
+
+    def set_missing(self, key: str, error: NotFoundError) -> None:
+        """Remember for ``config.negative_ttl`` that the API answered a lookup with ``error``."""
+        ttl = self.config.negative_ttl.total_seconds()
+        if ttl <= 0:
+            return
+
+        now = self._clock()
+        entry = CacheEntry(value=error.args, stored_at=now, expires_at=now + ttl, negative=True)
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            payload = json.dumps(error.args, default=str).encode()
+            self.disk.set(key, entry.model_copy(update={'value': payload}))
+
+    def stats(self) -> ReferenceDataStats:
+        """Lookups of all kinds added up, see ``endpoint_stats`` for the statistics of each kind."""
+        counters = self._endpoint_stats.counters().values()
+        return ReferenceDataStats(
+            **{name: sum(getattr(stats, name) for stats in counters) for name in ReferenceDataStats.model_fields}
+        )
+
+    def endpoint_stats(self) -> dict[str, CacheStats]:
+        """
+        Statistics of every kind of lookup, such as ``airports/full``, reporting them to the metrics sink as well.
+
+        Returns:
+            dict[str, CacheStats]: Statistics keyed by lookup kind
+        """
+        entries = ((_kind(key), size, stored_at) for key, size, stored_at in self._store.entries())
+        return self._endpoint_stats.snapshot(entries, self._clock())
+
+    def invalidate(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True)
+        if self.disk is not None:
+            self.disk.close()
@@ -1,4 +1,7 @@
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, List, TypeVar
+
+from pydantic import BaseModel
 
 from flight_radar.clients.api_client import FlightRadarApiClient
 from flight_radar.dtos import (
@@ -20,6 +23,7 @@ from flight_radar.dtos import (
     HistoricFlightEventResponseDto,
 )
 
+from flight_radar.enums.enums import HistoricFlightEventTypes
 from flight_radar.models import (
     Airline,
     Airport,
@@ -43,12 +47,165 @@ from flight_radar.models import (
     HistoricFlightEventRequest,
     HistoricFlightEventResponseEntry,
 )
+from flight_radar.models.responses import (
+    FlightPositionLightResponse,
+    FlightPositionResponse,
+    FlightSummaryLightResponse,
+    FlightSummaryResponse,
+    FlightTrackResponse,
+    HistoricFlightEventLightResponse,
+    HistoricFlightEventResponse,
+)
 from flight_radar.services.base import BaseFlightRadarClient
+from flight_radar.services.batch import BatchResult, map_in_threads
+from flight_radar.services.bulk_events import BulkEventStream, stream_events
+from flight_radar.services.fan_out import fan_out, merge_summaries, split_request
+from flight_radar.services.historic_cache import HistoricResultCache
+from flight_radar.services.live_snapshot import LiveSnapshotCache
+from flight_radar.services.planner import PlannerConfig, QueryPlanner
+from flight_radar.services.projection import (
+    FLIGHT_SUMMARY,
+    HISTORIC_FLIGHT_EVENTS,
+    HISTORIC_FLIGHT_POSITIONS,
+    LIVE_FLIGHT_POSITIONS,
+    resolve,
+)
+from flight_radar.services.reference_data import ReferenceDataCache, reference_key
+from flight_radar.services.sweep import PositionFrame, sweep
+from flight_radar.services.tiling import TilingConfig, fetch_tiled, merge_positions
+from flight_radar.services.windowing import WindowingConfig, fetch_windowed
+
+M = TypeVar('M', bound=BaseModel)
+P = TypeVar('P', bound=FlightPositionLight)
+R = TypeVar('R')
+T = TypeVar('T')
 
 
 class FlightRadarClient(BaseFlightRadarClient):
-    def __init__(self, api_client: FlightRadarApiClient):
+    def __init__(
+        self,
+        api_client: FlightRadarApiClient,
+        single_pass_decode: bool = False,
+        reference_data: ReferenceDataCache | None = None,
+        historic_cache: HistoricResultCache | None = None,
+        live_snapshot: LiveSnapshotCache | None = None,
+    ):
+        """
+        Args:
+            api_client: API client used to send the requests
+            single_pass_decode: Decode list responses straight into the public models, skipping the
+                intermediate DTOs and their ``from_dto`` mapping
+            reference_data: Cache answering airport and airline lookups
+            historic_cache: Cache of historic results that no longer change
+            live_snapshot: Shared snapshot answering live position requests inside its region
+        """
         self.api_client = api_client
+        self.single_pass_decode = single_pass_decode
+        self.reference_data = reference_data
+        self.historic_cache = historic_cache
+        self.live_snapshot = live_snapshot
+
+    def __enter__(self) -> 'FlightRadarClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def map(
+        self, method: Callable[[R], T], requests: Iterable[R], max_workers: int = 8, ordered: bool = True
+    ) -> Iterator[BatchResult[R, T]]:
+        """
+        Call a client method for many requests concurrently on a bounded thread pool
+
+        All calls share the connection pool and rate limiter of the API client, so keep ``max_workers`` within
+        the pool size. A failing call is reported in its result instead of aborting the batch.
+
+        Args:
+            method: Client method to call, e.g. ``client.get_flight_tracks``
+            requests: Arguments to call the method with, one call per item
+            max_workers: Number of calls in flight at once
+            ordered: Yield results in the order of ``requests`` instead of as soon as they complete
+
+        Returns:
+            Iterator[BatchResult]: One result per request, holding either the return value or the error
+        """
+        return map_in_threads(method, requests, max_workers, ordered)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP connection pool and every cache the client was given.
+
+        The client owns its caches, the response cache of its API client included, so a cache must not be shared
+        with a client that outlives this one.
+        """
+        self.api_client.close()
+        for cache in (self.reference_data, self.historic_cache, self.live_snapshot):
+            if cache is not None:
+                cache.close()
+
+    def planner(self, config: PlannerConfig | None = None) -> QueryPlanner:
+        """
+        Dry-run planner estimating the rows, credits, sub-requests and duration of a query before running it
+
+        Args:
+            config: Credits per row of each endpoint and the latency model used for the estimates
+
+        Returns:
+            QueryPlanner: Planner sending only count requests through this client
+        """
+        return QueryPlanner(self, config)
+
+    def _reference(self, kind: str, code: str, model_class: type[M], fetch: Callable[[str], M]) -> M:
+        if self.reference_data is None:
+            return fetch(code)
+
+        return self.reference_data.get_or_fetch(
+            reference_key(kind, code), model_class, lambda: fetch(code), self.api_client.may_serve_stale
+        )
+
+    def prewarm_airports(
+        self, codes: Iterable[str], light: bool = False, max_workers: int = 8
+    ) -> List[BatchResult[str, Airport | AirportLight]]:
+        """
+        Load airports into the reference data cache concurrently
+
+        Codes that are already cached are answered from the cache without a request.
+
+        Args:
+            codes: ICAO or IATA codes of the airports
+            light: Load the light variant, as returned by ``get_airports_light``
+            max_workers: Number of requests in flight at once
+
+        Returns:
+            List[BatchResult]: One result per code, holding either the airport or the error
+        """
+        return list(self.map(self.get_airports_light if light else self.get_airports, codes, max_workers))
+
+    def prewarm_airlines(self, codes: Iterable[str], max_workers: int = 8) -> List[BatchResult[str, Airline]]:
+        """
+        Load airlines into the reference data cache concurrently, see ``prewarm_airports``
+
+        Args:
+            codes: ICAO codes of the airlines
+            max_workers: Number of requests in flight at once
+
+        Returns:
+            List[BatchResult]: One result per code, holding either the airline or the error
+        """
+        return list(self.map(self.get_airlines_light, codes, max_workers))
+
+    def _historic(self, endpoint: str, request: Any, result_type: Any, fetch: Callable, final: Callable) -> Any:
+        if self.historic_cache is None:
+            return fetch(request)
+
+        key = HistoricResultCache.key(endpoint, request)
+        result = self.historic_cache.get(key, result_type)
+        if result is None:
+            result = fetch(request)
+            if final(self.historic_cache, request, result):
+                self.historic_cache.set(key, result_type, result)
+
+        return result
 
     def get_airlines_light(self, icao: str) -> Airline:
         """
@@ -60,6 +217,9 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             Airline: Airline model
         """
+        return self._reference('airlines/light', icao, Airline, self._get_airlines_light)
+
+    def _get_airlines_light(self, icao: str) -> Airline:
         dto = self.api_client.get(
             f'/static/airlines/{icao}/light',
             GetAirlineLightResponseDto,
@@ -77,6 +237,9 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             AirportLight: Airport light model
         """
+        return self._reference('airports/light', code, AirportLight, self._get_airports_light)
+
+    def _get_airports_light(self, code: str) -> AirportLight:
         dto = self.api_client.get(
             f'/static/airports/{code}/light',
             GetAirportLightResponseDto,
@@ -94,6 +257,9 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             Airport: Airport model
         """
+        return self._reference('airports/full', code, Airport, self._get_airports)
+
+    def _get_airports(self, code: str) -> Airport:
         dto = self.api_client.get(
             f'/static/airports/{code}/full',
             GetAirportResponseDto,
@@ -101,6 +267,24 @@ class FlightRadarClient(BaseFlightRadarClient):
 
         return Airport.from_dto(dto)
 
+    def _live(
+        self, variant: str, request: LiveFlightPositionRequest, fetch: Callable[[LiveFlightPositionRequest], List[P]]
+    ) -> List[P]:
+        if self.live_snapshot is None:
+            return fetch(request)
+        if not self.live_snapshot.covers(request):
+            self.live_snapshot.bypass(variant)
+            return fetch(request)
+
+        def load() -> List[P]:
+            snapshot_request = self.live_snapshot.snapshot_request(request)
+            return fetch_tiled(
+                fetch, self.get_live_flight_position_count, snapshot_request, self.live_snapshot.config.tiling
+            )
+
+        key = self.live_snapshot.key(variant, request)
+        return self.live_snapshot.get(key, request, load)
+
     def get_live_flight_positions_light(self, request: LiveFlightPositionRequest) -> List[FlightPositionLight]:
         """
         Get live flight positions light data
@@ -111,11 +295,15 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightPositionLight]: List of flight position light models
         """
-        dto = self.api_client.get(
-            '/live/flight-positions/light',
-            GetLiveFlightPositionLightResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
-        )
+        return self._live('light', request, self._get_live_flight_positions_light)
+
+    def _get_live_flight_positions_light(self, request: LiveFlightPositionRequest) -> List[FlightPositionLight]:
+        url = '/live/flight-positions/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightPositionLightResponse, params).data
+
+        dto = self.api_client.get(url, GetLiveFlightPositionLightResponseDto, params)
 
         return [FlightPositionLight.from_dto(flight_position) for flight_position in dto.data]
 
@@ -129,14 +317,36 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightPosition]: List of flight position models
         """
-        dto = self.api_client.get(
-            '/live/flight-positions/full',
-            GetLiveFlightPositionResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
-        )
+        return self._live('full', request, self._get_live_flight_positions)
+
+    def _get_live_flight_positions(self, request: LiveFlightPositionRequest) -> List[FlightPosition]:
+        url = '/live/flight-positions/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightPositionResponse, params).data
+
+        dto = self.api_client.get(url, GetLiveFlightPositionResponseDto, params)
 
         return [FlightPosition.from_dto(flight_position) for flight_position in dto.data]
 
+    def get_live_flight_positions_projected(
+        self, request: LiveFlightPositionRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get live flight positions holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: LiveFlightPositionRequest
+            fields: Names of the fields to return, e.g. ``['lat', 'lon', 'alt']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(LIVE_FLIGHT_POSITIONS, fields)
+        return self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True)).data
+
     def get_live_flight_position_count(self, request: LiveFlightPositionCountRequest) -> CountResponse:
         """
         Get live flight positions count
@@ -155,6 +365,79 @@ class FlightRadarClient(BaseFlightRadarClient):
 
         return CountResponse.from_dto(dto)
 
+    def get_live_flight_positions_light_tiled(
+        self, request: LiveFlightPositionRequest, config: TilingConfig | None = None
+    ) -> List[FlightPositionLight]:
+        """
+        Get a complete snapshot of live flight positions light data, even when it exceeds the per-request limit
+
+        The bounds of the request, or the whole world when it has none, are split into quadrants until every tile
+        holds fewer flights than the limit. The tiles are then fetched concurrently and merged.
+
+        Args:
+            request: LiveFlightPositionRequest, its ``limit`` caps the merged result
+            config: Tile sizing and concurrency
+
+        Returns:
+            List[FlightPositionLight]: Flight positions deduplicated on ``fr24_id``
+        """
+        return fetch_tiled(
+            self.get_live_flight_positions_light, self.get_live_flight_position_count, request, config or TilingConfig()
+        )
+
+    def get_live_flight_positions_tiled(
+        self, request: LiveFlightPositionRequest, config: TilingConfig | None = None
+    ) -> List[FlightPosition]:
+        """
+        Get a complete snapshot of live flight positions data, even when it exceeds the per-request limit
+
+        Args:
+            request: LiveFlightPositionRequest, its ``limit`` caps the merged result
+            config: Tile sizing and concurrency
+
+        Returns:
+            List[FlightPosition]: Flight positions deduplicated on ``fr24_id``
+        """
+        return fetch_tiled(
+            self.get_live_flight_positions, self.get_live_flight_position_count, request, config or TilingConfig()
+        )
+
+    def get_live_flight_positions_light_batched(
+        self, max_workers: int = 8, **filters: Any
+    ) -> List[FlightPositionLight]:
+        """
+        Get live flight positions light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: FlightPositionLight models deduplicated on ``fr24_id``
+        """
+        requests = split_request(LiveFlightPositionRequest, **filters)
+        chunks = fan_out(self.get_live_flight_positions_light, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    def get_live_flight_positions_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightPosition]:
+        """
+        Get live flight positions data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a LiveFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: FlightPosition models deduplicated on ``fr24_id``
+        """
+        requests = split_request(LiveFlightPositionRequest, **filters)
+        chunks = fan_out(self.get_live_flight_positions, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
     def get_historic_positions_light(self, request: HistoricFlightPositionRequest) -> List[FlightPositionLight]:
         """
         Get historic flight positions light data
@@ -165,12 +448,22 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightPositionLight]: List of flight position light models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/historic/flight-positions/light',
-            GetHistoricFlightPositionLightResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[FlightPositionLight],
+            self._get_historic_positions_light,
+            HistoricResultCache.positions_are_final,
         )
 
+    def _get_historic_positions_light(self, request: HistoricFlightPositionRequest) -> List[FlightPositionLight]:
+        url = '/historic/flight-positions/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightPositionLightResponse, params).data
+
+        dto = self.api_client.get(url, GetHistoricFlightPositionLightResponseDto, params)
+
         return [FlightPositionLight.from_dto(flight_position) for flight_position in dto.data]
 
     def get_historic_positions(self, request: HistoricFlightPositionRequest) -> List[FlightPosition]:
@@ -183,14 +476,42 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightPosition]: List of flight position models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/historic/flight-positions/full',
-            GetHistoricFlightPositionResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[FlightPosition],
+            self._get_historic_positions,
+            HistoricResultCache.positions_are_final,
         )
 
+    def _get_historic_positions(self, request: HistoricFlightPositionRequest) -> List[FlightPosition]:
+        url = '/historic/flight-positions/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightPositionResponse, params).data
+
+        dto = self.api_client.get(url, GetHistoricFlightPositionResponseDto, params)
+
         return [FlightPosition.from_dto(flight_position) for flight_position in dto.data]
 
+    def get_historic_positions_projected(
+        self, request: HistoricFlightPositionRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get historic flight positions holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: HistoricFlightPositionRequest
+            fields: Names of the fields to return, e.g. ``['lat', 'lon', 'alt']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(HISTORIC_FLIGHT_POSITIONS, fields)
+        return self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True)).data
+
     def get_historic_positions_count(self, request: HistoricFlightPositionCountRequest) -> CountResponse:
         """
         Get historic flight positions count
@@ -209,6 +530,82 @@ class FlightRadarClient(BaseFlightRadarClient):
 
         return CountResponse.from_dto(dto)
 
+    def get_historic_positions_light_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightPositionLight]:
+        """
+        Get historic flight positions light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPositionLight]: FlightPositionLight models deduplicated on ``fr24_id``
+        """
+        requests = split_request(HistoricFlightPositionRequest, **filters)
+        chunks = fan_out(self.get_historic_positions_light, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    def get_historic_positions_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightPosition]:
+        """
+        Get historic flight positions data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``limit`` is applied to the merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a HistoricFlightPositionRequest
+
+        Returns:
+            List[FlightPosition]: FlightPosition models deduplicated on ``fr24_id``
+        """
+        requests = split_request(HistoricFlightPositionRequest, **filters)
+        chunks = fan_out(self.get_historic_positions, requests, max_workers)
+        return merge_positions(chunks, filters.get('limit'))
+
+    def sweep_historic_positions_light(
+        self, start: datetime, end: datetime, step: timedelta, max_workers: int = 8, **filters: Any
+    ) -> Iterator[PositionFrame[FlightPositionLight]]:
+        """
+        Stream snapshots of historic flight positions light data at every ``step`` from ``start`` up to ``end``
+
+        Snapshots are fetched concurrently, at most ``2 * max_workers`` ahead of the consumer, and yielded in
+        timestamp order.
+
+        Args:
+            start: Timestamp of the first snapshot
+            end: End of the sweep, excluded
+            step: Time between two snapshots
+            max_workers: Number of snapshots fetched at once
+            filters: Other fields of a HistoricFlightPositionRequest, except ``timestamp``
+
+        Returns:
+            Iterator[PositionFrame]: One frame per timestamp
+        """
+        return sweep(self.get_historic_positions_light, start, end, step, max_workers, **filters)
+
+    def sweep_historic_positions(
+        self, start: datetime, end: datetime, step: timedelta, max_workers: int = 8, **filters: Any
+    ) -> Iterator[PositionFrame[FlightPosition]]:
+        """
+        Stream snapshots of historic flight positions data at every ``step`` from ``start`` up to ``end``
+
+        Snapshots are fetched concurrently, at most ``2 * max_workers`` ahead of the consumer, and yielded in
+        timestamp order.
+
+        Args:
+            start: Timestamp of the first snapshot
+            end: End of the sweep, excluded
+            step: Time between two snapshots
+            max_workers: Number of snapshots fetched at once
+            filters: Other fields of a HistoricFlightPositionRequest, except ``timestamp``
+
+        Returns:
+            Iterator[PositionFrame]: One frame per timestamp
+        """
+        return sweep(self.get_historic_positions, start, end, step, max_workers, **filters)
+
     def get_flight_summary_light(self, request: FlightSummaryRequest) -> List[FlightSummaryLight]:
         """
         Get flight summary light data
@@ -219,12 +616,22 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightSummaryLight]: List of flight summary light models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/flight-summary/light',
-            GetFlightSummaryLightResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[FlightSummaryLight],
+            self._get_flight_summary_light,
+            HistoricResultCache.summaries_are_final,
         )
 
+    def _get_flight_summary_light(self, request: FlightSummaryRequest) -> List[FlightSummaryLight]:
+        url = '/flight-summary/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightSummaryLightResponse, params).data
+
+        dto = self.api_client.get(url, GetFlightSummaryLightResponseDto, params)
+
         return [FlightSummaryLight.from_dto(flight_summary) for flight_summary in dto.data]
 
     def get_flight_summary(self, request: FlightSummaryRequest) -> List[FlightSummary]:
@@ -237,14 +644,40 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[FlightSummary]: List of flight summary models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/flight-summary/full',
-            GetFlightSummaryResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[FlightSummary],
+            self._get_flight_summary,
+            HistoricResultCache.summaries_are_final,
         )
 
+    def _get_flight_summary(self, request: FlightSummaryRequest) -> List[FlightSummary]:
+        url = '/flight-summary/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, FlightSummaryResponse, params).data
+
+        dto = self.api_client.get(url, GetFlightSummaryResponseDto, params)
+
         return [FlightSummary.from_dto(flight_summary) for flight_summary in dto.data]
 
+    def get_flight_summary_projected(self, request: FlightSummaryRequest, fields: Iterable[str]) -> List[BaseModel]:
+        """
+        Get flight summaries holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: FlightSummaryRequest
+            fields: Names of the fields to return, e.g. ``['fr24_id', 'orig_icao', 'dest_icao']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(FLIGHT_SUMMARY, fields)
+        return self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True)).data
+
     def get_flight_summary_count(self, request: FlightSummaryCountRequest) -> CountResponse:
         """
         Get flight summary count
@@ -263,6 +696,106 @@ class FlightRadarClient(BaseFlightRadarClient):
 
         return CountResponse.from_dto(dto)
 
+    def get_flight_summary_light_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightSummaryLight]:
+        """
+        Get flight summary light data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``sort`` and ``limit`` are applied to the
+        merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a FlightSummaryRequest
+
+        Returns:
+            List[FlightSummaryLight]: FlightSummaryLight models deduplicated on ``fr24_id`` and sorted by ``first_seen``
+        """
+        requests = split_request(FlightSummaryRequest, **filters)
+        chunks = fan_out(self.get_flight_summary_light, requests, max_workers)
+        return merge_summaries(chunks, filters.get('limit'), filters.get('sort'))
+
+    def get_flight_summary_batched(self, max_workers: int = 8, **filters: Any) -> List[FlightSummary]:
+        """
+        Get flight summary data for filter lists longer than the 15 values the API accepts
+
+        List filters of any length are split into concurrent requests, and ``sort`` and ``limit`` are applied to the
+        merged result.
+
+        Args:
+            max_workers: Number of requests in flight at once
+            filters: Fields of a FlightSummaryRequest
+
+        Returns:
+            List[FlightSummary]: FlightSummary models deduplicated on ``fr24_id`` and sorted by ``first_seen``
+        """
+        requests = split_request(FlightSummaryRequest, **filters)
+        chunks = fan_out(self.get_flight_summary, requests, max_workers)
+        return merge_summaries(chunks, filters.get('limit'), filters.get('sort'))
+
+    def get_flight_summary_light_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        config: WindowingConfig | None = None,
+        **filters: Any,
+    ) -> Iterator[FlightSummaryLight]:
+        """
+        Stream flight summary light data for a date range, without the 20,000 results cap
+
+        The range is cut into windows, and windows holding too many flights according to
+        ``get_flight_summary_count`` are bisected. The windows are fetched concurrently. Like single requests, the
+        range must start within the last 14 days, otherwise a ``ValueError`` is raised before any request is sent.
+
+        Args:
+            flight_datetime_from: Start of the range, matched against ``first_seen``
+            flight_datetime_to: End of the range
+            config: Window sizing and concurrency
+            filters: Other fields of a FlightSummaryRequest, except ``limit`` and ``sort``
+
+        Returns:
+            Iterator[FlightSummaryLight]: FlightSummaryLight models in ascending ``first_seen`` order
+        """
+        return fetch_windowed(
+            self.get_flight_summary_light,
+            self.get_flight_summary_count,
+            flight_datetime_from,
+            flight_datetime_to,
+            config or WindowingConfig(),
+            **filters,
+        )
+
+    def get_flight_summary_windowed(
+        self,
+        flight_datetime_from: datetime,
+        flight_datetime_to: datetime,
+        config: WindowingConfig | None = None,
+        **filters: Any,
+    ) -> Iterator[FlightSummary]:
+        """
+        Stream flight summary data for a date range, without the 20,000 results cap
+
+        The range is cut into windows, and windows holding too many flights according to
+        ``get_flight_summary_count`` are bisected. The windows are fetched concurrently. Like single requests, the
+        range must start within the last 14 days, otherwise a ``ValueError`` is raised before any request is sent.
+
+        Args:
+            flight_datetime_from: Start of the range, matched against ``first_seen``
+            flight_datetime_to: End of the range
+            config: Window sizing and concurrency
+            filters: Other fields of a FlightSummaryRequest, except ``limit`` and ``sort``
+
+        Returns:
+            Iterator[FlightSummary]: FlightSummary models in ascending ``first_seen`` order
+        """
+        return fetch_windowed(
+            self.get_flight_summary,
+            self.get_flight_summary_count,
+            flight_datetime_from,
+            flight_datetime_to,
+            config or WindowingConfig(),
+            **filters,
+        )
+
     def get_flight_tracks(self, request: FlightTrackRequest) -> tuple[str, List[FlightTrack]]:
         """
         Get flight tracks
@@ -273,12 +806,23 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             tuple[str, List[FlightTrack]]: Tuple containing the flight ID and list of flight tracks
         """
-        dto = self.api_client.get_many(
+        return self._historic(
             '/flight-tracks',
-            GetFlightTracksResponseDto,
-            request.to_dto().model_dump(),
+            request,
+            tuple[str, List[FlightTrack]],
+            self._get_flight_tracks,
+            HistoricResultCache.tracks_are_final,
         )
 
+    def _get_flight_tracks(self, request: FlightTrackRequest) -> tuple[str, List[FlightTrack]]:
+        url = '/flight-tracks'
+        params = request.to_dto().model_dump()
+        if self.single_pass_decode:
+            response = self.api_client.get_many(url, FlightTrackResponse, params)
+            return (response[0].fr24_id, response[0].tracks)
+
+        dto = self.api_client.get_many(url, GetFlightTracksResponseDto, params)
+
         return (dto[0].fr24_id, [FlightTrack.from_dto(track) for track in dto[0].tracks])
 
     def get_api_usage(self, request: ApiUsageRequest) -> List[ApiUsage]:
@@ -311,12 +855,24 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[HistoricFlightEventLightResponseEntry]: List of historic flight events light models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/historic/flight-events/light',
-            HistoricFlightEventLightResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[HistoricFlightEventLightResponseEntry],
+            self._get_historic_flight_events_light,
+            HistoricResultCache.events_are_final,
         )
 
+    def _get_historic_flight_events_light(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventLightResponseEntry]:
+        url = '/historic/flight-events/light'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, HistoricFlightEventLightResponse, params).data
+
+        dto = self.api_client.get(url, HistoricFlightEventLightResponseDto, params)
+
         return [HistoricFlightEventLightResponseEntry.from_dto(event) for event in dto.data]
 
     def get_historic_flight_events(self, request: HistoricFlightEventRequest) -> List[HistoricFlightEventResponseEntry]:
@@ -329,10 +885,84 @@ class FlightRadarClient(BaseFlightRadarClient):
         Returns:
             List[HistoricFlightEventResponse]: List of historic flight events models
         """
-        dto = self.api_client.get(
+        return self._historic(
             '/historic/flight-events/full',
-            HistoricFlightEventResponseDto,
-            request.to_dto().model_dump(exclude_none=True),
+            request,
+            List[HistoricFlightEventResponseEntry],
+            self._get_historic_flight_events,
+            HistoricResultCache.events_are_final,
         )
 
+    def _get_historic_flight_events(
+        self, request: HistoricFlightEventRequest
+    ) -> List[HistoricFlightEventResponseEntry]:
+        url = '/historic/flight-events/full'
+        params = request.to_dto().model_dump(exclude_none=True)
+        if self.single_pass_decode:
+            return self.api_client.get(url, HistoricFlightEventResponse, params).data
+
+        dto = self.api_client.get(url, HistoricFlightEventResponseDto, params)
+
         return [HistoricFlightEventResponseEntry.from_dto(event) for event in dto.data]
+
+    def get_historic_flight_events_projected(
+        self, request: HistoricFlightEventRequest, fields: Iterable[str]
+    ) -> List[BaseModel]:
+        """
+        Get historic flight events holding only the requested fields
+
+        The cheapest endpoint variant that covers the fields is called, and only those fields are decoded.
+
+        Args:
+            request: HistoricFlightEventRequest
+            fields: Names of the fields to return, e.g. ``['fr24_id', 'events']``
+
+        Returns:
+            List[BaseModel]: List of models holding only the requested fields
+        """
+        url, response_class = resolve(HISTORIC_FLIGHT_EVENTS, fields)
+        return self.api_client.get(url, response_class, request.to_dto().model_dump(exclude_none=True)).data
+
+    def get_historic_flight_events_light_bulk(
+        self,
+        flight_ids: Iterable[str],
+        event_types: List[HistoricFlightEventTypes] | None = None,
+        max_workers: int = 8,
+    ) -> BulkEventStream[HistoricFlightEventLightResponseEntry]:
+        """
+        Stream historic flight events light data for any number of flights
+
+        The flight IDs are sent in chunks of 15 concurrently, and entries are streamed as chunks complete. A failing
+        chunk does not stop the stream, its error is recorded in the ``progress`` of the returned stream.
+
+        Args:
+            flight_ids: fr24_ids of the flights
+            event_types: Event types to filter by
+            max_workers: Number of chunks in flight at once
+
+        Returns:
+            BulkEventStream[HistoricFlightEventLightResponseEntry]: Entries of every chunk, with per chunk progress
+        """
+        return stream_events(self.get_historic_flight_events_light, flight_ids, event_types, max_workers)
+
+    def get_historic_flight_events_bulk(
+        self,
+        flight_ids: Iterable[str],
+        event_types: List[HistoricFlightEventTypes] | None = None,
+        max_workers: int = 8,
+    ) -> BulkEventStream[HistoricFlightEventResponseEntry]:
+        """
+        Stream historic flight events data for any number of flights
+
+        The flight IDs are sent in chunks of 15 concurrently, and entries are streamed as chunks complete. A failing
+        chunk does not stop the stream, its error is recorded in the ``progress`` of the returned stream.
+
+        Args:
+            flight_ids: fr24_ids of the flights
+            event_types: Event types to filter by
+            max_workers: Number of chunks in flight at once
+
+        Returns:
+            BulkEventStream[HistoricFlightEventResponseEntry]: Entries of every chunk, with per chunk progress
+        """
+        return stream_events(self.get_historic_flight_events, flight_ids, event_types, max_workers)
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.models import FlightPositionLight, HistoricFlightPositionRequest
+from flight_radar.services.batch import BatchResult, map_in_tasks, map_in_threads
+
+P = TypeVar('P', bound=FlightPositionLight)
+
+
+class PositionFrame(BaseModel, Generic[P]):
+    timestamp: datetime = Field(description='Point in time of the snapshot.')
+    positions: List[P] = Field(description='Flight positions at that point in time.')
+
+
+def sweep_timestamps(start: datetime, end: datetime, step: timedelta) -> Iterator[datetime]:
+    """Yield ``start``, ``start + step``, ... up to but excluding ``end``."""
+    if step <= timedelta(0):
+        raise ValueError('step must be positive')
+
+    timestamp = start
+    while timestamp < end:
+        yield timestamp
+        timestamp += step
+
+
+def _frame(result: BatchResult) -> PositionFrame:
+    if not result.ok:
+        raise result.error
+    return PositionFrame(timestamp=result.request.timestamp, positions=result.result)
+
+
+def sweep(
+    fetch: Callable[[HistoricFlightPositionRequest], List[P]],
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    max_workers: int,
+    **filters,
+) -> Iterator[PositionFrame[P]]:
+    """
+    Fetch one snapshot per timestamp of the sweep concurrently and yield them in timestamp order.
+
+    Requests are built lazily and at most ``2 * max_workers`` frames are fetched ahead of the consumer, so memory
+    use does not depend on the length of the sweep.
+    """
+    requests = (
+        HistoricFlightPositionRequest(**filters, timestamp=timestamp)
+        for timestamp in sweep_timestamps(start, end, step)
+    )
+    for result in map_in_threads(fetch, requests, max_workers, ordered=True):
+        yield _frame(result)
+
+
+async def sweep_async(
+    fetch: Callable[[HistoricFlightPositionRequest], Awaitable[List[P]]],
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    concurrency: int,
+    **filters,
+) -> AsyncIterator[PositionFrame[P]]:
+    """Asyncio variant of ``sweep``, with at most ``concurrency`` frames fetched ahead of the consumer."""
+    requests = (
+        HistoricFlightPositionRequest(**filters, timestamp=timestamp)
+        for timestamp in sweep_timestamps(start, end, step)
+    )
+    async for result in map_in_tasks(fetch, requests, concurrency, ordered=True):
+        yield _frame(result)
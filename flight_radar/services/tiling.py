@@ -0,0 +1,173 @@
+from typing import Awaitable, Callable, Iterable, List, TypeAlias, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.models import (
+    CountResponse,
+    FlightPositionLight,
+    LiveFlightPositionCountRequest,
+    LiveFlightPositionRequest,
+)
+from flight_radar.models.flight_position import MAX_LIMIT, FlightPositionBaseRequest
+from flight_radar.services.batch import BatchResult, map_in_tasks, map_in_threads
+
+P = TypeVar('P', bound=FlightPositionLight)
+
+# north, south, west, east in decimal degrees, the order used by the API
+Bounds: TypeAlias = tuple[float, float, float, float]
+
+WORLD_BOUNDS: Bounds = (90.0, -90.0, -180.0, 180.0)
+
+
+class TilingConfig(BaseModel):
+    max_tile_count: int = Field(
+        description="""Tiles holding more flights than this are split into quadrants. Kept below MAX_LIMIT so that
+        flights showing up between counting and fetching a tile still fit into it.""",
+        default=27000,
+        ge=1,
+        le=MAX_LIMIT,
+    )
+    min_tile_size: float = Field(
+        description='Tiles are not split once their sides are shorter than this many degrees.',
+        default=0.1,
+        gt=0,
+    )
+    max_workers: int = Field(description='Number of tiles counted or fetched at once.', default=8, ge=1)
+
+
+def split_bounds(bounds: Bounds) -> list[Bounds]:
+    """Split bounds into four quadrants sharing their inner edges."""
+    north, south, west, east = bounds
+    latitude = (north + south) / 2
+    longitude = (west + east) / 2
+    return [
+        (north, latitude, west, longitude),
+        (north, latitude, longitude, east),
+        (latitude, south, west, longitude),
+        (latitude, south, longitude, east),
+    ]
+
+
+def _can_split(bounds: Bounds, config: TilingConfig) -> bool:
+    north, south, west, east = bounds
+    return min(north - south, east - west) / 2 >= config.min_tile_size
+
+
+def _filters(request: FlightPositionBaseRequest, bounds: Bounds) -> dict:
+    filters = {name: getattr(request, name) for name in FlightPositionBaseRequest.model_fields}
+    filters['bounds'] = bounds
+    return filters
+
+
+def count_request(request: LiveFlightPositionRequest, bounds: Bounds) -> LiveFlightPositionCountRequest:
+    return LiveFlightPositionCountRequest(**_filters(request, bounds))
+
+
+def tile_request(request: LiveFlightPositionRequest, bounds: Bounds) -> LiveFlightPositionRequest:
+    return LiveFlightPositionRequest(**_filters(request, bounds), limit=MAX_LIMIT)
+
+
+def _unwrap(result: BatchResult):
+    if not result.ok:
+        raise result.error
+    return result.result
+
+
+def _next_level(
+    frontier: list[Bounds], counts: Iterable[BatchResult], config: TilingConfig, tiles: dict[Bounds, int]
+) -> list[Bounds]:
+    """Add the tiles of ``frontier`` that are small enough to ``tiles`` and return the quadrants of the rest."""
+    next_frontier = []
+    for bounds, result in zip(frontier, counts):
+        record_count = _unwrap(result).record_count
+        if record_count == 0:
+            continue
+        if record_count > config.max_tile_count and _can_split(bounds, config):
+            next_frontier.extend(split_bounds(bounds))
+        else:
+            tiles[bounds] = record_count
+
+    return next_frontier
+
+
+def merge_positions(chunks: Iterable[List[P]], limit: int | None = None) -> List[P]:
+    """Merge the positions of overlapping tiles, keeping the most recent position of every flight."""
+    merged: dict[str, P] = {}
+    for chunk in chunks:
+        for position in chunk:
+            current = merged.get(position.fr24_id)
+            if current is None or position.timestamp > current.timestamp:
+                merged[position.fr24_id] = position
+
+    positions = list(merged.values())
+    return positions[:limit] if limit else positions
+
+
+def plan_tiles(
+    count: Callable[[LiveFlightPositionCountRequest], CountResponse],
+    request: LiveFlightPositionRequest,
+    config: TilingConfig,
+) -> dict[Bounds, int]:
+    """
+    Split the bounds of a request into tiles that each hold at most ``config.max_tile_count`` flights.
+
+    Tiles are counted level by level, all tiles of a level at once, and tiles without any flight are dropped.
+
+    Args:
+        count: Function returning the number of flights matching a count request
+        request: Request to split, the whole world is split when it has no bounds
+        config: Tiling configuration
+
+    Returns:
+        dict[Bounds, int]: Bounds of the tiles to fetch, with the number of flights counted in them
+    """
+    tiles: dict[Bounds, int] = {}
+    frontier = [request.bounds or WORLD_BOUNDS]
+    while frontier:
+        counts = map_in_threads(
+            count, [count_request(request, bounds) for bounds in frontier], config.max_workers, ordered=True
+        )
+        frontier = _next_level(frontier, counts, config, tiles)
+
+    return tiles
+
+
+def fetch_tiled(
+    fetch: Callable[[LiveFlightPositionRequest], List[P]],
+    count: Callable[[LiveFlightPositionCountRequest], CountResponse],
+    request: LiveFlightPositionRequest,
+    config: TilingConfig,
+) -> List[P]:
+    """Fetch every tile of ``request`` concurrently and merge the positions, deduplicated on ``fr24_id``."""
+    tiles = plan_tiles(count, request, config)
+    chunks = map_in_threads(fetch, [tile_request(request, tile) for tile in tiles], config.max_workers, ordered=False)
+    return merge_positions((_unwrap(result) for result in chunks), request.limit)
+
+
+async def plan_tiles_async(
+    count: Callable[[LiveFlightPositionCountRequest], Awaitable[CountResponse]],
+    request: LiveFlightPositionRequest,
+    config: TilingConfig,
+) -> dict[Bounds, int]:
+    """Asyncio variant of ``plan_tiles``."""
+    tiles: dict[Bounds, int] = {}
+    frontier = [request.bounds or WORLD_BOUNDS]
+    while frontier:
+        requests = [count_request(request, bounds) for bounds in frontier]
+        counts = [result async for result in map_in_tasks(count, requests, config.max_workers, ordered=True)]
+        frontier = _next_level(frontier, counts, config, tiles)
+
+    return tiles
+
+
+async def fetch_tiled_async(
+    fetch: Callable[[LiveFlightPositionRequest], Awaitable[List[P]]],
+    count: Callable[[LiveFlightPositionCountRequest], Awaitable[CountResponse]],
+    request: LiveFlightPositionRequest,
+    config: TilingConfig,
+) -> List[P]:
+    """Asyncio variant of ``fetch_tiled``."""
+    tiles = await plan_tiles_async(count, request, config)
+    requests = [tile_request(request, tile) for tile in tiles]
+    chunks = [_unwrap(result) async for result in map_in_tasks(fetch, requests, config.max_workers, ordered=False)]
+    return merge_positions(chunks, request.limit)
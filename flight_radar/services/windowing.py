@@ -0,0 +1,268 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, TypeAlias, TypeVar
+
+from pydantic import BaseModel, Field
+
+from flight_radar.enums.enums import Sort
+from flight_radar.models import CountResponse, FlightSummaryCountRequest, FlightSummaryLight, FlightSummaryRequest
+from flight_radar.models.flight_summary import MAX_FLIGHT_SUMMARY_LIMIT, MAX_FLIGHT_SUMMARY_LOOKBACK
+from flight_radar.services.batch import BatchResult, map_in_tasks, map_in_threads
+
+S = TypeVar('S', bound=FlightSummaryLight)
+
+# Flights whose first_seen lies in [start, end)
+Window: TypeAlias = tuple[datetime, datetime]
+
+MAX_FLIGHT_SUMMARY_RANGE = timedelta(days=14)
+
+
+class WindowingConfig(BaseModel):
+    max_window: timedelta = Field(
+        description='Longest window requested at once. The API accepts date ranges of up to 14 days.',
+        default=MAX_FLIGHT_SUMMARY_RANGE,
+        gt=timedelta(0),
+        le=MAX_FLIGHT_SUMMARY_RANGE,
+    )
+    max_window_count: int = Field(
+        description='Windows matching more flights than this are bisected.',
+        default=MAX_FLIGHT_SUMMARY_LIMIT,
+        ge=1,
+        le=MAX_FLIGHT_SUMMARY_LIMIT,
+    )
+    min_window: timedelta = Field(
+        description='Windows are not bisected once they are shorter than this.',
+        default=timedelta(minutes=1),
+        gt=timedelta(0),
+    )
+    max_flight_duration: timedelta = Field(
+        description="""The API matches flights by first_seen on the lower bound and by last_seen on the upper bound,
+        so every window is requested this much longer to include flights that are still airborne at its end.""",
+        default=timedelta(hours=20),
+        ge=timedelta(0),
+    )
+    max_workers: int = Field(description='Number of windows counted or fetched at once.', default=8, ge=1)
+
+
+def check_span(start: datetime, end: datetime) -> None:
+    """
+    Reject a span the API would refuse, before any request is sent.
+
+    Raises:
+        ValueError: The span ends before it starts, or starts before the ``MAX_FLIGHT_SUMMARY_LOOKBACK`` the API
+            serves flight summaries for
+    """
+    if start > end:
+        raise ValueError('flight_datetime_from must be before flight_datetime_to')
+    if start < datetime.now(tz=timezone.utc) - MAX_FLIGHT_SUMMARY_LOOKBACK:
+        raise ValueError(
+            f'flight_datetime_from must be within the last {MAX_FLIGHT_SUMMARY_LOOKBACK.days} days, '
+            'windowed ranges cannot reach further back than single requests'
+        )
+
+
+def split_span(start: datetime, end: datetime, max_window: timedelta) -> List[Window]:
+    """Cut ``[start, end)`` into consecutive windows of at most ``max_window``."""
+    windows = []
+    while start < end:
+        windows.append((start, min(start + max_window, end)))
+        start += max_window
+
+    return windows
+
+
+def _bisect(window: Window) -> List[Window]:
+    start, end = window
+    middle = start + (end - start) / 2
+    return [(start, middle), (middle, end)]
+
+
+def _range(window: Window, end: datetime, config: WindowingConfig) -> dict:
+    # The requested range is extended past the window, but never past the end of the whole span
+    return {'flight_datetime_from': window[0], 'flight_datetime_to': min(window[1] + config.max_flight_duration, end)}
+
+
+def _unwrap(result: BatchResult):
+    if not result.ok:
+        raise result.error
+    return result.result
+
+
+def _has_tail(window: Window, end: datetime, config: WindowingConfig) -> bool:
+    # Windows whose range is extended also match flights first seen after them, which are counted separately
+    return window[1] < end and config.max_flight_duration > timedelta(0)
+
+
+def _next_level(
+    frontier: List[Window],
+    counts: Iterable[BatchResult],
+    end: datetime,
+    config: WindowingConfig,
+    windows: dict[Window, int],
+) -> List[Window]:
+    next_frontier = []
+    counts = iter(counts)
+    for window in frontier:
+        record_count = _unwrap(next(counts)).record_count
+        if _has_tail(window, end, config):
+            # Ascending fetches return the flights first seen in the window before those of its tail,
+            # so only the former have to fit in one response
+            record_count = max(record_count - _unwrap(next(counts)).record_count, 0)
+        if record_count == 0:
+            continue
+        if record_count > config.max_window_count and window[1] - window[0] >= 2 * config.min_window:
+            next_frontier.extend(_bisect(window))
+        else:
+            windows[window] = record_count
+
+    return next_frontier
+
+
+def _count_requests(frontier: List[Window], end: datetime, config: WindowingConfig, filters: dict) -> list:
+    requests = []
+    for window in frontier:
+        requests.append(FlightSummaryCountRequest(**filters, **_range(window, end, config)))
+        if _has_tail(window, end, config):
+            tail = (window[1], window[1])
+            requests.append(FlightSummaryCountRequest(**filters, **_range(tail, end, config)))
+
+    return requests
+
+
+def _fetch_requests(windows: List[Window], end: datetime, config: WindowingConfig, filters: dict) -> list:
+    return [
+        FlightSummaryRequest(**filters, **_range(window, end, config), limit=MAX_FLIGHT_SUMMARY_LIMIT, sort=Sort.ASC)
+        for window in sorted(windows)
+    ]
+
+
+def _in_window(summaries: List[S], window: Window, seen_unknown: set[str]) -> Iterator[S]:
+    """Keep the flights first seen inside the window, as extended ranges of neighbouring windows overlap."""
+    start, end = window
+    for summary in summaries:
+        if summary.first_seen is None:
+            if summary.fr24_id not in seen_unknown:
+                seen_unknown.add(summary.fr24_id)
+                yield summary
+        elif start <= summary.first_seen < end:
+            yield summary
+
+
+def plan_windows(
+    count: Callable[[FlightSummaryCountRequest], CountResponse],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> dict[Window, int]:
+    """
+    Split ``[start, end)`` into windows that each hold at most ``config.max_window_count`` flights.
+
+    A window holds the flights first seen in it. They are counted as the flights of its extended range minus
+    those of the part of that range past the window, so flights still airborne at its end do not bisect it.
+
+    Args:
+        count: Function returning the number of flights matching a count request
+        start: Start of the span
+        end: End of the span
+        config: Windowing configuration
+        filters: Other fields of the flight summary request
+
+    Returns:
+        dict[Window, int]: Windows holding at least one flight, in no particular order, with the number of flights
+        they hold
+
+    Raises:
+        ValueError: The span is not one the API serves, see ``check_span``
+    """
+    check_span(start, end)
+    windows: dict[Window, int] = {}
+    frontier = split_span(start, end, config.max_window)
+    while frontier:
+        requests = _count_requests(frontier, end, config, filters)
+        counts = map_in_threads(count, requests, config.max_workers, ordered=True)
+        frontier = _next_level(frontier, counts, end, config, windows)
+
+    return windows
+
+
+def fetch_windowed(
+    fetch: Callable[[FlightSummaryRequest], List[S]],
+    count: Callable[[FlightSummaryCountRequest], CountResponse],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> Iterator[S]:
+    """
+    Fetch every window of ``[start, end)`` concurrently and yield the flights in ``first_seen`` order.
+
+    Raises:
+        ValueError: The span is not one the API serves, see ``check_span``. Raised by the call, not on iteration
+    """
+    check_span(start, end)
+    return _fetch_windowed(fetch, count, start, end, config, **filters)
+
+
+def _fetch_windowed(
+    fetch: Callable[[FlightSummaryRequest], List[S]],
+    count: Callable[[FlightSummaryCountRequest], CountResponse],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> Iterator[S]:
+    windows = sorted(plan_windows(count, start, end, config, **filters))
+    requests = _fetch_requests(windows, end, config, filters)
+    seen_unknown: set[str] = set()
+    for window, result in zip(windows, map_in_threads(fetch, requests, config.max_workers, ordered=True)):
+        yield from _in_window(_unwrap(result), window, seen_unknown)
+
+
+async def plan_windows_async(
+    count: Callable[[FlightSummaryCountRequest], Awaitable[CountResponse]],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> dict[Window, int]:
+    """Asyncio variant of ``plan_windows``."""
+    check_span(start, end)
+    windows: dict[Window, int] = {}
+    frontier = split_span(start, end, config.max_window)
+    while frontier:
+        requests = _count_requests(frontier, end, config, filters)
+        counts = [result async for result in map_in_tasks(count, requests, config.max_workers, ordered=True)]
+        frontier = _next_level(frontier, counts, end, config, windows)
+
+    return windows
+
+
+def fetch_windowed_async(
+    fetch: Callable[[FlightSummaryRequest], Awaitable[List[S]]],
+    count: Callable[[FlightSummaryCountRequest], Awaitable[CountResponse]],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> AsyncIterator[S]:
+    """Asyncio variant of ``fetch_windowed``."""
+    check_span(start, end)
+    return _fetch_windowed_async(fetch, count, start, end, config, **filters)
+
+
+async def _fetch_windowed_async(
+    fetch: Callable[[FlightSummaryRequest], Awaitable[List[S]]],
+    count: Callable[[FlightSummaryCountRequest], Awaitable[CountResponse]],
+    start: datetime,
+    end: datetime,
+    config: WindowingConfig,
+    **filters,
+) -> AsyncIterator[S]:
+    windows = sorted(await plan_windows_async(count, start, end, config, **filters))
+    requests = _fetch_requests(windows, end, config, filters)
+    seen_unknown: set[str] = set()
+    index = 0
+    async for result in map_in_tasks(fetch, requests, config.max_workers, ordered=True):
+        for summary in _in_window(_unwrap(result), windows[index], seen_unknown):
+            yield summary
+        index += 1
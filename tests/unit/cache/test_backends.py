@@ -0,0 +1,115 @@
+import sqlite3
+
+import pytest
+
+from flight_radar.cache import CacheEntry, MemoryCache, SQLiteCache
+
+
+def test_entry_should_be_fresh_until_it_expires():
+    assert CacheEntry(value=1, stored_at=0).is_fresh(now=1e12)
+    assert CacheEntry(value=1, stored_at=0, expires_at=10).is_fresh(now=9)
+    assert not CacheEntry(value=1, stored_at=0, expires_at=10).is_fresh(now=10)
+    assert not CacheEntry(value=1, stored_at=0, expires_at=10).is_fresh()
+
+
+def test_memory_cache_should_evict_the_least_recently_used_entry():
+    cache = MemoryCache(max_entries=2)
+    cache.set('a', CacheEntry(value=1, stored_at=0))
+    cache.set('b', CacheEntry(value=2, stored_at=0))
+    cache.get('a')
+    cache.set('c', CacheEntry(value=3, stored_at=0))
+
+    assert cache.get('b') is None
+    assert [cache.get(key).value for key in ('a', 'c')] == [1, 3]
+    assert len(cache) == 2
+
+
+def test_memory_cache_should_delete_and_clear():
+    cache = MemoryCache()
+    cache.set('a', CacheEntry(value=1, stored_at=0))
+    cache.set('b', CacheEntry(value=2, stored_at=0))
+
+    cache.delete('a')
+    cache.delete('missing')
+    assert cache.get('a') is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_memory_cache_should_reject_an_empty_capacity():
+    with pytest.raises(ValueError):
+        MemoryCache(max_entries=0)
+
+
+def test_sqlite_cache_should_persist_entries_across_instances(tmp_path):
+    path = tmp_path / 'nested' / 'cache.db'
+    cache = SQLiteCache(path)
+    cache.set('a', CacheEntry(value=b'payload', stored_at=1.5, expires_at=10))
+    cache.close()
+
+    restarted = SQLiteCache(path)
+    entry = restarted.get('a')
+    restarted.close()
+
+    assert entry == CacheEntry(value=b'payload', stored_at=1.5, expires_at=10)
+
+
+def test_sqlite_cache_should_delete_and_clear():
+    cache = SQLiteCache(':memory:')
+    cache.set('a', CacheEntry(value=b'1', stored_at=0))
+    cache.set('b', CacheEntry(value=b'2', stored_at=0))
+
+    cache.delete('a')
+    assert cache.get('a') is None
+    assert cache.get('b').value == b'2'
+
+    cache.clear()
+    assert cache.get('b') is None
+    cache.close()
+
+
+def test_sqlite_cache_should_only_store_bytes():
+    cache = SQLiteCache(':memory:')
+    with pytest.raises(TypeError):
+        cache.set('a', CacheEntry(value='text', stored_at=0))
+    cache.close()
+
+
+def test_sqlite_cache_should_add_missing_columns_to_an_existing_database(tmp_path):
+    path = tmp_path / 'cache.db'
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE cache_entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, metadata TEXT NOT NULL)')
+    connection.execute("INSERT INTO cache_entries VALUES ('a', x'01', '{\"stored_at\": 0}')")
+    connection.commit()
+    connection.close()
+
+    cache = SQLiteCache(path, max_bytes=10)
+    cache.set('b', CacheEntry(value=b'22', stored_at=0))
+
+    assert cache.get('a').value == b'\x01'
+    assert cache.size() == 2
+    cache.close()
+
+
+def test_sqlite_cache_should_reject_an_empty_size_cap():
+    with pytest.raises(ValueError):
+        SQLiteCache(':memory:', max_bytes=0)
+
+
+@pytest.mark.parametrize(
+    'make_cache', [lambda: MemoryCache(max_entries=2), lambda: SQLiteCache(':memory:', max_bytes=5)]
+)
+def test_backends_should_report_evictions_and_list_their_entries(make_cache):
+    cache = make_cache()
+    evicted, counted = [], []
+    cache.add_eviction_listener(lambda key, size: evicted.append((key, size)))
+    cache.add_eviction_listener(lambda key, size: counted.append(key))
+    cache.set('a', CacheEntry(value=b'12', stored_at=1))
+    cache.set('b', CacheEntry(value=b'34', stored_at=2))
+    cache.set('c', CacheEntry(value=b'56', stored_at=3))
+
+    assert evicted == [('a', 2)]
+    assert counted == ['a']
+    assert sorted(cache.entries()) == [('b', 2, 2.0), ('c', 2, 3.0)]
+    cache.close()
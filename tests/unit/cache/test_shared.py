@@ -0,0 +1,135 @@
+import json
+import multiprocessing
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from unittest.mock import MagicMock
+
+import pytest
+
+from flight_radar.cache import CacheEntry, SharedSQLiteCache
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.http_cache import ResponseCache
+from flight_radar.models import Airline
+from flight_radar.services.reference_data import ReferenceDataCache, ReferenceDataConfig
+
+
+def _store(path: str, key: str) -> None:
+    cache = SharedSQLiteCache(path)
+    cache.set(key, CacheEntry(value=b'from another process', stored_at=0))
+    cache.close()
+
+
+def _store_inherited(cache: SharedSQLiteCache, key: str) -> None:
+    cache.set(key, CacheEntry(value=b'from a forked worker', stored_at=0))
+    cache.close()
+
+
+def _run(context: str, target, *args) -> None:
+    process = multiprocessing.get_context(context).Process(target=target, args=args)
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 0
+
+
+def test_should_use_wal_and_see_writes_of_other_instances_immediately(tmp_path):
+    path = tmp_path / 'shared.db'
+    writer, reader = SharedSQLiteCache(path), SharedSQLiteCache(path)
+
+    writer.set('a', CacheEntry(value=b'1', stored_at=0))
+
+    assert reader.get('a').value == b'1'
+    with closing(sqlite3.connect(path)) as connection:
+        assert connection.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+    writer.close()
+    reader.close()
+
+
+def test_should_serve_entries_written_by_another_process(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    cache = SharedSQLiteCache(path)
+
+    _run('spawn', _store, path, 'a')
+
+    assert cache.get('a').value == b'from another process'
+    cache.close()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='fork is not available')
+def test_should_reopen_connections_after_a_fork(tmp_path):
+    cache = SharedSQLiteCache(tmp_path / 'shared.db')
+    cache.set('parent', CacheEntry(value=b'1', stored_at=0))
+
+    _run('fork', _store_inherited, cache, 'child')
+
+    assert cache.get('child').value == b'from a forked worker'
+    assert cache.get('parent').value == b'1'
+    cache.close()
+
+
+def test_should_run_statements_of_concurrent_threads_on_pooled_connections(tmp_path):
+    cache = SharedSQLiteCache(tmp_path / 'shared.db')
+    for index in range(20):
+        cache.set(str(index), CacheEntry(value=str(index).encode(), stored_at=0))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = list(executor.map(lambda index: cache.get(str(index)).value, range(20)))
+
+    assert values == [str(index).encode() for index in range(20)]
+    assert 1 <= len(cache._connections) <= 4
+    cache.close()
+
+
+def test_should_only_record_uses_once_per_touch_interval(tmp_path):
+    now = [100.0]
+    cache = SharedSQLiteCache(tmp_path / 'shared.db', max_bytes=10, clock=lambda: now[0], touch_interval=60)
+    cache.set('a', CacheEntry(value=b'1', stored_at=0))
+
+    def accessed_at() -> float:
+        with cache._use() as connection:
+            return connection.execute("SELECT accessed_at FROM cache_entries WHERE key = 'a'").fetchone()[0]
+
+    now[0] = 159.0
+    cache.get('a')
+    assert accessed_at() == 100.0
+    now[0] = 160.0
+    cache.get('a')
+    assert accessed_at() == 160.0
+    cache.close()
+
+
+def test_should_reject_in_memory_databases():
+    with pytest.raises(ValueError):
+        SharedSQLiteCache(':memory:')
+
+
+def test_should_share_fetched_responses_and_reference_data_between_workers(tmp_path, mock_get_airlines_light_response):
+    session = MagicMock()
+    response = MagicMock(
+        status_code=200,
+        headers={'Cache-Control': 'max-age=60'},
+        content=json.dumps(mock_get_airlines_light_response).encode(),
+    )
+    response.json.return_value = mock_get_airlines_light_response
+    session.get.return_value.__enter__.return_value = response
+    workers = [SharedSQLiteCache(tmp_path / 'responses.db') for _ in range(2)]
+    clients = [
+        FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', response_cache=ResponseCache(cache))
+        for cache in workers
+    ]
+
+    clients[0].get('/static/airlines/SAS/light', Airline)
+    clients[1].get('/static/airlines/SAS/light', Airline)
+
+    assert session.get.call_count == 1
+    for cache in workers:
+        cache.close()
+
+    config = ReferenceDataConfig(path=tmp_path / 'reference.db')
+    first, second = ReferenceDataCache(config), ReferenceDataCache(config)
+    first.set('airlines/light:SAS', Airline.model_validate(mock_get_airlines_light_response))
+
+    assert second.get('airlines/light:SAS', Airline) == Airline.model_validate(mock_get_airlines_light_response)
+    first.close()
+    second.close()
@@ -0,0 +1,44 @@
+from flight_radar.cache import CacheBackend, CacheStats, CacheStatsRecorder
+from flight_radar.metrics import InMemoryMetricsSink
+
+
+def test_should_count_per_endpoint_and_measure_the_stored_entries():
+    metrics = InMemoryMetricsSink()
+    recorder = CacheStatsRecorder('http', metrics)
+    recorder.record('live', 'hits')
+    recorder.record('live', 'hits')
+    recorder.record('live', 'misses')
+    recorder.record('static', 'evictions', 3)
+
+    stats = recorder.snapshot([('live', 100, 90.0), ('live', 50, 70.0), ('historic', 10, 100.0)], now=100.0)
+
+    assert stats == {
+        'historic': CacheStats(entries=1, bytes_stored=10, mean_entry_age=0.0),
+        'live': CacheStats(hits=2, misses=1, entries=2, bytes_stored=150, mean_entry_age=20.0),
+        'static': CacheStats(evictions=3),
+    }
+    snapshot = metrics.snapshot()
+    assert snapshot.counters == {
+        'cache.hits{cache=http,endpoint=live}': 2,
+        'cache.misses{cache=http,endpoint=live}': 1,
+        'cache.evictions{cache=http,endpoint=static}': 3,
+    }
+    assert snapshot.gauges['cache.bytes_stored{cache=http,endpoint=live}'] == 150
+    assert snapshot.gauges['cache.mean_entry_age{cache=http,endpoint=live}'] == 20.0
+    assert snapshot.gauges['cache.entries{cache=http,endpoint=static}'] == 0
+    assert 'cache.mean_entry_age{cache=http,endpoint=static}' not in snapshot.gauges
+
+
+def test_should_not_share_snapshots_with_the_recorder():
+    recorder = CacheStatsRecorder('http')
+    recorder.record('live', 'hits')
+    recorder.snapshot([], now=0.0)['live'].hits = 10
+
+    assert recorder.snapshot([], now=0.0)['live'].hits == 1
+
+
+def test_backends_should_list_no_entries_by_default():
+    class Backend(CacheBackend):
+        get = set = delete = clear = lambda *args: None
+
+    assert list(Backend().entries()) == []
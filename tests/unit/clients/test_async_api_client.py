@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.enums.enums import HTTPStatus
+from flight_radar.errors import (
+    BadRequestError,
+    InsufficientCredits,
+    InternalServerError,
+    InvalidResponseError,
+    NotFoundError,
+    TooManyRequestsError,
+    UnauthorizedError,
+)
+
+
+def _api_client(handler) -> AsyncFlightRadarApiClient:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncFlightRadarApiClient(client, 'https://api.flightradar24.com', 'test')
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+@pytest.mark.parametrize(
+    'status_code, error_class',
+    [
+        (HTTPStatus.BAD_REQUEST, BadRequestError),
+        (HTTPStatus.UNAUTHORIZED, UnauthorizedError),
+        (HTTPStatus.PAYMENT_REQUIRED, InsufficientCredits),
+        (HTTPStatus.NOT_FOUND, NotFoundError),
+        (HTTPStatus.TOO_MANY_REQUESTS, TooManyRequestsError),
+        (HTTPStatus.INTERNAL_SERVER_ERROR, InternalServerError),
+    ],
+)
+@pytest.mark.parametrize('method', ['get', 'get_many'])
+def test_should_handle_non_success_case(status_code, error_class, method):
+    api_client = _api_client(lambda request: httpx.Response(status_code.value, json={'message': 'error'}))
+
+    with pytest.raises(error_class):
+        asyncio.run(getattr(api_client, method)('/test-path', DummyResponse))
+
+
+@pytest.mark.parametrize('method', ['get', 'get_many'])
+def test_should_handle_unparsable_response(method):
+    api_client = _api_client(lambda request: httpx.Response(200, json='invalid'))
+
+    with pytest.raises(InvalidResponseError):
+        asyncio.run(getattr(api_client, method)('/test-path', DummyResponse))
+
+
+def test_should_send_auth_headers_and_drop_none_params():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={'name': 'ok'})
+
+    api_client = _api_client(handler)
+
+    response = asyncio.run(api_client.get('/test-path', DummyResponse, {'bounds': None, 'limit': 10}))
+
+    assert response.name == 'ok'
+    assert str(seen[0].url) == 'https://api.flightradar24.com/test-path?limit=10'
+    assert seen[0].headers['Authorization'] == 'Bearer test'
+    assert seen[0].headers['Accept-Version'] == 'v1'
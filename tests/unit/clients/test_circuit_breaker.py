@@ -0,0 +1,187 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+from pydantic import BaseModel
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from flight_radar.enums.enums import CircuitState, EndpointFamily
+from flight_radar.clients.deadline import deadline
+from flight_radar.errors import CircuitOpenError, DeadlineExceededError, InternalServerError, NotFoundError
+from flight_radar.metrics import InMemoryMetricsSink
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, metrics=None, **config) -> CircuitBreaker:
+    return CircuitBreaker(EndpointFamily.LIVE, CircuitBreakerConfig(**config), metrics, clock)
+
+
+def test_should_open_after_consecutive_failures_and_reject_calls():
+    metrics = InMemoryMetricsSink()
+    breaker = _breaker(FakeClock(), metrics, failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    snapshot = metrics.snapshot()
+    assert snapshot.gauges['circuit_breaker.state{family=live}'] == 2
+    assert snapshot.counters['circuit_breaker.opened{family=live}'] == 1
+    assert snapshot.counters['circuit_breaker.rejected{family=live}'] == 1
+
+
+def test_success_should_reset_the_failure_count():
+    breaker = _breaker(FakeClock(), failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_should_let_a_probe_through_after_the_recovery_timeout():
+    clock = FakeClock()
+    breaker = _breaker(clock, failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure()
+
+    clock.now = 10
+    breaker.before_call()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failed_probe_should_reopen_the_circuit():
+    clock = FakeClock()
+    breaker = _breaker(clock, failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure()
+    clock.now = 10
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def _failing_session(status_code: int) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = status_code
+    session.get.return_value.__enter__.return_value.json.return_value = {'message': 'error'}
+    return session
+
+
+def test_api_client_should_fail_fast_once_the_circuit_of_a_family_is_open():
+    session = _failing_session(500)
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        circuit_breakers={EndpointFamily.STATIC: CircuitBreakerConfig(failure_threshold=2)},
+    )
+
+    for _ in range(2):
+        with pytest.raises(InternalServerError):
+            api_client.get('/static/airports/ESSA/full', DummyResponse)
+    with pytest.raises(CircuitOpenError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    assert session.get.call_count == 2
+    # Other families have their own circuit, or none at all
+    with pytest.raises(InternalServerError):
+        api_client.get('/live/flight-positions/full', DummyResponse)
+
+
+def test_api_client_should_count_transport_errors_but_not_client_errors():
+    session = _failing_session(404)
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        circuit_breakers={EndpointFamily.STATIC: CircuitBreakerConfig(failure_threshold=1)},
+    )
+
+    with pytest.raises(NotFoundError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+    assert api_client.circuit_breakers[EndpointFamily.STATIC].state == CircuitState.CLOSED
+
+    session.get.side_effect = requests.ConnectionError('connection refused')
+    with pytest.raises(requests.ConnectionError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+    assert api_client.circuit_breakers[EndpointFamily.STATIC].state == CircuitState.OPEN
+
+
+def test_deadline_timeouts_should_neither_close_nor_open_the_circuit():
+    clock = FakeClock()
+    session = _failing_session(500)
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        circuit_breakers={EndpointFamily.STATIC: CircuitBreakerConfig(failure_threshold=2, recovery_timeout=10)},
+    )
+    breaker = api_client.circuit_breakers[EndpointFamily.STATIC]
+    breaker._clock = clock
+    with pytest.raises(InternalServerError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    session.get.side_effect = requests.Timeout('read timed out')
+    for _ in range(2):
+        with deadline(5), pytest.raises(DeadlineExceededError):
+            api_client.get('/static/airports/ESSA/full', DummyResponse)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker._failures == 1
+
+    breaker.record_failure()
+    clock.now = 10
+    with deadline(5), pytest.raises(DeadlineExceededError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+    # The probe was given back instead of closing the circuit
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+
+
+def test_async_api_client_should_fail_fast_once_the_circuit_is_open():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError('connection refused')
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        'https://api.flightradar24.com',
+        'test',
+        circuit_breakers={EndpointFamily.STATIC: CircuitBreakerConfig(failure_threshold=1)},
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse))
+
+    assert len(calls) == 1
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+from pydantic import BaseModel
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.deadline import TimeoutConfig, deadline, remaining_time
+from flight_radar.clients.hedging import HedgingConfig
+from flight_radar.clients.rate_limiter import RetryPolicy
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.errors import DeadlineExceededError, TooManyRequestsError
+
+BASE_URL = 'https://api.flightradar24.com'
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+def _session(status_code: int = 200, headers: dict | None = None) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = status_code
+    session.get.return_value.__enter__.return_value.headers = headers or {}
+    session.get.return_value.__enter__.return_value.json.return_value = {'name': 'ok', 'message': 'error'}
+    return session
+
+
+def test_remaining_time_should_only_be_set_inside_a_deadline():
+    assert remaining_time() is None
+
+    with deadline(10):
+        assert 9 < remaining_time() <= 10
+        with deadline(60):
+            # Nested deadlines cannot extend the outer one
+            assert remaining_time() <= 10
+        with deadline(1):
+            assert remaining_time() <= 1
+
+    assert remaining_time() is None
+
+
+def test_should_send_connect_and_read_timeouts_per_family():
+    session = _session()
+    api_client = FlightRadarApiClient(
+        session,
+        BASE_URL,
+        'test',
+        timeout=TimeoutConfig(connect=2, read=10),
+        family_timeouts={EndpointFamily.HISTORIC: TimeoutConfig(connect=2, read=60)},
+    )
+
+    api_client.get('/static/airports/ESSA/full', DummyResponse)
+    assert session.get.call_args.kwargs['timeout'] == (2, 10)
+
+    api_client.get('/historic/flight-positions/full', DummyResponse)
+    assert session.get.call_args.kwargs['timeout'] == (2, 60)
+
+
+def test_should_shorten_timeouts_to_the_remaining_deadline():
+    session = _session()
+    api_client = FlightRadarApiClient(session, BASE_URL, 'test')
+
+    with deadline(1):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    connect_timeout, read_timeout = session.get.call_args.kwargs['timeout']
+    assert 0 < connect_timeout <= 1
+    assert 0 < read_timeout <= 1
+
+
+def test_should_not_send_requests_once_the_deadline_has_passed():
+    session = _session()
+    api_client = FlightRadarApiClient(session, BASE_URL, 'test')
+
+    with deadline(0), pytest.raises(DeadlineExceededError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    session.get.assert_not_called()
+
+
+def test_should_turn_timeouts_caused_by_the_deadline_into_deadline_exceeded():
+    session = _session()
+    session.get.side_effect = requests.ReadTimeout('read timed out')
+    api_client = FlightRadarApiClient(session, BASE_URL, 'test')
+
+    with deadline(1), pytest.raises(DeadlineExceededError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    with pytest.raises(requests.ReadTimeout):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+
+def test_should_not_retry_when_the_backoff_does_not_fit_in_the_deadline():
+    session = _session(429, {'Retry-After': '5'})
+    api_client = FlightRadarApiClient(session, BASE_URL, 'test', retry_policy=RetryPolicy())
+
+    with deadline(1), pytest.raises(TooManyRequestsError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    session.get.assert_called_once()
+
+
+def test_hedged_requests_should_share_the_deadline_of_the_caller():
+    timeouts = []
+
+    def get(url, params=None, timeout=None):
+        timeouts.append((threading.current_thread().name, timeout))
+        return session.get.return_value
+
+    session = _session()
+    session.get.side_effect = get
+    api_client = FlightRadarApiClient(
+        session, BASE_URL, 'test', hedging={EndpointFamily.STATIC: HedgingConfig(initial_delay=1.0)}
+    )
+
+    with deadline(2):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    [(thread_name, (connect_timeout, read_timeout))] = timeouts
+    assert thread_name.startswith('flight-radar-hedge')
+    assert read_timeout <= 2
+
+
+def test_async_should_send_timeouts_and_raise_when_the_deadline_is_exceeded():
+    timeouts = []
+
+    async def handler(request):
+        timeouts.append(request.extensions['timeout'])
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={'name': 'ok'})
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        BASE_URL,
+        'test',
+        timeout=TimeoutConfig(connect=2, read=10),
+    )
+
+    async def fetch():
+        with deadline(0.05):
+            return await api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(fetch())
+
+    assert timeouts[0]['read'] <= 0.05
+    assert timeouts[0]['connect'] <= 0.05
+
+
+def test_async_should_use_configured_timeouts_without_a_deadline():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions['timeout'])
+        return httpx.Response(200, json={'name': 'ok'})
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)), BASE_URL, 'test', timeout=TimeoutConfig(read=7)
+    )
+
+    asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse))
+
+    assert timeouts == [{'connect': 5.0, 'read': 7.0, 'write': 7.0, 'pool': 5.0}]
+
+
+def test_async_should_reraise_timeouts_without_a_deadline():
+    def handler(request):
+        raise httpx.ReadTimeout('read timed out')
+
+    api_client = AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)), BASE_URL, 'test')
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse))
@@ -0,0 +1,76 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.dtos import (
+    GetAirportResponseDto,
+    GetFlightSummaryResponseDto,
+    GetFlightTracksResponseDto,
+    GetHistoricFlightPositionResponseDto,
+    GetLiveFlightPositionLightResponseDto,
+    GetLiveFlightPositionResponseDto,
+    HistoricFlightEventResponseDto,
+)
+from flight_radar.errors import InvalidResponseError
+
+
+def _session(path: str) -> MagicMock:
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    session = MagicMock()
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = content
+    mock_response.json.return_value = json.loads(content)
+    session.get.return_value.__enter__.return_value = mock_response
+    return session
+
+
+@pytest.mark.parametrize(
+    'fixture, response_dto_class',
+    [
+        ('get_airports.json', GetAirportResponseDto),
+        ('get_flight_positions.json', GetLiveFlightPositionResponseDto),
+        ('get_flight_positions_light.json', GetLiveFlightPositionLightResponseDto),
+        ('get_historic_flight_positions.json', GetHistoricFlightPositionResponseDto),
+        ('get_flight_summary.json', GetFlightSummaryResponseDto),
+        ('get_historic_flight_events.json', HistoricFlightEventResponseDto),
+    ],
+)
+def test_should_decode_bytes_to_same_dto_as_json_path(fixture, response_dto_class):
+    session = _session(f'tests/fixtures/{fixture}')
+
+    fast = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', fast_decode=True)
+    slow = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test')
+
+    assert fast.get('/test-path', response_dto_class) == slow.get('/test-path', response_dto_class)
+
+
+def test_should_decode_list_bytes_with_type_adapter():
+    api_client = FlightRadarApiClient(
+        _session('tests/fixtures/get_flight_tracks.json'),
+        'https://api.flightradar24.com',
+        'test',
+        fast_decode=True,
+    )
+
+    dtos = api_client.get_many('/flight-tracks', GetFlightTracksResponseDto)
+
+    assert isinstance(dtos, list)
+    assert dtos[0].fr24_id == '35f2ffd9'
+    assert len(dtos[0].tracks) != 0
+
+
+@pytest.mark.parametrize('method', ['get', 'get_many'])
+@pytest.mark.parametrize('content', [b'not json', b'{"data": "invalid"}'])
+def test_should_raise_invalid_response_for_unparsable_bytes(method, content):
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 200
+    session.get.return_value.__enter__.return_value.content = content
+    api_client = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', fast_decode=True)
+
+    with pytest.raises(InvalidResponseError):
+        getattr(api_client, method)('/test-path', GetLiveFlightPositionResponseDto)
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.hedging import Hedger, HedgingConfig
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.errors import InternalServerError
+from flight_radar.metrics import InMemoryMetricsSink
+from flight_radar.services.service import FlightRadarClient
+
+HEDGING = {EndpointFamily.STATIC: HedgingConfig(initial_delay=0.01)}
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+def test_hedger_should_use_initial_delay_until_enough_samples():
+    hedger = Hedger(EndpointFamily.LIVE, HedgingConfig(initial_delay=2.0, min_samples=3))
+
+    hedger.record_latency(0.1)
+
+    assert hedger.delay() == 2.0
+
+
+def test_hedger_should_use_the_configured_percentile_within_bounds():
+    hedger = Hedger(EndpointFamily.LIVE, HedgingConfig(percentile=90, min_samples=10, min_delay=0.0, max_delay=5.0))
+    for latency in range(1, 11):
+        hedger.record_latency(latency / 10)
+
+    assert hedger.delay() == 1.0
+
+    hedger.config = HedgingConfig(percentile=90, min_samples=10, max_delay=0.5)
+    assert hedger.delay() == 0.5
+
+
+def _session(responses: list) -> MagicMock:
+    """Session whose n-th call blocks on ``responses[n][0]`` and then answers with status ``responses[n][1]``."""
+    calls = iter(responses)
+    lock = threading.Lock()
+
+    def get(url, params=None, timeout=None):
+        with lock:
+            release, status_code = next(calls)
+        release.wait(timeout=5)
+        response = MagicMock()
+        response.__enter__.return_value.status_code = status_code
+        response.__enter__.return_value.json.return_value = {'name': str(status_code), 'message': 'error'}
+        return response
+
+    session = MagicMock()
+    session.get.side_effect = get
+    return session
+
+
+def test_should_raise_the_primary_error_when_both_requests_fail():
+    metrics = InMemoryMetricsSink()
+    slow = threading.Event()
+    fast = threading.Event()
+    fast.set()
+    threading.Timer(0.1, slow.set).start()
+    api_client = FlightRadarApiClient(
+        _session([(slow, 500), (fast, 404)]), 'https://api.flightradar24.com', 'test', hedging=HEDGING, metrics=metrics
+    )
+
+    with pytest.raises(InternalServerError):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    counters = metrics.snapshot().counters
+    assert counters['hedging.sent{family=static}'] == 1
+    assert 'hedging.won{family=static}' not in counters
+
+
+def test_should_prefer_the_first_successful_response():
+    metrics = InMemoryMetricsSink()
+    slow = threading.Event()
+    fast = threading.Event()
+    fast.set()
+    api_client = FlightRadarApiClient(
+        _session([(slow, 200), (fast, 200)]), 'https://api.flightradar24.com', 'test', hedging=HEDGING, metrics=metrics
+    )
+
+    try:
+        assert api_client.get('/static/airports/ESSA/full', DummyResponse).name == '200'
+    finally:
+        slow.set()
+
+    assert metrics.snapshot().counters['hedging.won{family=static}'] == 1
+    assert len(api_client.hedgers[EndpointFamily.STATIC]._latencies) == 1
+
+
+def test_closing_the_client_should_stop_the_hedging_threads_and_close_the_session():
+    slow = threading.Event()
+    fast = threading.Event()
+    fast.set()
+    session = _session([(slow, 200), (fast, 200)])
+
+    with FlightRadarClient(
+        FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', hedging=HEDGING)
+    ) as client:
+        try:
+            assert client.api_client.get('/static/airports/ESSA/full', DummyResponse).name == '200'
+        finally:
+            slow.set()
+
+    assert client.api_client._hedge_executor._shutdown
+    session.close.assert_called_once()
+
+
+def test_should_not_hedge_fast_requests_or_other_families():
+    metrics = InMemoryMetricsSink()
+    released = threading.Event()
+    released.set()
+    session = _session([(released, 200), (released, 200)])
+    api_client = FlightRadarApiClient(
+        session, 'https://api.flightradar24.com', 'test', hedging=HEDGING, metrics=metrics
+    )
+
+    api_client.get('/static/airports/ESSA/full', DummyResponse)
+    api_client.get('/live/flight-positions/full', DummyResponse)
+
+    assert session.get.call_count == 2
+    assert metrics.snapshot().counters == {}
+
+
+def test_async_should_return_the_hedged_response_and_cancel_the_primary():
+    metrics = InMemoryMetricsSink()
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={'name': f'call {len(calls)}'})
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        'https://api.flightradar24.com',
+        'test',
+        hedging=HEDGING,
+        metrics=metrics,
+    )
+
+    response = asyncio.run(asyncio.wait_for(api_client.get('/static/airports/ESSA/full', DummyResponse), 1))
+
+    assert response.name == 'call 2'
+    assert metrics.snapshot().counters['hedging.won{family=static}'] == 1
+
+
+def test_async_should_raise_the_primary_error_when_both_requests_fail():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(500, json={'message': 'error'})
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        'https://api.flightradar24.com',
+        'test',
+        hedging=HEDGING,
+    )
+
+    with pytest.raises(InternalServerError):
+        asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse))
+
+
+def test_async_should_not_hedge_fast_requests():
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={'name': 'ok'}))),
+        'https://api.flightradar24.com',
+        'test',
+        hedging={EndpointFamily.STATIC: HedgingConfig(initial_delay=1.0)},
+    )
+
+    assert asyncio.run(api_client.get('/static/airports/ESSA/full', DummyResponse)).name == 'ok'
@@ -0,0 +1,343 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flight_radar.cache import CacheStats, MemoryCache, SQLiteCache
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.http_cache import CachePolicy, ResponseCache
+from flight_radar.enums.enums import EndpointFamily
+from flight_radar.errors import InternalServerError, InvalidResponseError, NotFoundError
+from flight_radar.metrics import InMemoryMetricsSink
+
+BASE_URL = 'https://api.flightradar24.com'
+URL = '/static/airports/ESSA/light'
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+class Server:
+    """Answers with a fixed body and validators, and with 304 when the request carries a matching one."""
+
+    def __init__(self, body: bytes = b'{"name": "ok"}', headers: dict | None = None):
+        self.body = body
+        self.headers = headers if headers is not None else {'ETag': '"v1"', 'Cache-Control': 'max-age=60'}
+        self.requests: list[dict] = []
+        self.failure: int | None = None
+
+    def respond(self, request_headers: dict) -> tuple[int, dict, bytes]:
+        self.requests.append(request_headers)
+        if self.failure is not None:
+            return self.failure, {}, b'{"message": "error"}'
+        etag, last_modified = self.headers.get('ETag'), self.headers.get('Last-Modified')
+        if (etag and request_headers.get('If-None-Match') == etag) or (
+            last_modified and request_headers.get('If-Modified-Since') == last_modified
+        ):
+            return 304, {key: value for key, value in self.headers.items() if key != 'Last-Modified'}, b''
+
+        return 200, self.headers, self.body
+
+    def session(self) -> MagicMock:
+        def get(url, params=None, timeout=None, headers=None):
+            status_code, response_headers, body = self.respond(headers or {})
+            response = MagicMock(status_code=status_code, headers=response_headers, content=body)
+            response.json.side_effect = lambda: json.loads(body)
+            result = MagicMock()
+            result.__enter__.return_value = response
+            return result
+
+        session = MagicMock()
+        session.get.side_effect = get
+        return session
+
+
+def _api_client(server: Server, cache: ResponseCache) -> FlightRadarApiClient:
+    return FlightRadarApiClient(server.session(), BASE_URL, 'test', response_cache=cache)
+
+
+def test_should_serve_fresh_responses_without_a_request(clock):
+    server = Server()
+    api_client = _api_client(server, ResponseCache(clock=clock))
+
+    first = api_client.get(URL, DummyResponse)
+    clock.now += 59
+
+    assert api_client.get(URL, DummyResponse) == first
+    assert len(server.requests) == 1
+
+
+def test_should_revalidate_stale_responses_and_serve_304_without_decoding_again(clock):
+    server = Server()
+    api_client = _api_client(server, ResponseCache(clock=clock))
+
+    first = api_client.get(URL, DummyResponse)
+    clock.now += 60
+    second = api_client.get(URL, DummyResponse)
+    clock.now += 30
+    third = api_client.get(URL, DummyResponse)
+
+    assert first is second is third
+    assert server.requests == [{}, {'If-None-Match': '"v1"'}]
+
+
+def test_should_revalidate_with_last_modified_on_every_call_without_max_age():
+    server = Server(headers={'Last-Modified': 'Wed, 21 Oct 2026 07:28:00 GMT'})
+    api_client = _api_client(server, ResponseCache())
+
+    first = api_client.get(URL, DummyResponse)
+
+    assert api_client.get(URL, DummyResponse) == first
+    assert api_client.get(URL, DummyResponse) == first
+    assert server.requests[1:] == [{'If-Modified-Since': 'Wed, 21 Oct 2026 07:28:00 GMT'}] * 2
+
+
+def test_should_replace_entries_whose_body_changed(clock):
+    server = Server(headers={'ETag': '"v1"'})
+    api_client = _api_client(server, ResponseCache(clock=clock))
+    api_client.get(URL, DummyResponse)
+
+    server.body, server.headers = b'{"name": "changed"}', {'ETag': '"v2"'}
+    clock.now += 1
+
+    assert api_client.get(URL, DummyResponse).name == 'changed'
+    assert api_client.get(URL, DummyResponse).name == 'changed'
+    assert server.requests[2] == {'If-None-Match': '"v2"'}
+
+
+def test_should_not_store_responses_that_cannot_be_reused():
+    for headers in ({}, {'ETag': '"v1"', 'Cache-Control': 'no-store'}):
+        server = Server(headers=headers)
+        api_client = _api_client(server, ResponseCache())
+
+        api_client.get(URL, DummyResponse)
+        api_client.get(URL, DummyResponse)
+
+        assert server.requests == [{}, {}]
+
+
+def test_should_skip_disabled_families_and_use_the_default_max_age_of_the_policy(clock):
+    server = Server(headers={})
+    cache = ResponseCache(
+        policies={EndpointFamily.LIVE: CachePolicy(enabled=False)},
+        default_policy=CachePolicy(default_max_age=10),
+        clock=clock,
+    )
+    api_client = _api_client(server, cache)
+
+    api_client.get(URL, DummyResponse)
+    api_client.get(URL, DummyResponse)
+    api_client.get('/live/flight-positions/light', DummyResponse, {'bounds': '1,2,3,4'})
+    api_client.get('/live/flight-positions/light', DummyResponse, {'bounds': '1,2,3,4'})
+
+    assert len(server.requests) == 3
+
+
+def test_should_compute_freshness_from_expires_age_and_no_cache(clock):
+    cache = ResponseCache(clock=clock)
+
+    assert cache.store('a', URL, {'Expires': 'Tue, 14 Nov 2023 22:15:00 GMT'}, b'{}').expires_at == clock.now + 100
+    assert cache.store('b', URL, {'Cache-Control': 'max-age=60', 'Age': '20'}, b'{}').expires_at == clock.now + 40
+    assert cache.store('c', URL, {'Cache-Control': 'no-cache', 'ETag': '"v1"'}, b'{}').expires_at == clock.now
+    assert cache.store('d', URL, {'Expires': 'never', 'ETag': '"v1"'}, b'{}').expires_at == clock.now
+    assert cache.store('e', URL, {'Cache-Control': 'no-cache'}, b'{}') is None
+
+
+def test_should_drop_entries_when_a_304_forbids_storing_them(clock):
+    cache = ResponseCache(clock=clock)
+    entry = cache.store('a', URL, {'ETag': '"v1"'}, b'{}')
+
+    assert cache.revalidated('a', URL, entry, {'Cache-Control': 'no-store'}) is entry
+    assert cache.lookup(URL, None) == (URL, None)
+    cache.clear()
+
+
+def test_should_decode_bodies_from_a_persistent_backend_after_a_restart(clock, tmp_path):
+    server = Server()
+    with _api_client(server, ResponseCache(SQLiteCache(tmp_path / 'responses.db'), clock=clock)) as api_client:
+        api_client.get(URL, DummyResponse)
+
+    clock.now += 120
+    with _api_client(server, ResponseCache(SQLiteCache(tmp_path / 'responses.db'), clock=clock)) as restarted:
+        result = restarted.get(URL, DummyResponse)
+
+    assert result == DummyResponse(name='ok')
+    assert api_client._refresh_executor._shutdown and restarted._refresh_executor._shutdown
+    assert server.requests == [{}, {'If-None-Match': '"v1"'}]
+
+
+def test_async_should_revalidate_and_serve_304_from_the_cache(clock):
+    server = Server(headers={'ETag': '"v1"'})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status_code, headers, body = server.respond(
+            {name: request.headers[name] for name in ('If-None-Match',) if name in request.headers}
+        )
+        return httpx.Response(status_code, headers=headers, content=body)
+
+    async def poll():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api_client = AsyncFlightRadarApiClient(
+                client, BASE_URL, 'test', fast_decode=True, response_cache=ResponseCache(clock=clock)
+            )
+            results = [await api_client.get_many(URL, DummyResponse) for _ in range(2)]
+            server.headers['Cache-Control'] = 'max-age=60'
+            clock.now += 1
+            results.append(await api_client.get_many(URL, DummyResponse))
+            results.append(await api_client.get_many(URL, DummyResponse))
+            return results
+
+    server.body = b'[{"name": "ok"}]'
+    results = asyncio.run(poll())
+
+    assert all(result is results[0] for result in results)
+    assert server.requests == [{}, {'If-None-Match': '"v1"'}, {'If-None-Match': '"v1"'}]
+
+
+def test_should_raise_invalid_response_error_for_stored_bodies_that_do_not_match_the_model():
+    cache = ResponseCache()
+    entry = cache.store('a', URL, {'ETag': '"v1"'}, b'[{"other": 1}]')
+    api_client = FlightRadarApiClient(MagicMock(), BASE_URL, 'test', response_cache=cache)
+
+    with pytest.raises(InvalidResponseError):
+        api_client._cached_result('a', entry, DummyResponse, many=True)
+
+
+STALE_POLICY = {EndpointFamily.STATIC: CachePolicy(stale_while_revalidate=60, stale_if_error=300)}
+
+
+def test_should_serve_stale_responses_while_refreshing_them_in_the_background(clock):
+    server = Server(headers={'Cache-Control': 'max-age=10'})
+    api_client = _api_client(server, ResponseCache(policies=STALE_POLICY, clock=clock))
+    first = api_client.get(URL, DummyResponse)
+
+    server.body = b'{"name": "refreshed"}'
+    clock.now += 15
+    stale = api_client.get(URL, DummyResponse)
+    api_client._refresh_executor.shutdown(wait=True)
+
+    assert stale == first
+    assert api_client.get(URL, DummyResponse).name == 'refreshed'
+    assert len(server.requests) == 2
+
+
+def test_should_fetch_synchronously_once_the_stale_window_has_passed(clock):
+    server = Server(headers={'Cache-Control': 'max-age=10'})
+    api_client = _api_client(server, ResponseCache(policies=STALE_POLICY, clock=clock))
+    api_client.get(URL, DummyResponse)
+
+    server.body = b'{"name": "refreshed"}'
+    clock.now += 70
+
+    assert api_client.get(URL, DummyResponse).name == 'refreshed'
+    assert len(server.requests) == 2
+
+
+def test_should_serve_stale_responses_on_upstream_errors_within_the_window(clock):
+    server = Server(headers={'Cache-Control': 'max-age=10'})
+    cache = ResponseCache(policies={EndpointFamily.STATIC: CachePolicy(stale_if_error=300)}, clock=clock)
+    api_client = _api_client(server, cache)
+    first = api_client.get(URL, DummyResponse)
+
+    server.failure = 500
+    clock.now += 100
+    assert api_client.get(URL, DummyResponse) == first
+
+    server.failure = 404
+    with pytest.raises(NotFoundError):
+        api_client.get(URL, DummyResponse)
+
+    server.failure = 500
+    clock.now += 300
+    with pytest.raises(InternalServerError):
+        api_client.get(URL, DummyResponse)
+
+
+def test_should_keep_serving_stale_responses_when_a_background_refresh_fails(clock):
+    server = Server(headers={'Cache-Control': 'max-age=10'})
+    cache = ResponseCache(policies=STALE_POLICY, clock=clock)
+    api_client = _api_client(server, cache)
+    first = api_client.get(URL, DummyResponse)
+
+    server.failure = 500
+    clock.now += 15
+    assert api_client.get(URL, DummyResponse) == first
+    api_client._refresh_executor.shutdown(wait=True)
+
+    assert cache.start_refresh(URL)
+    assert not cache.start_refresh(URL)
+    assert len(server.requests) == 2
+
+
+def test_async_should_serve_stale_responses_while_refreshing_and_on_errors(clock):
+    server = Server(headers={'Cache-Control': 'max-age=10'})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status_code, headers, body = server.respond({})
+        return httpx.Response(status_code, headers=headers, content=body)
+
+    async def poll():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api_client = AsyncFlightRadarApiClient(
+                client, BASE_URL, 'test', response_cache=ResponseCache(policies=STALE_POLICY, clock=clock)
+            )
+            first = await api_client.get(URL, DummyResponse)
+            server.body = b'{"name": "refreshed"}'
+            clock.now += 15
+            stale = await api_client.get(URL, DummyResponse)
+            await asyncio.gather(*api_client._refresh_tasks)
+            refreshed = await api_client.get(URL, DummyResponse)
+
+            server.failure = 500
+            clock.now += 15
+            await api_client.get(URL, DummyResponse)
+            await asyncio.gather(*api_client._refresh_tasks)
+            clock.now += 100
+            fallback = await api_client.get(URL, DummyResponse)
+
+            clock.now -= 100
+            await api_client.get(URL, DummyResponse)
+            assert api_client._refresh_tasks
+            await api_client.aclose()
+            return first, stale, refreshed, fallback
+
+    first, stale, refreshed, fallback = asyncio.run(poll())
+
+    assert stale == first
+    assert refreshed.name == fallback.name == 'refreshed'
+
+
+def test_should_keep_statistics_per_endpoint_family(clock):
+    server = Server()
+    metrics = InMemoryMetricsSink()
+    cache = ResponseCache(
+        MemoryCache(max_entries=2),
+        policies={EndpointFamily.LIVE: CachePolicy(stale_if_error=300)},
+        clock=clock,
+        metrics=metrics,
+    )
+    api_client = _api_client(server, cache)
+
+    api_client.get(URL, DummyResponse)
+    api_client.get(URL, DummyResponse)
+    clock.now += 61
+    api_client.get(URL, DummyResponse)
+    api_client.get('/live/flight-positions/light', DummyResponse)
+    api_client.get('/historic/flight-positions/light', DummyResponse)
+    server.failure = 500
+    clock.now += 61
+    api_client.get('/live/flight-positions/light', DummyResponse)
+
+    body = len(server.body)
+    assert cache.endpoint_stats() == {
+        'historic': CacheStats(misses=1, entries=1, bytes_stored=body, mean_entry_age=61.0),
+        'live': CacheStats(misses=2, stale_hits=1, entries=1, bytes_stored=body, mean_entry_age=61.0),
+        'static': CacheStats(hits=1, misses=2, revalidations=1, evictions=1),
+    }
+    assert metrics.snapshot().counters['cache.stale_hits{cache=http,endpoint=live}'] == 1
+    assert metrics.snapshot().gauges['cache.entries{cache=http,endpoint=static}'] == 0
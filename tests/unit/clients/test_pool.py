@@ -0,0 +1,113 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Request, Session
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.pool import KeepAliveHTTPAdapter, PoolConfig
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"name": "ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_should_mount_adapter_with_pool_settings():
+    session = Session()
+    FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        pool_config=PoolConfig(pool_connections=2, pool_maxsize=32, pool_block=True),
+    )
+
+    adapter = session.get_adapter('https://api.flightradar24.com')
+    assert isinstance(adapter, KeepAliveHTTPAdapter)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw['socket_options']
+
+
+def test_should_close_connections_when_keep_alive_is_disabled():
+    session = Session()
+    FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', pool_config=PoolConfig(keep_alive=False))
+
+    assert session.headers['Connection'] == 'close'
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in PoolConfig(keep_alive=False).socket_options()
+    assert PoolConfig(keep_alive=False).to_httpx_limits().max_keepalive_connections == 0
+
+
+def test_should_prewarm_connections_that_are_reused_by_requests(server_url):
+    session = Session()
+    api_client = FlightRadarApiClient(session, server_url, 'test', pool_config=PoolConfig(pool_maxsize=4))
+
+    assert api_client.prewarm(10) == 4
+
+    request = Request('GET', server_url).prepare()
+    pool = session.get_adapter(server_url).get_connection_with_tls_context(request, verify=session.verify)
+    assert pool.num_connections == 4
+    assert all(connection is not None and connection.is_connected for connection in pool.pool.queue)
+
+    session.get(f'{server_url}/ping').close()
+    assert pool.num_connections == 4
+
+
+def test_should_stop_prewarming_when_host_is_unreachable():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+    session = Session()
+    api_client = FlightRadarApiClient(
+        session, f'http://127.0.0.1:{port}', 'test', pool_config=PoolConfig(pool_maxsize=3, pool_block=True)
+    )
+
+    assert api_client.prewarm(3) == 0
+
+    request = Request('GET', f'http://127.0.0.1:{port}').prepare()
+    pool = session.get_adapter(request.url).get_connection_with_tls_context(request, verify=session.verify)
+    assert pool.pool.qsize() == 3
+    assert all(connection is None for connection in pool.pool.queue)
+
+
+def test_should_not_prewarm_a_closed_pool(server_url):
+    session = Session()
+    api_client = FlightRadarApiClient(session, server_url, 'test', pool_config=PoolConfig())
+    request = Request('GET', server_url).prepare()
+    session.get_adapter(server_url).get_connection_with_tls_context(request, verify=session.verify).close()
+
+    assert api_client.prewarm(3) == 0
+
+
+def test_should_find_the_private_urllib3_api_prewarming_relies_on(server_url):
+    # prewarm borrows connections through private urllib3 and requests attributes, fail loudly if they change
+    session = Session()
+    FlightRadarApiClient(session, server_url, 'test', pool_config=PoolConfig())
+    adapter = session.get_adapter(server_url)
+    pool = adapter.get_connection_with_tls_context(Request('GET', server_url).prepare(), verify=session.verify)
+
+    assert isinstance(adapter._pool_maxsize, int)
+    assert callable(pool._get_conn) and callable(pool._put_conn)
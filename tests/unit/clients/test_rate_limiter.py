@@ -0,0 +1,217 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.deadline import deadline
+from flight_radar.clients.rate_limiter import RateLimiter, RetryPolicy, TokenBucket, parse_retry_after
+from flight_radar.enums.enums import ApiPlan, EndpointFamily
+from flight_radar.errors import DeadlineExceededError, TooManyRequestsError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+def _response(status_code: int, headers: dict | None = None, body=None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body if body is not None else {'name': 'ok'}
+    return response
+
+
+def _session(*responses) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value.__enter__.side_effect = list(responses)
+    return session
+
+
+def test_token_bucket_should_queue_callers_once_burst_is_used():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 1, 2]
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_should_not_refill_while_paused():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=5, clock=clock)
+
+    bucket.pause(30)
+
+    assert bucket.reserve() == 31
+    clock.now = 30
+    assert bucket.reserve() == 2
+
+
+def test_rate_limiter_should_apply_plan_and_family_limits():
+    clock = FakeClock()
+    limiter = RateLimiter.for_plan(
+        ApiPlan.ADVANCED,
+        family_requests_per_minute={EndpointFamily.HISTORIC: 6},
+        clock=clock,
+    )
+
+    assert limiter.reserve(EndpointFamily.LIVE) == 0
+    clock.now = 1
+    assert limiter.reserve(EndpointFamily.HISTORIC) == 0
+    clock.now = 2
+    assert limiter.reserve(EndpointFamily.LIVE) == 0
+    assert limiter.reserve(EndpointFamily.HISTORIC) == pytest.approx(9)
+
+
+def test_rate_limiter_should_back_off_when_api_reports_no_remaining_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=600, burst=10, clock=clock)
+
+    limiter.observe(EndpointFamily.LIVE, 200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '20'})
+
+    assert limiter.reserve(EndpointFamily.LIVE) == pytest.approx(20.1)
+
+
+@pytest.mark.parametrize(
+    'headers, expected',
+    [
+        ({'Retry-After': '12'}, 12),
+        ({'Retry-After': 'Thu, 01 Jan 1970 00:01:40 GMT'}, 40),
+        ({'Retry-After': 'soon'}, None),
+        ({'X-RateLimit-Reset': '5'}, 5),
+        ({'RateLimit-Reset': '1700000030'}, 30),
+        ({'X-RateLimit-Reset': 'never'}, None),
+        ({}, None),
+    ],
+)
+def test_should_parse_retry_after_headers(headers, expected):
+    now = 1700000000 if 'RateLimit-Reset' in headers else 60
+    assert parse_retry_after(headers, now=lambda: now) == expected
+
+
+def test_retry_policy_should_honour_retry_after_and_cap_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=8)
+
+    assert 30 <= policy.delay(0, retry_after=30) <= 31
+    assert all(0 <= policy.delay(10) <= 8 for _ in range(100))
+
+
+def test_should_retry_rate_limited_requests(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('flight_radar.clients.api_client.time.sleep', sleeps.append)
+    session = _session(_response(429, {'Retry-After': '2'}), _response(429), _response(200))
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        retry_policy=RetryPolicy(backoff_base=1),
+    )
+
+    assert api_client.get('/live/flight-positions/full', DummyResponse).name == 'ok'
+    assert session.get.call_count == 3
+    assert 2 <= sleeps[0] <= 3
+    assert 0 <= sleeps[1] <= 2
+
+
+def test_should_raise_too_many_requests_once_retries_are_exhausted(monkeypatch):
+    monkeypatch.setattr('flight_radar.clients.api_client.time.sleep', lambda seconds: None)
+    session = _session(*[_response(429, body={'message': 'slow down'}) for _ in range(3)])
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        retry_policy=RetryPolicy(max_retries=2),
+    )
+
+    with pytest.raises(TooManyRequestsError):
+        api_client.get_many('/flight-tracks', DummyResponse)
+    assert session.get.call_count == 3
+
+
+def test_should_throttle_before_sending(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('flight_radar.clients.rate_limiter.time.sleep', sleeps.append)
+    clock = FakeClock()
+    session = _session(*[_response(200) for _ in range(3)])
+    api_client = FlightRadarApiClient(
+        session,
+        'https://api.flightradar24.com',
+        'test',
+        rate_limiter=RateLimiter(requests_per_minute=60, clock=clock),
+    )
+
+    for _ in range(3):
+        api_client.get('/static/airports/ESSA/full', DummyResponse)
+
+    assert sleeps == [1, 2]
+
+
+def test_should_not_wait_for_the_rate_limiter_past_the_deadline(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('flight_radar.clients.rate_limiter.time.sleep', sleeps.append)
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, family_requests_per_minute={EndpointFamily.HISTORIC: 6}, clock=clock)
+    session = _session(_response(200))
+    api_client = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', rate_limiter=limiter)
+    api_client.get('/historic/flight-positions/full', DummyResponse)
+
+    with deadline(1), pytest.raises(DeadlineExceededError):
+        api_client.get('/historic/flight-positions/full', DummyResponse)
+
+    assert sleeps == []
+    assert session.get.call_count == 1
+    # The tokens of the abandoned request are handed back
+    assert limiter.reserve(EndpointFamily.HISTORIC) == pytest.approx(10)
+
+
+def test_async_should_not_wait_for_the_rate_limiter_past_the_deadline():
+    limiter = RateLimiter(requests_per_minute=6, clock=FakeClock())
+
+    async def acquire():
+        await limiter.acquire_async(EndpointFamily.LIVE)
+        with deadline(1):
+            await limiter.acquire_async(EndpointFamily.LIVE)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(acquire())
+
+
+def test_async_client_should_retry_rate_limited_requests(monkeypatch):
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr('flight_radar.clients.async_api_client.asyncio.sleep', sleep)
+    monkeypatch.setattr('flight_radar.clients.rate_limiter.asyncio.sleep', sleep)
+    responses = iter(
+        [
+            httpx.Response(429, headers={'Retry-After': '3'}, json={'message': 'slow down'}),
+            httpx.Response(200, json={'name': 'ok'}),
+        ]
+    )
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses))),
+        'https://api.flightradar24.com',
+        'test',
+        rate_limiter=RateLimiter(requests_per_minute=6000, burst=10),
+        retry_policy=RetryPolicy(backoff_base=0.5),
+    )
+
+    response = asyncio.run(api_client.get('/historic/flight-positions/full', DummyResponse))
+
+    assert response.name == 'ok'
+    assert 3 <= sleeps[0] <= 3.5
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.endpoints import canonical_request_key
+from flight_radar.clients.single_flight import SingleFlight
+from flight_radar.errors import NotFoundError
+
+
+class DummyResponse(BaseModel):
+    name: str
+
+
+def _blocking_session(release: threading.Event, status_code: int = 200) -> MagicMock:
+    def get(url, params=None, timeout=None):
+        release.wait(timeout=5)
+        return session.get.return_value
+
+    session = MagicMock()
+    session.get.side_effect = get
+    session.get.return_value.__enter__.return_value.status_code = status_code
+    session.get.return_value.__enter__.return_value.json.return_value = {'name': 'ok'}
+    return session
+
+
+def _run_concurrently(calls: int, fn, release: threading.Event, api_client) -> list:
+    with ThreadPoolExecutor(max_workers=calls) as executor:
+        futures = [executor.submit(fn) for _ in range(calls)]
+        while api_client.single_flight.stats().coalesced + api_client.single_flight.stats().executed < calls:
+            time.sleep(0.001)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_canonical_request_key_should_ignore_parameter_order_and_none_values():
+    assert canonical_request_key(
+        '/live/flight-positions/full', {'limit': 10, 'bounds': '1,2,3,4', 'flights': None}
+    ) == (canonical_request_key('/live/flight-positions/full', {'bounds': '1,2,3,4', 'limit': 10}))
+    assert canonical_request_key('/static/airports/ESSA/full') == '/static/airports/ESSA/full'
+
+
+def test_canonical_request_key_should_sort_list_values_but_not_bounds():
+    assert canonical_request_key('/live/flight-positions/full', {'callsigns': 'B,A,B', 'bounds': '4,3,2,1'}) == (
+        '/live/flight-positions/full?bounds=4,3,2,1&callsigns=A,B'
+    )
+
+
+def test_should_share_one_request_between_identical_concurrent_calls():
+    release = threading.Event()
+    session = _blocking_session(release)
+    api_client = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', coalesce_requests=True)
+
+    results = _run_concurrently(
+        8, lambda: api_client.get('/static/airports/ESSA/full', DummyResponse), release, api_client
+    )
+
+    assert session.get.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert api_client.single_flight.stats().executed == 1
+    assert api_client.single_flight.stats().coalesced == 7
+
+
+def test_should_share_errors_between_identical_concurrent_calls():
+    release = threading.Event()
+    session = _blocking_session(release, status_code=404)
+    api_client = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', coalesce_requests=True)
+
+    results = _run_concurrently(
+        4, lambda: api_client.get('/static/airports/XXXX/full', DummyResponse), release, api_client
+    )
+
+    assert session.get.call_count == 1
+    assert all(isinstance(result, NotFoundError) for result in results)
+
+
+def test_should_not_coalesce_sequential_or_different_calls():
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 200
+    session.get.return_value.__enter__.return_value.json.return_value = [{'name': 'ok'}]
+    api_client = FlightRadarApiClient(session, 'https://api.flightradar24.com', 'test', coalesce_requests=True)
+
+    api_client.get_many('/flight-tracks', DummyResponse, {'flight_id': '1'})
+    api_client.get_many('/flight-tracks', DummyResponse, {'flight_id': '1'})
+    api_client.get_many('/flight-tracks', DummyResponse, {'flight_id': '2'})
+
+    assert session.get.call_count == 3
+    assert api_client.single_flight.stats().coalesced == 0
+
+
+def test_single_flight_should_release_key_after_failure():
+    single_flight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', lambda: (_ for _ in ()).throw(ValueError()))
+
+    assert single_flight.do('key', lambda: 'ok') == 'ok'
+
+
+def test_async_client_should_share_one_request_between_identical_concurrent_calls():
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={'name': 'ok'})
+
+    api_client = AsyncFlightRadarApiClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        'https://api.flightradar24.com',
+        'test',
+        coalesce_requests=True,
+    )
+
+    async def call():
+        return await asyncio.gather(
+            *[api_client.get('/static/airports/ESSA/full', DummyResponse) for _ in range(10)],
+            api_client.get('/static/airports/ESSA/light', DummyResponse),
+        )
+
+    results = asyncio.run(call())
+
+    assert len(sent) == 2
+    assert all(result is results[0] for result in results[:10])
+    assert api_client.single_flight.stats().coalesced == 9
+    assert api_client.single_flight.stats().executed == 2
@@ -1,7 +1,20 @@
 import json
+import time
+from typing import Callable
+from unittest.mock import MagicMock
+from urllib.parse import urlsplit
 
+import httpx
 import pytest
 
+from flight_radar.cache import CacheEntry, MemoryCache
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.service import FlightRadarClient
+
+BASE_URL = 'https://api.flightradar24.com'
+
 
 @pytest.fixture
 def mock_get_airports_light_response():
@@ -97,3 +110,83 @@ def mock_get_historic_flight_events_light_response():
 def mock_get_historic_flight_events_response():
     with open('tests/fixtures/get_historic_flight_events.json', 'r') as f:
         return json.load(f)
+
+
+class SlowBackend(MemoryCache):
+    """Memory backend that blocks like a database waiting for the write lock of another process."""
+
+    delay = 0.2
+
+    def get(self, key: str) -> CacheEntry | None:
+        time.sleep(self.delay)
+        return super().get(key)
+
+
+@pytest.fixture
+def slow_backend():
+    return SlowBackend()
+
+
+class Clock:
+    """Wall clock that only moves when a test sets ``now``."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+class FakeApi:
+    """
+    Stand-in for the API, behind a mocked ``requests.Session`` or an ``httpx.MockTransport``.
+
+    ``respond`` is called with the path and the query parameters of every request, and returns the JSON body, or a
+    status code and JSON body pair. Requests are recorded in ``calls``.
+    """
+
+    def __init__(self, respond: Callable[[str, dict], dict | tuple[int, dict]]):
+        self.respond = respond
+        self.calls: list[tuple[str, dict]] = []
+
+    def answer(self, path: str, params: dict | None) -> tuple[int, dict]:
+        params = params or {}
+        self.calls.append((path, params))
+        answer = self.respond(path, params)
+        return answer if isinstance(answer, tuple) else (200, answer)
+
+    def session(self) -> MagicMock:
+        def get(url, params=None, timeout=None, headers=None):
+            status_code, payload = self.answer(urlsplit(url).path, params)
+            response = MagicMock(status_code=status_code, headers={}, content=json.dumps(payload).encode())
+            response.json.return_value = payload
+            result = MagicMock()
+            result.__enter__.return_value = response
+            return result
+
+        session = MagicMock()
+        session.get.side_effect = get
+        return session
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        status_code, payload = self.answer(request.url.path, dict(request.url.params))
+        return httpx.Response(status_code, json=payload)
+
+    def client(self, **options) -> FlightRadarClient:
+        """Client sending its requests to this API, ``options`` are passed on to the ``FlightRadarClient``."""
+        return FlightRadarClient(FlightRadarApiClient(self.session(), BASE_URL, 'test'), **options)
+
+    def async_client(self, **options) -> AsyncFlightRadarClient:
+        """Asyncio variant of ``client``, to be closed with ``aclose``."""
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return AsyncFlightRadarClient(AsyncFlightRadarApiClient(http_client, BASE_URL, 'test'), **options)
+
+
+@pytest.fixture
+def fake_api() -> type[FakeApi]:
+    return FakeApi
@@ -0,0 +1,22 @@
+from flight_radar.metrics import InMemoryMetricsSink, NullMetricsSink
+
+
+def test_in_memory_sink_should_aggregate_counters_and_keep_latest_gauges():
+    sink = InMemoryMetricsSink()
+
+    sink.increment('requests', tags={'family': 'live', 'status': '200'})
+    sink.increment('requests', 2, tags={'status': '200', 'family': 'live'})
+    sink.increment('errors')
+    sink.gauge('state', 1)
+    sink.gauge('state', 2)
+
+    snapshot = sink.snapshot()
+    assert snapshot.counters == {'requests{family=live,status=200}': 3, 'errors': 1}
+    assert snapshot.gauges == {'state': 2}
+
+
+def test_null_sink_should_accept_everything():
+    sink = NullMetricsSink()
+
+    sink.increment('requests', tags={'family': 'live'})
+    sink.gauge('state', 1)
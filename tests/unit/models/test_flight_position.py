@@ -3,7 +3,11 @@ from pydantic import ValidationError
 
 from flight_radar.enums.enums import DataSources, Direction, FlightCategory
 from flight_radar.models.common import AirportWithDirection, Route
-from flight_radar.models.flight_position import FlightPositionBaseRequest
+from flight_radar.models.flight_position import (
+    FlightPositionBaseRequest,
+    LiveFlightPositionCountRequest,
+    LiveFlightPositionRequest,
+)
 
 
 def test_should_raise_validation_error_if_no_filters_provided():
@@ -134,3 +138,51 @@ def test_should_serialize_flight_position_base_request_to_dto_with_none_values()
     assert dto.data_sources is None
     assert dto.airspaces is None
     assert dto.gspeed == '6'
+
+
+def test_should_give_semantically_identical_requests_the_same_key():
+    first = LiveFlightPositionRequest(
+        bounds=(50.0001, 40.0, 0.0, 10.0),
+        callsigns=['SAS1', 'AFR2', 'SAS1'],
+        airports=[
+            AirportWithDirection(airport='ESSA', direction=Direction.INBOUND),
+            AirportWithDirection(airport='LHR'),
+        ],
+        categories=[FlightCategory.CARGO, FlightCategory.PASSENGER],
+        altitude_ranges=[(0, 1000), (5000, 9000)],
+    )
+    second = LiveFlightPositionRequest(
+        bounds=(50.0, 40.0, 0.0, 10.0),
+        callsigns=['AFR2', 'SAS1'],
+        airports=[
+            AirportWithDirection(airport='LHR'),
+            AirportWithDirection(airport='ESSA', direction=Direction.INBOUND),
+        ],
+        categories=[FlightCategory.PASSENGER, FlightCategory.CARGO],
+        altitude_ranges=[(5000, 9000), (0, 1000)],
+    )
+
+    assert first.canonical_key() == second.canonical_key()
+    assert first == second
+    assert {first: 1}[second] == 1
+    assert first.to_dto().callsigns == 'SAS1,AFR2,SAS1'
+
+
+def test_should_tell_different_requests_apart():
+    request = LiveFlightPositionRequest(bounds=(50.0, 40.0, 0.0, 10.0), limit=10)
+
+    assert request != LiveFlightPositionRequest(bounds=(50.0, 40.0, 0.0, 10.0), limit=20)
+    assert request != LiveFlightPositionCountRequest(bounds=(50.0, 40.0, 0.0, 10.0))
+    assert request != 'request'
+
+
+def test_should_freeze_requests_and_refresh_the_key_of_updated_copies():
+    request = LiveFlightPositionRequest(callsigns=['SAS1'])
+
+    with pytest.raises(ValidationError):
+        request.callsigns = ['AFR2']
+
+    copy = request.model_copy(update={'callsigns': ['AFR2']})
+
+    assert hash(request) == hash(request.model_copy())
+    assert copy.canonical_key() != request.canonical_key()
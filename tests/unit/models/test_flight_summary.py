@@ -93,3 +93,20 @@ def test_should_raise_validation_error_if_too_many_values_in_route_filters_provi
         FlightSummaryBaseRequest(
             routes=filters,
         )
+
+
+def test_should_normalize_timestamps_in_the_canonical_key():
+    now = datetime.now(tz=timezone.utc).replace(microsecond=0)
+    cest = timezone(timedelta(hours=2))
+
+    first = FlightSummaryBaseRequest(
+        flight_datetime_from=now - timedelta(hours=1), flight_datetime_to=now, callsigns=['SAS1', 'AFR2']
+    )
+    second = FlightSummaryBaseRequest(
+        flight_datetime_from=(now - timedelta(hours=1)).astimezone(cest),
+        flight_datetime_to=now.replace(microsecond=250),
+        callsigns=['AFR2', 'SAS1'],
+    )
+
+    assert first == second
+    assert len({first, second}) == 1
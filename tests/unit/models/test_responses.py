@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from flight_radar.dtos import (
+    FlightPositionLightDto,
+    FlightPositionResponseDto,
+    FlightTrackDto,
+    GetFlightSummaryLightResponseDto,
+    GetFlightSummaryResponseDto,
+    GetFlightTracksResponseDto,
+    GetLiveFlightPositionLightResponseDto,
+    GetLiveFlightPositionResponseDto,
+    HistoricFlightEventLightResponseDto,
+    HistoricFlightEventResponseDto,
+)
+from flight_radar.models import (
+    FlightPosition,
+    FlightPositionLight,
+    FlightSummary,
+    FlightSummaryLight,
+    FlightTrack,
+    HistoricFlightEventLightResponseEntry,
+    HistoricFlightEventResponseEntry,
+)
+from flight_radar.models.responses import (
+    FlightPositionLightResponse,
+    FlightPositionResponse,
+    FlightSummaryLightResponse,
+    FlightSummaryResponse,
+    FlightTrackResponse,
+    HistoricFlightEventLightResponse,
+    HistoricFlightEventResponse,
+)
+
+
+def _read(fixture: str) -> bytes:
+    with open(f'tests/fixtures/{fixture}', 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    'fixture, dto_class, model_class, envelope_class',
+    [
+        ('get_flight_positions.json', GetLiveFlightPositionResponseDto, FlightPosition, FlightPositionResponse),
+        (
+            'get_flight_positions_light.json',
+            GetLiveFlightPositionLightResponseDto,
+            FlightPositionLight,
+            FlightPositionLightResponse,
+        ),
+        (
+            'get_historic_flight_positions.json',
+            GetLiveFlightPositionResponseDto,
+            FlightPosition,
+            FlightPositionResponse,
+        ),
+        ('get_flight_summary.json', GetFlightSummaryResponseDto, FlightSummary, FlightSummaryResponse),
+        (
+            'get_flight_summary_light.json',
+            GetFlightSummaryLightResponseDto,
+            FlightSummaryLight,
+            FlightSummaryLightResponse,
+        ),
+        (
+            'get_historic_flight_events.json',
+            HistoricFlightEventResponseDto,
+            HistoricFlightEventResponseEntry,
+            HistoricFlightEventResponse,
+        ),
+        (
+            'get_historic_flight_events_light.json',
+            HistoricFlightEventLightResponseDto,
+            HistoricFlightEventLightResponseEntry,
+            HistoricFlightEventLightResponse,
+        ),
+    ],
+)
+def test_should_decode_same_models_as_from_dto(fixture, dto_class, model_class, envelope_class):
+    content = _read(fixture)
+
+    expected = [model_class.from_dto(entry) for entry in dto_class.model_validate_json(content).data]
+
+    assert envelope_class.model_validate_json(content).data == expected
+
+
+def test_should_decode_same_flight_tracks_as_from_dto():
+    content = _read('get_flight_tracks.json')
+
+    expected = [
+        FlightTrack.from_dto(track)
+        for track in GetFlightTracksResponseDto.model_validate(json.loads(content)[0]).tracks
+    ]
+
+    assert FlightTrackResponse.model_validate(json.loads(content)[0]).tracks == expected
+
+
+@pytest.mark.parametrize('squawk', [6135, '6135'])
+def test_should_map_wire_values_like_from_dto(squawk):
+    payload = {
+        'fr24_id': '321a0cc3',
+        'lat': 1.0,
+        'lon': 2.0,
+        'track': 0,
+        'alt': 0,
+        'gspeed': 0,
+        'vspeed': 0,
+        'squawk': squawk,
+        'timestamp': '2023-11-08T10:10:00Z',
+        'source': 'ADSB',
+        'eta': '',
+    }
+
+    assert FlightPosition.model_validate(payload) == FlightPosition.from_dto(FlightPositionResponseDto(**payload))
+    assert FlightPositionLight.model_validate(payload) == FlightPositionLight.from_dto(
+        FlightPositionLightDto(**payload)
+    )
+
+
+def test_should_default_missing_track_callsign_like_from_dto():
+    payload = {
+        'timestamp': '2023-11-08T10:10:00Z',
+        'lat': 1.0,
+        'lon': 2.0,
+        'alt': 0,
+        'gspeed': 0,
+        'vspeed': 0,
+        'track': 0,
+        'squawk': '0',
+        'source': 'ADSB',
+    }
+
+    assert FlightTrack.model_validate(payload) == FlightTrack.from_dto(FlightTrackDto(**payload))
+    assert FlightTrack.model_validate({**payload, 'callsign': None}).callsign == ''
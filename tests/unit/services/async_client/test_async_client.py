@@ -0,0 +1,138 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.models import (
+    ApiUsageRequest,
+    FlightSummaryCountRequest,
+    FlightSummaryRequest,
+    FlightTrackRequest,
+    HistoricFlightEventRequest,
+    HistoricFlightPositionCountRequest,
+    HistoricFlightPositionRequest,
+    LiveFlightPositionCountRequest,
+    LiveFlightPositionRequest,
+)
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.service import FlightRadarClient
+
+FIXTURES = {
+    '/static/airlines/SAS/light': 'get_airlines_light.json',
+    '/static/airports/ESSA/light': 'get_airports_light.json',
+    '/static/airports/ESSA/full': 'get_airports.json',
+    '/live/flight-positions/light': 'get_flight_positions_light.json',
+    '/live/flight-positions/full': 'get_flight_positions.json',
+    '/live/flight-positions/count': 'get_flight_positions_count.json',
+    '/historic/flight-positions/light': 'get_historic_flight_positions_light.json',
+    '/historic/flight-positions/full': 'get_historic_flight_positions.json',
+    '/historic/flight-positions/count': 'get_historic_flight_positions_count.json',
+    '/flight-summary/light': 'get_flight_summary_light.json',
+    '/flight-summary/full': 'get_flight_summary.json',
+    '/flight-summary/count': 'get_flight_summary_count.json',
+    '/flight-tracks': 'get_flight_tracks.json',
+    '/usage': 'get_api_usage.json',
+    '/historic/flight-events/light': 'get_historic_flight_events_light.json',
+    '/historic/flight-events/full': 'get_historic_flight_events.json',
+}
+
+BOUNDS = (42.4734, 37.3315, -10.0142, -4.1151)
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BASE_URL = 'https://api.flightradar24.com'
+
+CALLS = [
+    ('get_airlines_light', 'SAS'),
+    ('get_airports_light', 'ESSA'),
+    ('get_airports', 'ESSA'),
+    ('get_live_flight_positions_light', LiveFlightPositionRequest(bounds=BOUNDS)),
+    ('get_live_flight_positions', LiveFlightPositionRequest(bounds=BOUNDS)),
+    ('get_live_flight_position_count', LiveFlightPositionCountRequest(bounds=BOUNDS)),
+    ('get_historic_positions_light', HistoricFlightPositionRequest(bounds=BOUNDS, timestamp=TIMESTAMP)),
+    ('get_historic_positions', HistoricFlightPositionRequest(bounds=BOUNDS, timestamp=TIMESTAMP)),
+    ('get_historic_positions_count', HistoricFlightPositionCountRequest(bounds=BOUNDS, timestamp=TIMESTAMP)),
+    ('get_flight_summary_light', FlightSummaryRequest(flight_ids=['391e1d99'])),
+    ('get_flight_summary', FlightSummaryRequest(flight_ids=['391e1d99'])),
+    ('get_flight_summary_count', FlightSummaryCountRequest(flight_ids=['391e1d99'])),
+    ('get_flight_tracks', FlightTrackRequest(flight_id='391e1d99')),
+    ('get_api_usage', ApiUsageRequest()),
+    ('get_historic_flight_events_light', HistoricFlightEventRequest(flight_ids=['391e1d99'])),
+    ('get_historic_flight_events', HistoricFlightEventRequest(flight_ids=['391e1d99'])),
+]
+
+
+def _load_fixture(path: str) -> dict:
+    with open(f'tests/fixtures/{FIXTURES[path]}', 'r') as f:
+        return json.load(f)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=_load_fixture(request.url.path))
+
+
+def _sync_service(single_pass_decode: bool = False) -> FlightRadarClient:
+    def get(url, params=None, timeout=None):
+        payload = _load_fixture(url.removeprefix(BASE_URL))
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = payload
+        mock_response.content = json.dumps(payload).encode()
+        session.get.return_value.__enter__.return_value = mock_response
+        return session.get.return_value
+
+    session = MagicMock()
+    session.get.side_effect = get
+
+    return FlightRadarClient(
+        FlightRadarApiClient(session, BASE_URL, 'test', fast_decode=single_pass_decode),
+        single_pass_decode=single_pass_decode,
+    )
+
+
+def _async_service(handler, single_pass_decode: bool = False) -> AsyncFlightRadarClient:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(client, BASE_URL, 'test', fast_decode=single_pass_decode),
+        single_pass_decode=single_pass_decode,
+    )
+
+
+@pytest.mark.parametrize('single_pass_decode', [False, True])
+@pytest.mark.parametrize('method, argument', CALLS)
+def test_should_return_same_models_as_sync_client(method, argument, single_pass_decode):
+    async def call():
+        async with _async_service(_handler, single_pass_decode) as service:
+            return await getattr(service, method)(argument)
+
+    expected = getattr(_sync_service(), method)(argument)
+
+    assert asyncio.run(call()) == expected
+    assert getattr(_sync_service(single_pass_decode), method)(argument) == expected
+
+
+def test_should_run_requests_concurrently_on_one_event_loop():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=_load_fixture(request.url.path))
+
+    async def call():
+        async with _async_service(handler) as service:
+            return await asyncio.gather(
+                *[service.get_flight_tracks(FlightTrackRequest(flight_id=str(i))) for i in range(20)]
+            )
+
+    results = asyncio.run(call())
+
+    assert len(results) == 20
+    assert peak == 20
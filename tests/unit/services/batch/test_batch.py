@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+from typing import Callable
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.deadline import deadline, remaining_time
+from flight_radar.errors import NotFoundError
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.batch import map_in_tasks, map_in_threads
+from flight_radar.services.service import FlightRadarClient
+
+BASE_URL = 'https://api.flightradar24.com'
+
+
+def _airports(airport: dict, missing: set[str]) -> Callable[[str, dict], tuple[int, dict]]:
+    def respond(path: str, params: dict) -> tuple[int, dict]:
+        return (404, {'message': 'not found'}) if path.split('/')[-2] in missing else (200, airport)
+
+    return respond
+
+
+def test_map_should_return_one_result_per_request_and_keep_errors_per_item(fake_api, mock_get_airport_response):
+    api = fake_api(_airports(mock_get_airport_response, missing={'XXX'}))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    results = list(client.map(client.get_airports, ['ARN', 'XXX', 'ESSA'], max_workers=2))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.request for result in results] == ['ARN', 'XXX', 'ESSA']
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].result.icao == mock_get_airport_response['icao']
+    assert isinstance(results[1].error, NotFoundError)
+    assert len(api.calls) == 3
+
+
+def test_map_in_threads_should_keep_order_even_when_later_calls_finish_first():
+    def slow_for_small(value: int) -> int:
+        time.sleep(0.01 * (5 - value))
+        return value * 2
+
+    results = list(map_in_threads(slow_for_small, range(5), max_workers=5, ordered=True))
+
+    assert [result.result for result in results] == [0, 2, 4, 6, 8]
+
+
+def test_map_in_threads_should_yield_as_completed_when_not_ordered():
+    release = threading.Event()
+
+    def blocking_first(value: int) -> int:
+        if value == 0:
+            release.wait(timeout=5)
+        return value
+
+    results = map_in_threads(blocking_first, range(3), max_workers=3, ordered=False)
+    first, second = next(results), next(results)
+    release.set()
+
+    assert {first.index, second.index} == {1, 2}
+    assert next(results).index == 0
+
+
+def test_map_in_threads_should_bound_concurrency_and_read_requests_lazily():
+    lock = threading.Lock()
+    active, peak, consumed = [0], [0], []
+
+    def track(value: int) -> int:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.005)
+        with lock:
+            active[0] -= 1
+        return value
+
+    def requests():
+        for value in range(100):
+            consumed.append(value)
+            yield value
+
+    results = map_in_threads(track, requests(), max_workers=3, ordered=True)
+    next(results)
+
+    assert len(consumed) <= 7
+    assert len(list(results)) == 99
+    assert peak[0] <= 3
+
+
+def test_map_in_threads_should_propagate_the_deadline_to_workers():
+    with deadline(5):
+        [result] = map_in_threads(lambda _: remaining_time(), [None], max_workers=1, ordered=True)
+
+    assert 0 < result.result <= 5
+
+
+def test_map_should_reject_invalid_worker_counts_when_called(fake_api):
+    api = fake_api(lambda path, params: {})
+    client = api.client()
+
+    with pytest.raises(ValueError, match='max_workers'):
+        client.map(client.get_airports, ['ESSA'], max_workers=0)
+
+    async def call():
+        async with api.async_client() as async_client:
+            async_client.map(async_client.get_airports, ['ESSA'], concurrency=0)
+
+    with pytest.raises(ValueError, match='concurrency'):
+        asyncio.run(call())
+    with pytest.raises(ValueError):
+        map_in_threads(str, [1], max_workers=0, ordered=True)
+    with pytest.raises(ValueError):
+        map_in_tasks(str, [1], concurrency=0, ordered=True)
+    assert api.calls == []
+
+
+def test_async_map_should_keep_errors_per_item(fake_api, mock_get_airport_response):
+    api = fake_api(_airports(mock_get_airport_response, missing={'XXX'}))
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(api.handler)), BASE_URL, 'test')
+    )
+
+    async def run():
+        return [result async for result in client.map(client.get_airports, ['ARN', 'XXX', 'ESSA'], concurrency=2)]
+
+    results = asyncio.run(run())
+
+    assert [result.request for result in results] == ['ARN', 'XXX', 'ESSA']
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, NotFoundError)
+
+
+def test_map_in_tasks_should_bound_concurrency_and_support_as_completed():
+    active, peak = [0], [0]
+
+    async def track(value: int) -> int:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        # Yielding to the loop a decreasing number of times finishes later requests first, deterministically
+        for _ in range(10 - value):
+            await asyncio.sleep(0)
+        active[0] -= 1
+        return value
+
+    async def run(ordered: bool) -> list[int]:
+        return [result.result async for result in map_in_tasks(track, range(10), concurrency=10, ordered=ordered)]
+
+    assert asyncio.run(run(ordered=True)) == list(range(10))
+    as_completed = asyncio.run(run(ordered=False))
+    assert as_completed[0] != 0
+    assert sorted(as_completed) == list(range(10))
+    assert peak[0] == 10
+
+    peak[0] = 0
+
+    async def bounded() -> list:
+        return [result async for result in map_in_tasks(track, range(10), concurrency=2, ordered=False)]
+
+    assert len(asyncio.run(bounded())) == 10
+    assert peak[0] <= 2
+
+
+def test_map_in_tasks_should_cancel_pending_calls_when_closed_early():
+    cancelled = []
+
+    async def slow(value: int) -> int:
+        try:
+            await asyncio.sleep(0 if value == 0 else 5)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    async def run():
+        results = map_in_tasks(slow, range(3), concurrency=3, ordered=False)
+        first = await anext(results)
+        await results.aclose()
+        await asyncio.sleep(0)
+        return first
+
+    assert asyncio.run(run()).result == 0
+    assert sorted(cancelled) == [1, 2]
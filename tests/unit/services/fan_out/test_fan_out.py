@@ -0,0 +1,188 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.enums.enums import Sort
+from flight_radar.errors import BadRequestError
+from flight_radar.models import (
+    FlightSummaryLight,
+    FlightSummaryRequest,
+    HistoricFlightPositionRequest,
+    LiveFlightPositionRequest,
+)
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.fan_out import merge_summaries, split_request
+from flight_radar.services.service import FlightRadarClient
+
+BASE_URL = 'https://api.flightradar24.com'
+NOW = datetime.now(tz=timezone.utc)
+REGISTRATIONS = [f'SE-R{index:02d}' for index in range(40)]
+
+
+def _summary(fr24_id: str, minutes: int | None) -> dict:
+    first_seen = '' if minutes is None else (NOW - timedelta(minutes=minutes)).isoformat()
+    return {'fr24_id': fr24_id, 'reg': fr24_id, 'first_seen': first_seen, 'last_seen': '', 'datetime_takeoff': None}
+
+
+def _respond(path: str, params: dict) -> dict:
+    limit = int(params['limit']) if params.get('limit') else None
+    registrations = params['registrations'].split(',')
+    # Every registration flew twice, and one flight is shared by the first two chunks
+    summaries = [_summary(registration, minutes) for registration in registrations for minutes in (5, 500)]
+    summaries.append(_summary('shared', 1))
+    summaries.sort(key=lambda summary: summary['first_seen'], reverse=params.get('sort') == 'desc')
+    return {'data': summaries[:limit]}
+
+
+def test_split_request_should_chunk_long_lists_into_valid_requests():
+    requests = split_request(LiveFlightPositionRequest, registrations=REGISTRATIONS, limit=100)
+
+    assert [len(request.registrations) for request in requests] == [15, 15, 10]
+    assert sum((request.registrations for request in requests), []) == REGISTRATIONS
+    assert all(request.limit == 100 for request in requests)
+
+
+def test_split_request_should_combine_every_chunk_of_every_long_filter():
+    requests = split_request(
+        HistoricFlightPositionRequest,
+        callsigns=[f'SAS{index}' for index in range(20)],
+        aircraft=[f'A{index}' for index in range(16)],
+        routes=[{'origin': 'ESSA', 'destination': 'EGLL'}],
+        timestamp=NOW,
+    )
+
+    assert len(requests) == 4
+    assert {(request.callsigns[0], request.aircraft[0]) for request in requests} == {
+        ('SAS0', 'A0'),
+        ('SAS0', 'A15'),
+        ('SAS15', 'A0'),
+        ('SAS15', 'A15'),
+    }
+    assert all(str(request.routes[0]) == 'ESSA-EGLL' for request in requests)
+
+
+def test_split_request_should_keep_short_queries_in_one_request_and_validate_them():
+    [request] = split_request(FlightSummaryRequest, flight_ids=['391fdd79'])
+
+    assert request.flight_ids == ['391fdd79']
+    with pytest.raises(ValidationError):
+        split_request(FlightSummaryRequest, registrations=REGISTRATIONS)
+
+
+def test_merge_summaries_should_deduplicate_sort_and_limit():
+    first = FlightSummaryLight.model_validate(_summary('a', 30))
+    second = FlightSummaryLight.model_validate(_summary('b', 10))
+    unknown = FlightSummaryLight.model_validate(_summary('c', None))
+
+    assert merge_summaries([[second, unknown], [first, second]]) == [first, second, unknown]
+    assert merge_summaries([[second, unknown], [first]], sort=Sort.DESC) == [second, first, unknown]
+    assert merge_summaries([[second, unknown], [first]], limit=1, sort=Sort.DESC) == [second]
+
+
+@pytest.mark.parametrize('method', ['get_flight_summary_light_batched', 'get_flight_summary_batched'])
+def test_should_merge_the_results_of_every_chunk(fake_api, method):
+    api = fake_api(_respond)
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    summaries = getattr(client, method)(
+        registrations=REGISTRATIONS, flight_datetime_from=NOW - timedelta(days=1), flight_datetime_to=NOW
+    )
+
+    assert len(api.calls) == 3
+    assert len(summaries) == len(REGISTRATIONS) + 1
+    assert [summary.first_seen for summary in summaries] == sorted(summary.first_seen for summary in summaries)
+
+
+def test_should_honour_limit_and_sort_across_chunks(fake_api):
+    client = FlightRadarClient(FlightRadarApiClient(fake_api(_respond).session(), BASE_URL, 'test'))
+
+    summaries = client.get_flight_summary_light_batched(
+        registrations=REGISTRATIONS,
+        flight_datetime_from=NOW - timedelta(days=1),
+        flight_datetime_to=NOW,
+        limit=5,
+        sort=Sort.DESC,
+    )
+
+    assert [summary.fr24_id for summary in summaries][0] == 'shared'
+    assert len(summaries) == 5
+    assert all(summary.first_seen >= NOW - timedelta(minutes=6) for summary in summaries)
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        'get_live_flight_positions_light_batched',
+        'get_live_flight_positions_batched',
+        'get_historic_positions_light_batched',
+        'get_historic_positions_batched',
+    ],
+)
+def test_position_queries_should_fan_out(method, mock_get_flight_positions_response):
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 200
+    session.get.return_value.__enter__.return_value.json.return_value = mock_get_flight_positions_response
+    client = FlightRadarClient(FlightRadarApiClient(session, BASE_URL, 'test'))
+    filters = {'callsigns': [f'SAS{index}' for index in range(31)]}
+    if 'historic' in method:
+        filters['timestamp'] = NOW
+
+    positions = getattr(client, method)(**filters)
+
+    assert session.get.call_count == 3
+    assert len(positions) == len(mock_get_flight_positions_response['data'])
+
+
+def test_should_raise_when_a_chunk_fails():
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 400
+    session.get.return_value.__enter__.return_value.json.return_value = {'message': 'error'}
+    client = FlightRadarClient(FlightRadarApiClient(session, BASE_URL, 'test'))
+
+    with pytest.raises(BadRequestError):
+        client.get_live_flight_positions_batched(registrations=REGISTRATIONS)
+
+
+@pytest.mark.parametrize(
+    'method, filters',
+    [
+        (
+            'get_flight_summary_light_batched',
+            {'flight_datetime_from': NOW - timedelta(days=1), 'flight_datetime_to': NOW},
+        ),
+        ('get_flight_summary_batched', {'flight_datetime_from': NOW - timedelta(days=1), 'flight_datetime_to': NOW}),
+        ('get_live_flight_positions_light_batched', {}),
+        ('get_live_flight_positions_batched', {}),
+        ('get_historic_positions_light_batched', {'timestamp': NOW}),
+        ('get_historic_positions_batched', {'timestamp': NOW}),
+    ],
+)
+def test_async_should_fan_out(fake_api, method, filters, mock_get_flight_positions_response):
+    api = fake_api(_respond if 'summary' in method else lambda path, params: mock_get_flight_positions_response)
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(api.handler)), BASE_URL, 'test')
+    )
+
+    results = asyncio.run(getattr(client, method)(registrations=REGISTRATIONS, **filters))
+
+    assert len(api.calls) == 3
+    assert len({result.fr24_id for result in results}) == len(results)
+
+
+def test_async_should_raise_when_a_chunk_fails():
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(
+            httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(400, json={}))),
+            BASE_URL,
+            'test',
+        )
+    )
+
+    with pytest.raises(BadRequestError):
+        asyncio.run(client.get_live_flight_positions_batched(registrations=REGISTRATIONS))
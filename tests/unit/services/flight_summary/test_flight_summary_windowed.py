@@ -0,0 +1,201 @@
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.errors import InternalServerError
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.service import FlightRadarClient
+from flight_radar.services.windowing import WindowingConfig, check_span, split_span
+
+BASE_URL = 'https://api.flightradar24.com'
+END = datetime.now(tz=timezone.utc).replace(microsecond=0)
+START = END - timedelta(days=10)
+CONFIG = WindowingConfig(max_window=timedelta(days=3), max_window_count=40, max_flight_duration=timedelta(hours=6))
+
+
+def _flights(count: int, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    flights = []
+    for index in range(count):
+        first_seen = START + timedelta(minutes=rng.randrange(int((END - START).total_seconds() // 60) - 300))
+        last_seen = first_seen + timedelta(minutes=rng.randrange(30, 300))
+        flights.append(
+            {
+                'fr24_id': f'{index:08x}',
+                'first_seen': first_seen.isoformat(),
+                'last_seen': last_seen.isoformat(),
+                'datetime_takeoff': None,
+            }
+        )
+    return flights
+
+
+def _summaries(flights: list[dict], cap: int = 50) -> Callable[[str, dict], dict]:
+    """Matches flights like the API, by first_seen on the lower bound and by last_seen on the upper bound."""
+
+    def respond(path: str, params: dict) -> dict:
+        start = datetime.fromisoformat(params['flight_datetime_from'])
+        end = datetime.fromisoformat(params['flight_datetime_to'])
+        matching = sorted(
+            (
+                flight
+                for flight in flights
+                if datetime.fromisoformat(flight['first_seen']) >= start
+                and datetime.fromisoformat(flight['last_seen']) <= end
+            ),
+            key=lambda flight: flight['first_seen'],
+        )
+        if path.endswith('/count'):
+            return {'record_count': len(matching)}
+
+        return {'data': matching[: min(cap, int(params['limit']))]}
+
+    return respond
+
+
+def test_split_span_should_cut_the_span_into_consecutive_windows():
+    assert split_span(START, START + timedelta(days=7), timedelta(days=3)) == [
+        (START, START + timedelta(days=3)),
+        (START + timedelta(days=3), START + timedelta(days=6)),
+        (START + timedelta(days=6), START + timedelta(days=7)),
+    ]
+
+
+def test_check_span_should_reject_spans_ending_before_they_start():
+    with pytest.raises(ValueError, match='before flight_datetime_to'):
+        check_span(END, START)
+
+
+def test_windowing_config_should_reject_windows_longer_than_the_api_allows():
+    with pytest.raises(ValueError):
+        WindowingConfig(max_window=timedelta(days=15))
+
+
+@pytest.mark.parametrize('method', ['get_flight_summary_light_windowed', 'get_flight_summary_windowed'])
+def test_should_stream_every_flight_once_in_first_seen_order(fake_api, method):
+    flights = _flights(400)
+    api = fake_api(_summaries(flights))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    summaries = list(getattr(client, method)(START, END, CONFIG, airports=[{'airport': 'ESSA'}]))
+
+    assert [summary.fr24_id for summary in summaries] == [
+        flight['fr24_id'] for flight in sorted(flights, key=lambda flight: flight['first_seen'])
+    ]
+    fetches = [params for path, params in api.calls if not path.endswith('/count')]
+    assert len(fetches) > 10
+    assert all(params['sort'] == 'asc' and params['airports'] == 'ESSA' for params in fetches)
+
+
+def test_should_skip_empty_windows(fake_api):
+    api = fake_api(_summaries([]))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    assert list(client.get_flight_summary_light_windowed(START, END, CONFIG, callsigns=['SAS123'])) == []
+    assert all(path.endswith('/count') for path, _ in api.calls)
+    # Every window but the last one also counts the flights first seen after it
+    assert len(api.calls) == 7
+
+
+def test_should_bisect_busy_spans_on_the_flights_first_seen_in_each_window(fake_api):
+    # A flight every 2 minutes, so the 6 hours past any window hold more flights than one response
+    flights = [
+        {
+            'fr24_id': f'{index:08x}',
+            'first_seen': (START + timedelta(minutes=2 * index)).isoformat(),
+            'last_seen': (START + timedelta(minutes=2 * index + 120)).isoformat(),
+        }
+        for index in range(660)
+    ]
+    api = fake_api(_summaries(flights, cap=100))
+    config = WindowingConfig(max_window_count=100, max_flight_duration=timedelta(hours=6))
+
+    summaries = list(
+        api.client().get_flight_summary_light_windowed(START, START + timedelta(days=1), config, callsigns=['SAS123'])
+    )
+
+    assert [summary.fr24_id for summary in summaries] == [flight['fr24_id'] for flight in flights]
+    paths = [path for path, _ in api.calls]
+    # Bisected from one day down to 3 hour windows of at most 90 flights, counting a window and what follows it
+    assert paths.count('/flight-summary/count') == 1 + 3 + 7 + 15
+    assert paths.count('/flight-summary/light') == 8
+
+
+@pytest.mark.parametrize('method', ['get_flight_summary_light_windowed', 'get_flight_summary_windowed'])
+def test_should_reject_ranges_starting_before_the_lookback_of_the_api_when_called(fake_api, method):
+    api = fake_api(_summaries([]))
+
+    with pytest.raises(ValueError, match='within the last 14 days'):
+        getattr(api.client(), method)(END - timedelta(days=30), END, airports=[{'airport': 'ESSA'}])
+
+    async def call():
+        async with api.async_client() as client:
+            getattr(client, method)(END - timedelta(days=30), END, airports=[{'airport': 'ESSA'}])
+
+    with pytest.raises(ValueError, match='within the last 14 days'):
+        asyncio.run(call())
+    assert api.calls == []
+
+
+def test_should_stop_bisecting_at_the_minimum_window(fake_api):
+    crowded = [
+        {
+            'fr24_id': f'{index:08x}',
+            'first_seen': (START + timedelta(hours=1)).isoformat(),
+            'last_seen': (START + timedelta(hours=2)).isoformat(),
+        }
+        for index in range(60)
+    ]
+    api = fake_api(_summaries(crowded, cap=100))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    summaries = list(client.get_flight_summary_light_windowed(START, END, CONFIG, callsigns=['SAS123']))
+
+    assert len(summaries) == 60
+
+
+def test_should_keep_flights_without_first_seen_once(fake_api):
+    flight = {'fr24_id': 'unknown', 'first_seen': '', 'last_seen': ''}
+
+    api = fake_api(lambda path, params: {'record_count': 1} if path.endswith('/count') else {'data': [flight]})
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    summaries = list(client.get_flight_summary_light_windowed(START, END, CONFIG, callsigns=['SAS123']))
+
+    assert [summary.fr24_id for summary in summaries] == ['unknown']
+
+
+def test_should_raise_when_a_window_fails():
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 500
+    session.get.return_value.__enter__.return_value.json.return_value = {'message': 'error'}
+    client = FlightRadarClient(FlightRadarApiClient(session, BASE_URL, 'test'))
+
+    with pytest.raises(InternalServerError):
+        list(client.get_flight_summary_windowed(START, END, CONFIG, callsigns=['SAS123']))
+
+
+@pytest.mark.parametrize('method', ['get_flight_summary_light_windowed', 'get_flight_summary_windowed'])
+def test_async_should_stream_every_flight_once_in_first_seen_order(fake_api, method):
+    flights = _flights(200, seed=2)
+    api = fake_api(_summaries(flights))
+
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(api.handler)), BASE_URL, 'test')
+    )
+
+    async def collect():
+        return [summary async for summary in getattr(client, method)(START, END, CONFIG, callsigns=['SAS123'])]
+
+    summaries = asyncio.run(collect())
+
+    assert [summary.fr24_id for summary in summaries] == [
+        flight['fr24_id'] for flight in sorted(flights, key=lambda flight: flight['first_seen'])
+    ]
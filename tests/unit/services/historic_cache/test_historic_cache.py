@@ -0,0 +1,244 @@
+import asyncio
+import json
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from flight_radar.cache import CacheStats, MemoryCache, SQLiteCache
+from flight_radar.models import FlightSummaryRequest, FlightTrackRequest, HistoricFlightPositionRequest
+from flight_radar.models.historic_flight_event import HistoricFlightEventRequest
+from flight_radar.services.historic_cache import HistoricCacheConfig, HistoricResultCache
+from flight_radar.metrics import InMemoryMetricsSink
+
+BASE_URL = 'https://api.flightradar24.com'
+PAYLOADS = {
+    '/historic/flight-positions/light': 'get_historic_flight_positions_light',
+    '/historic/flight-positions/full': 'get_historic_flight_positions',
+    '/flight-summary/light': 'get_flight_summary_light',
+    '/flight-summary/full': 'get_flight_summary',
+    '/flight-tracks': 'get_flight_tracks',
+    '/historic/flight-events/light': 'get_historic_flight_events_light',
+    '/historic/flight-events/full': 'get_historic_flight_events',
+}
+
+
+def _payload(path: str) -> dict:
+    with open(f'tests/fixtures/{PAYLOADS[path]}.json', 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HistoricResultCache(HistoricCacheConfig(path=tmp_path / 'historic.db'))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def api(fake_api):
+    return fake_api(lambda path, params: _payload(path))
+
+
+def _summary_request() -> FlightSummaryRequest:
+    return FlightSummaryRequest(flight_ids=['391e1d99'])
+
+
+@pytest.mark.parametrize('single_pass_decode', [False, True])
+@pytest.mark.parametrize('method', ['get_historic_positions_light', 'get_historic_positions'])
+def test_should_serve_settled_historic_positions_from_the_cache(api, cache, method, single_pass_decode):
+    client = api.client(single_pass_decode=single_pass_decode, historic_cache=cache)
+    request = HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463'])
+
+    first = getattr(client, method)(request)
+    second = getattr(client, method)(HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463']))
+
+    assert first == second
+    assert len(api.calls) == 1
+
+
+def test_should_not_cache_positions_that_may_still_change(api, cache):
+    client = api.client(historic_cache=cache)
+    request = HistoricFlightPositionRequest(timestamp=datetime.now(tz=timezone.utc), callsigns=['AFR1463'])
+
+    client.get_historic_positions_light(request)
+    client.get_historic_positions_light(request)
+
+    assert len(api.calls) == 2
+
+
+@pytest.mark.parametrize('method', ['get_flight_summary_light', 'get_flight_summary'])
+def test_should_cache_summaries_of_ended_flights(api, cache, method):
+    client = api.client(historic_cache=cache)
+
+    first = getattr(client, method)(_summary_request())
+    second = getattr(client, method)(_summary_request())
+
+    assert first == second
+    assert len(api.calls) == 1
+    assert cache.has_ended([first[0].fr24_id])
+
+
+def test_should_not_cache_summaries_of_flights_in_progress(cache):
+    summaries = [MagicMock(fr24_id='a', flight_ended=True), MagicMock(fr24_id='b', flight_ended=False)]
+
+    assert not cache.summaries_are_final(_summary_request(), summaries)
+    assert not cache.summaries_are_final(_summary_request(), [])
+    assert cache.has_ended(['a'])
+    assert not cache.has_ended(['a', 'b'])
+
+
+def test_should_only_cache_summaries_of_time_ranges_that_have_settled(cache):
+    summaries = [MagicMock(fr24_id='a', flight_ended=True)]
+    now = datetime.now(tz=timezone.utc)
+
+    def window(start: datetime, end: datetime) -> FlightSummaryRequest:
+        return FlightSummaryRequest(flight_datetime_from=start, flight_datetime_to=end, callsigns=['SAS1'])
+
+    assert not cache.summaries_are_final(window(now - timedelta(hours=2), now + timedelta(hours=6)), summaries)
+    assert not cache.summaries_are_final(window(now - timedelta(hours=3), now - timedelta(minutes=30)), summaries)
+    assert cache.summaries_are_final(window(now - timedelta(days=2), now - timedelta(days=1)), summaries)
+
+
+def test_should_cache_tracks_and_events_once_the_flights_are_known_to_have_ended(api, cache):
+    client = api.client(historic_cache=cache)
+    tracks = FlightTrackRequest(flight_id='35f2ffd9')
+    events = HistoricFlightEventRequest(flight_ids=['2efc4160'], event_types=['all'])
+
+    client.get_flight_tracks(tracks)
+    client.get_historic_flight_events(events)
+    cache.mark_ended(['35f2ffd9', '2efc4160'])
+    cached = [
+        client.get_flight_tracks(tracks),
+        client.get_historic_flight_events(events),
+        client.get_historic_flight_events_light(events),
+    ]
+
+    assert cached == [
+        client.get_flight_tracks(tracks),
+        client.get_historic_flight_events(events),
+        client.get_historic_flight_events_light(events),
+    ]
+    assert [path for path, _ in api.calls] == [
+        '/flight-tracks',
+        '/historic/flight-events/full',
+        '/flight-tracks',
+        '/historic/flight-events/full',
+        '/historic/flight-events/light',
+    ]
+
+
+def test_should_address_results_by_endpoint_and_canonical_request():
+    request = FlightSummaryRequest(flight_ids=['a', 'b'])
+
+    key = HistoricResultCache.key('/flight-summary/light', request)
+
+    assert key == HistoricResultCache.key('/flight-summary/light', FlightSummaryRequest(flight_ids=['b', 'a']))
+    assert key != HistoricResultCache.key('/flight-summary/full', request)
+    assert key.startswith('/flight-summary/light:') and len(key.partition(':')[2]) == 64
+
+
+def test_should_store_compressed_results_and_evict_the_least_recently_used(tmp_path):
+    clock = iter(range(100)).__next__
+    backend = SQLiteCache(tmp_path / 'historic.db', max_bytes=300, clock=clock)
+    cache = HistoricResultCache(HistoricCacheConfig(path=tmp_path / 'unused.db'), backend=backend)
+    # Random hex only compresses to about half its size, so each result takes about 140 bytes
+    result = [secrets.token_hex(100)]
+
+    cache.set('a', list[str], result)
+    cache.set('b', list[str], result)
+    cache.get('a', list[str])
+    cache.set('c', list[str], result)
+
+    assert backend.size() <= 300
+    assert cache.get('a', list[str]) == result
+    assert cache.get('b', list[str]) is None
+    assert cache.get('c', list[str]) == result
+    cache.close()
+
+
+def test_should_keep_results_across_restarts(tmp_path):
+    config = HistoricCacheConfig(path=tmp_path / 'historic.db')
+    cache = HistoricResultCache(config)
+    cache.set('a', list[int], [1, 2, 3])
+    cache.close()
+
+    restarted = HistoricResultCache(config)
+
+    assert restarted.get('a', list[int]) == [1, 2, 3]
+    restarted.close()
+
+
+def test_should_settle_timestamps_after_the_configured_time(clock):
+    cache = HistoricResultCache(
+        HistoricCacheConfig(path='unused.db', settle_time=timedelta(minutes=5)), backend=MemoryCache(), clock=clock
+    )
+
+    assert cache.is_settled(clock.now - 300)
+    assert not cache.is_settled(clock.now - 299)
+
+
+def test_async_should_serve_historic_results_from_the_cache(api, cache):
+    async def fetch():
+        async with api.async_client(historic_cache=cache) as client:
+            positions = HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463'])
+            for _ in range(2):
+                await client.get_historic_positions_light(positions)
+                await client.get_historic_positions(positions)
+                await client.get_flight_summary_light(_summary_request())
+                await client.get_flight_summary(_summary_request())
+            cache.mark_ended(['35f2ffd9', '2efc4160'])
+            events = HistoricFlightEventRequest(flight_ids=['2efc4160'], event_types=['all'])
+            for _ in range(2):
+                await client.get_flight_tracks(FlightTrackRequest(flight_id='35f2ffd9'))
+                await client.get_historic_flight_events(events)
+                await client.get_historic_flight_events_light(events)
+
+    asyncio.run(fetch())
+
+    assert sorted(path for path, _ in api.calls) == sorted(PAYLOADS)
+
+
+def test_async_should_read_and_write_the_cache_off_the_event_loop(api, tmp_path, slow_backend):
+    cache = HistoricResultCache(HistoricCacheConfig(path=tmp_path / 'unused.db'), backend=slow_backend)
+
+    async def fetch():
+        async with api.async_client(historic_cache=cache) as client:
+            started = time.monotonic()
+
+            async def tick() -> float:
+                await asyncio.sleep(0.01)
+                return time.monotonic() - started
+
+            _, ticked = await asyncio.gather(client.get_flight_summary_light(_summary_request()), tick())
+            return ticked
+
+    assert asyncio.run(fetch()) < slow_backend.delay
+    assert cache.endpoint_stats()['/flight-summary/light'].entries == 1
+
+
+def test_should_keep_statistics_per_endpoint(api, clock, tmp_path):
+    metrics = InMemoryMetricsSink()
+    cache = HistoricResultCache(
+        HistoricCacheConfig(path=tmp_path / 'unused.db'),
+        backend=MemoryCache(max_entries=2),
+        clock=clock,
+        metrics=metrics,
+    )
+    clock.now = 1_800_000_000.0
+    client = api.client(historic_cache=cache)
+    request = HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463'])
+
+    client.get_historic_positions_light(request)
+    client.get_historic_positions_light(request)
+    client.get_flight_summary_light(_summary_request())
+    stats = cache.endpoint_stats()
+
+    assert stats['/historic/flight-positions/light'] == CacheStats(hits=1, misses=1, evictions=1)
+    assert stats['/flight-summary/light'].misses == 1
+    assert stats['/flight-summary/light'].entries == 1
+    assert stats['/flight-summary/light'].bytes_stored > 0
+    assert stats['ended'] == CacheStats(entries=1, mean_entry_age=0.0)
+    assert metrics.snapshot().counters['cache.hits{cache=historic,endpoint=/historic/flight-positions/light}'] == 1
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.enums.enums import HistoricFlightEventTypes
+from flight_radar.errors import InternalServerError
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.bulk_events import chunk_event_requests
+from flight_radar.services.service import FlightRadarClient
+
+BASE_URL = 'https://api.flightradar24.com'
+FLIGHT_IDS = [f'{index:08x}' for index in range(40)]
+FAILING_ID = FLIGHT_IDS[20]
+
+
+def _respond(path: str, params: dict) -> tuple[int, dict]:
+    flight_ids = params['flight_ids'].split(',')
+    if FAILING_ID in flight_ids:
+        return 500, {'message': 'error'}
+
+    entries = [
+        {
+            'fr24_id': flight_id,
+            'callsign': 'SAS1415',
+            'hex': '4AC9F5',
+            'events': [],
+            'painted_as': 'SAS',
+            'operating_as': 'SAS',
+            'orig_icao': 'ESSA',
+            'orig_iata': 'ARN',
+            'dest_icao': 'EKCH',
+            'dest_iata': 'CPH',
+        }
+        for flight_id in flight_ids
+    ]
+    return 200, {'data': entries}
+
+
+def test_chunk_event_requests_should_drop_duplicates_and_keep_event_types():
+    requests = chunk_event_requests(FLIGHT_IDS + FLIGHT_IDS[:5], [HistoricFlightEventTypes.TAKEOFF])
+
+    assert [len(request.flight_ids) for request in requests] == [15, 15, 10]
+    assert sum((request.flight_ids for request in requests), []) == FLIGHT_IDS
+    assert all(request.event_types == [HistoricFlightEventTypes.TAKEOFF] for request in requests)
+
+
+@pytest.mark.parametrize('method', ['get_historic_flight_events_light_bulk', 'get_historic_flight_events_bulk'])
+def test_should_stream_entries_and_account_for_every_chunk(fake_api, method):
+    api = fake_api(_respond)
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    stream = getattr(client, method)(iter(FLIGHT_IDS), [HistoricFlightEventTypes.LANDED], max_workers=2)
+    assert stream.progress.completed == 0
+
+    entries = list(stream)
+
+    assert len(api.calls) == 3
+    assert sorted(entry.fr24_id for entry in entries) == FLIGHT_IDS[:15] + FLIGHT_IDS[30:]
+    progress = stream.progress
+    assert progress.completed == 3
+    assert progress.entries == 25
+    assert [chunk.index for chunk in progress.failed] == [1]
+    assert isinstance(progress.failed[0].error, InternalServerError)
+    assert progress.failed_flight_ids == FLIGHT_IDS[15:30]
+    assert [chunk.entries for chunk in progress.chunks] == [15, 0, 10]
+
+
+def test_should_not_send_requests_without_flight_ids(fake_api):
+    api = fake_api(_respond)
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    assert list(client.get_historic_flight_events_bulk([])) == []
+    assert api.calls == []
+
+
+@pytest.mark.parametrize('method', ['get_historic_flight_events_light_bulk', 'get_historic_flight_events_bulk'])
+def test_async_should_stream_entries_and_account_for_every_chunk(fake_api, method):
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(
+            httpx.AsyncClient(transport=httpx.MockTransport(fake_api(_respond).handler)), BASE_URL, 'test'
+        )
+    )
+
+    async def collect():
+        stream = getattr(client, method)(FLIGHT_IDS, concurrency=2)
+        return [entry.fr24_id async for entry in stream], stream.progress
+
+    entries, progress = asyncio.run(collect())
+
+    assert sorted(entries) == FLIGHT_IDS[:15] + FLIGHT_IDS[30:]
+    assert progress.completed == 3
+    assert progress.failed_flight_ids == FLIGHT_IDS[15:30]
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.errors import NotFoundError
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.service import FlightRadarClient
+from flight_radar.services.sweep import sweep_timestamps
+
+BASE_URL = 'https://api.flightradar24.com'
+START = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+
+
+def _response(timestamp: int) -> dict:
+    return {
+        'data': [
+            {
+                'fr24_id': f'{timestamp:x}',
+                'lat': 1.0,
+                'lon': 2.0,
+                'track': 90,
+                'alt': 1000,
+                'gspeed': 100,
+                'vspeed': 0,
+                'squawk': '1234',
+                'timestamp': datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+                'source': 'ADSB',
+            }
+        ]
+    }
+
+
+class _Frames:
+    """Answers every timestamp with one position after its delay, keeping the peak number of requests in flight."""
+
+    def __init__(self, delays: dict[int, float] | None = None):
+        self.delays = delays or {}
+        self.peak = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, path: str, params: dict) -> dict:
+        with self._lock:
+            self._in_flight += 1
+            self.peak = max(self.peak, self._in_flight)
+        time.sleep(self.delays.get(params['timestamp'], 0))
+        with self._lock:
+            self._in_flight -= 1
+        return _response(params['timestamp'])
+
+
+def test_sweep_timestamps_should_exclude_the_end_and_reject_empty_steps():
+    assert list(sweep_timestamps(START, START + timedelta(seconds=30), timedelta(seconds=10))) == [
+        START,
+        START + timedelta(seconds=10),
+        START + timedelta(seconds=20),
+    ]
+    with pytest.raises(ValueError):
+        next(sweep_timestamps(START, START + timedelta(seconds=30), timedelta(0)))
+
+
+@pytest.mark.parametrize('method', ['sweep_historic_positions_light', 'sweep_historic_positions'])
+def test_should_yield_frames_in_timestamp_order(fake_api, method):
+    first = int(START.timestamp())
+    # Earlier frames answer last, they must still come out first
+    respond = _Frames({first: 0.05, first + 10: 0.02})
+    api = fake_api(respond)
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    frames = list(
+        getattr(client, method)(
+            START, START + timedelta(minutes=1), timedelta(seconds=10), max_workers=3, bounds=(1, 0, 0, 1)
+        )
+    )
+
+    assert [frame.timestamp for frame in frames] == [START + timedelta(seconds=10 * index) for index in range(6)]
+    assert [frame.positions[0].fr24_id for frame in frames] == [f'{first + 10 * index:x}' for index in range(6)]
+    assert respond.peak <= 3
+    assert all(params['bounds'] == '1.000,0.000,0.000,1.000' for _, params in api.calls)
+
+
+def test_should_only_read_ahead_a_bounded_number_of_frames(fake_api):
+    api = fake_api(_Frames())
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    frames = client.sweep_historic_positions_light(
+        START, START + timedelta(days=1), timedelta(seconds=10), 2, flights=['SK1']
+    )
+    next(frames)
+    time.sleep(0.05)
+
+    assert len(api.calls) <= 5
+    frames.close()
+
+
+def test_should_raise_when_a_frame_fails():
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 404
+    session.get.return_value.__enter__.return_value.json.return_value = {'message': 'error'}
+    client = FlightRadarClient(FlightRadarApiClient(session, BASE_URL, 'test'))
+
+    with pytest.raises(NotFoundError):
+        list(
+            client.sweep_historic_positions(START, START + timedelta(minutes=1), timedelta(seconds=10), flights=['SK1'])
+        )
+
+
+@pytest.mark.parametrize('method', ['sweep_historic_positions_light', 'sweep_historic_positions'])
+def test_async_should_yield_frames_in_timestamp_order(method):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        timestamp = int(request.url.params['timestamp'])
+        await asyncio.sleep(0.01 if timestamp == int(START.timestamp()) else 0)
+        return httpx.Response(200, json=_response(timestamp))
+
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)), BASE_URL, 'test')
+    )
+
+    async def collect():
+        frames = getattr(client, method)(
+            START, START + timedelta(seconds=50), timedelta(seconds=10), 2, flights=['SK1']
+        )
+        return [frame.timestamp async for frame in frames]
+
+    assert asyncio.run(collect()) == [START + timedelta(seconds=10 * index) for index in range(5)]
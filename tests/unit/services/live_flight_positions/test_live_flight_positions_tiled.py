@@ -0,0 +1,145 @@
+import asyncio
+import random
+from typing import Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.errors import InternalServerError
+from flight_radar.models import FlightPositionLight, LiveFlightPositionRequest
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.service import FlightRadarClient
+from flight_radar.services.tiling import TilingConfig, WORLD_BOUNDS, merge_positions, plan_tiles, split_bounds
+
+BASE_URL = 'https://api.flightradar24.com'
+
+
+def _position(fr24_id: str, lat: float, lon: float, timestamp: str = '2023-11-08T10:10:00Z') -> dict:
+    return {
+        'fr24_id': fr24_id,
+        'lat': lat,
+        'lon': lon,
+        'track': 219,
+        'alt': 38000,
+        'gspeed': 500,
+        'vspeed': 340,
+        'squawk': '6135',
+        'timestamp': timestamp,
+        'source': 'ADSB',
+    }
+
+
+def _world(flights: int, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    return [_position(f'{index:08x}', rng.uniform(-89, 89), rng.uniform(-179, 179)) for index in range(flights)]
+
+
+def _within(flights: list[dict], params: dict) -> list[dict]:
+    north, south, west, east = map(float, params['bounds'].split(','))
+    return [flight for flight in flights if south <= flight['lat'] <= north and west <= flight['lon'] <= east]
+
+
+def _positions(flights: list[dict], limit: int) -> Callable[[str, dict], dict]:
+    """Serves live positions and counts out of ``flights``, truncating responses at ``limit`` like the API does."""
+
+    def respond(path: str, params: dict) -> dict:
+        matching = _within(flights, params)
+        if path.endswith('/count'):
+            return {'record_count': len(matching)}
+
+        return {'data': matching[: min(limit, int(params.get('limit') or limit))]}
+
+    return respond
+
+
+def test_split_bounds_should_cover_the_bounds_with_four_quadrants():
+    assert split_bounds((10.0, -10.0, -20.0, 20.0)) == [
+        (10.0, 0.0, -20.0, 0.0),
+        (10.0, 0.0, 0.0, 20.0),
+        (0.0, -10.0, -20.0, 0.0),
+        (0.0, -10.0, 0.0, 20.0),
+    ]
+
+
+def test_should_return_a_complete_deduplicated_snapshot_of_the_world(fake_api):
+    flights = _world(500)
+    api = fake_api(_positions(flights, limit=100))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    positions = client.get_live_flight_positions_light_tiled(
+        LiveFlightPositionRequest(altitude_ranges=[(0, 40000)]), TilingConfig(max_tile_count=80)
+    )
+
+    assert sorted(position.fr24_id for position in positions) == sorted(flight['fr24_id'] for flight in flights)
+    fetches = [params for path, params in api.calls if not path.endswith('/count')]
+    assert all(len(_within(flights, params)) <= 80 for params in fetches)
+    # Other filters are kept on every tile
+    assert all(params['altitude_ranges'] == '0-40000' for _, params in api.calls)
+
+
+def test_should_only_fetch_once_when_the_bounds_fit_in_one_request(fake_api):
+    api = fake_api(_positions([_position(f'{index:08x}', 45.0, index / 10) for index in range(50)], limit=100))
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    positions = client.get_live_flight_positions_tiled(LiveFlightPositionRequest(bounds=(50.0, 40.0, 0.0, 10.0)))
+
+    assert [path for path, _ in api.calls] == ['/live/flight-positions/count', '/live/flight-positions/full']
+    assert len(positions) == 50
+
+
+def test_should_skip_empty_tiles_and_stop_splitting_at_the_minimum_tile_size(fake_api):
+    crowded = [_position(f'{index:08x}', 10.3, 10.7) for index in range(20)]
+    api = fake_api(_positions(crowded, limit=100))
+    counts = []
+
+    def count(request):
+        counts.append(request.bounds)
+        return MagicMock(record_count=len(_within(crowded, {'bounds': ','.join(map(str, request.bounds))})))
+
+    tiles = plan_tiles(count, LiveFlightPositionRequest(bounds=(20.0, 0.0, 0.0, 20.0)), TilingConfig(max_tile_count=5))
+
+    [((north, south, west, east), record_count)] = tiles.items()
+    assert record_count == 20
+    assert north - south < 0.2 and east - west < 0.2
+    assert api.calls == []
+
+
+def test_merge_positions_should_keep_the_latest_position_and_apply_the_limit():
+    older = FlightPositionLight.model_validate(_position('a', 1, 1, '2023-11-08T10:10:00Z'))
+    newer = FlightPositionLight.model_validate(_position('a', 2, 2, '2023-11-08T10:10:05Z'))
+    other = FlightPositionLight.model_validate(_position('b', 3, 3))
+
+    assert merge_positions([[older, other], [newer]]) == [newer, other]
+    assert merge_positions([[older, other], [newer]], limit=1) == [newer]
+
+
+def test_should_raise_when_a_tile_fails():
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value.status_code = 500
+    session.get.return_value.__enter__.return_value.json.return_value = {'message': 'error'}
+    client = FlightRadarClient(FlightRadarApiClient(session, BASE_URL, 'test'))
+
+    with pytest.raises(InternalServerError):
+        client.get_live_flight_positions_tiled(LiveFlightPositionRequest(bounds=WORLD_BOUNDS))
+
+
+@pytest.mark.parametrize('method', ['get_live_flight_positions_light_tiled', 'get_live_flight_positions_tiled'])
+def test_async_should_return_a_complete_snapshot(fake_api, method):
+    flights = _world(300)
+    api = fake_api(_positions(flights, limit=100))
+
+    client = AsyncFlightRadarClient(
+        AsyncFlightRadarApiClient(httpx.AsyncClient(transport=httpx.MockTransport(api.handler)), BASE_URL, 'test')
+    )
+
+    positions = asyncio.run(
+        getattr(client, method)(
+            LiveFlightPositionRequest(bounds=WORLD_BOUNDS, limit=250), TilingConfig(max_tile_count=90)
+        )
+    )
+
+    assert len(positions) == 250
+    assert len({position.fr24_id for position in positions}) == 250
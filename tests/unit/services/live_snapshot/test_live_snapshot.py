@@ -0,0 +1,236 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from flight_radar.cache import CacheStats
+from flight_radar.enums.enums import FlightCategory
+from flight_radar.metrics import InMemoryMetricsSink
+from flight_radar.models import FlightPosition, FlightPositionLight, LiveFlightPositionRequest
+from flight_radar.services.live_snapshot import LiveSnapshot, LiveSnapshotCache, LiveSnapshotConfig, LiveSnapshotStats
+
+REGION = (60.0, 40.0, -10.0, 30.0)
+
+
+def _position(fr24_id: str, lat: float, lon: float, alt: int = 38000, gspeed: int = 500, squawk: str = '6135') -> dict:
+    return {
+        'fr24_id': fr24_id,
+        'lat': lat,
+        'lon': lon,
+        'track': 219,
+        'alt': alt,
+        'gspeed': gspeed,
+        'vspeed': 0,
+        'squawk': squawk,
+        'timestamp': '2023-11-08T10:10:00Z',
+        'source': 'ADSB',
+    }
+
+
+FLIGHTS = [
+    _position('a', 59.6, 17.9),
+    _position('b', 51.4, -0.4, alt=2000, gspeed=150),
+    _position('c', 48.9, 2.5, squawk='7700'),
+    _position('d', 45.0, 29.9, alt=12000, gspeed=300),
+]
+
+
+def _positions(path: str, params: dict) -> dict:
+    north, south, west, east = map(float, params.get('bounds', '90,-90,-180,180').split(','))
+    matching = [flight for flight in FLIGHTS if south <= flight['lat'] <= north and west <= flight['lon'] <= east]
+    if path.endswith('/count'):
+        return {'record_count': len(matching)}
+
+    return {'data': matching}
+
+
+@pytest.fixture
+def api(fake_api):
+    return fake_api(_positions)
+
+
+def _fetches(api) -> list[dict]:
+    return [params for path, params in api.calls if not path.endswith('/count')]
+
+
+def test_should_answer_sub_regions_from_one_snapshot(api):
+    cache = LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION))
+    client = api.client(live_snapshot=cache)
+
+    nordic = client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=(60.0, 55.0, 10.0, 30.0)))
+    western = client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=(55.0, 45.0, -5.0, 5.0)))
+
+    assert [position.fr24_id for position in nordic] == ['a']
+    assert sorted(position.fr24_id for position in western) == ['b', 'c']
+    assert _fetches(api) == [{'bounds': '60.000,40.000,-10.000,30.000', 'limit': 30000}]
+    assert cache.stats() == LiveSnapshotStats(hits=1, refreshes=1, bypassed=0)
+
+
+def test_should_filter_on_altitude_ground_speed_squawks_and_limit_locally(api):
+    client = api.client(live_snapshot=LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION)))
+
+    def ids(**filters) -> list[str]:
+        return sorted(
+            position.fr24_id for position in client.get_live_flight_positions(LiveFlightPositionRequest(**filters))
+        )
+
+    assert ids(bounds=REGION, altitude_ranges=[(0, 5000), (10000, 15000)]) == ['b', 'd']
+    assert ids(bounds=REGION, gspeed=(100, 400)) == ['b', 'd']
+    assert ids(bounds=REGION, gspeed=500) == ['a', 'c']
+    assert ids(squawks=['7700'], bounds=REGION) == ['c']
+    assert len(ids(bounds=REGION, limit=3)) == 3
+    assert len(_fetches(api)) == 1
+    assert all(
+        isinstance(position, FlightPosition)
+        for position in client.get_live_flight_positions(LiveFlightPositionRequest(bounds=REGION))
+    )
+
+
+def test_should_ignore_a_ground_speed_of_zero_like_the_api_request(api):
+    request = LiveFlightPositionRequest(bounds=REGION, gspeed=0)
+
+    cached = api.client(live_snapshot=LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION)))
+    direct = api.client()
+
+    def ids(client) -> list[str]:
+        return sorted(position.fr24_id for position in client.get_live_flight_positions_light(request))
+
+    assert ids(cached) == ids(direct) == ['a', 'b', 'c', 'd']
+    assert all(params.get('gspeed') is None for _, params in api.calls)
+
+
+def test_should_go_upstream_outside_the_region_for_other_filters_and_when_stale(api, clock):
+    cache = LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION, max_age=5), clock=clock)
+    client = api.client(live_snapshot=cache)
+
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=(70.0, 40.0, -10.0, 30.0)))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=(50.0, 45.0, 0.0, 5.0), callsigns=['SAS1']))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(altitude_ranges=[(0, 1000)]))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+    clock.now += 4.9
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+    clock.now += 0.1
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+
+    assert len(_fetches(api)) == 5
+    assert cache.stats() == LiveSnapshotStats(hits=1, refreshes=2, bypassed=3)
+
+
+def test_should_keep_statistics_per_variant(api, clock):
+    metrics = InMemoryMetricsSink()
+    cache = LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION), clock=clock, metrics=metrics)
+    client = api.client(live_snapshot=cache)
+
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+    client.get_live_flight_positions(LiveFlightPositionRequest(bounds=REGION, callsigns=['SAS1']))
+    clock.now += 2
+
+    assert cache.endpoint_stats() == {
+        '/live/flight-positions/full': CacheStats(bypassed=1),
+        '/live/flight-positions/light': CacheStats(hits=1, misses=1, entries=1, mean_entry_age=2.0),
+    }
+    assert metrics.snapshot().counters['cache.bypassed{cache=live_snapshot,endpoint=/live/flight-positions/full}'] == 1
+
+
+def test_should_keep_a_snapshot_per_variant_and_category_set(api):
+    client = api.client(live_snapshot=LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION)))
+    cargo = [FlightCategory.CARGO, FlightCategory.PASSENGER]
+
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION, categories=cargo))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION, categories=cargo[::-1]))
+    client.get_live_flight_positions_light(LiveFlightPositionRequest(bounds=REGION))
+    client.get_live_flight_positions(LiveFlightPositionRequest(bounds=REGION))
+
+    assert [params.get('categories') for params in _fetches(api)] == ['C,P', None, None]
+
+
+def test_should_fetch_a_stale_snapshot_once_for_concurrent_callers():
+    started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def load():
+        loads.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return [FlightPositionLight.model_validate(flight) for flight in FLIGHTS]
+
+    cache = LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION))
+    request = LiveFlightPositionRequest(bounds=REGION)
+    key = cache.key('light', request)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(cache.get, key, request, load)
+        started.wait(timeout=5)
+        others = [executor.submit(cache.get, key, request, load) for _ in range(3)]
+        release.set()
+        results = [future.result() for future in [first, *others]]
+
+    assert len(loads) == 1
+    assert all(len(result) == 4 for result in results)
+    cache.clear()
+    cache.get(key, request, load)
+    assert len(loads) == 2
+
+
+def test_async_should_fetch_a_stale_snapshot_once_for_concurrent_callers_on_every_loop(clock):
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return [FlightPositionLight.model_validate(flight) for flight in FLIGHTS]
+
+    cache = LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION), clock=clock)
+    request = LiveFlightPositionRequest(bounds=REGION)
+    key = cache.key('light', request)
+
+    async def lookup():
+        return await asyncio.gather(*[cache.get_async(key, request, load) for _ in range(3)])
+
+    first = asyncio.run(lookup())
+    clock.now += 10
+    second = asyncio.run(lookup())
+
+    assert len(loads) == 2
+    assert all(len(result) == 4 for result in first + second)
+
+
+def test_snapshot_should_index_positions_on_a_grid():
+    positions = [FlightPositionLight.model_validate(flight) for flight in FLIGHTS]
+    snapshot = LiveSnapshot(positions, REGION, fetched_at=0.0, cell_size=5.0)
+
+    assert len(snapshot) == 4
+    assert len(snapshot.cells) == 4
+    assert snapshot.query(LiveFlightPositionRequest(bounds=(49.0, 48.8, 2.4, 2.6))) == [positions[2]]
+    assert snapshot.query(LiveFlightPositionRequest(bounds=(49.0, 48.8, 2.6, 2.7))) == []
+    assert (
+        len(
+            LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION))
+            .snapshot_request(LiveFlightPositionRequest(bounds=REGION))
+            .bounds
+        )
+        == 4
+    )
+
+
+def test_async_should_answer_sub_regions_from_one_snapshot(api):
+
+    async def lookup():
+        async with api.async_client(live_snapshot=LiveSnapshotCache(LiveSnapshotConfig(bounds=REGION))) as client:
+            return [
+                await client.get_live_flight_positions_light(
+                    LiveFlightPositionRequest(bounds=(60.0, 55.0, 10.0, 30.0))
+                ),
+                await client.get_live_flight_positions(LiveFlightPositionRequest(bounds=(55.0, 45.0, -5.0, 5.0))),
+                await client.get_live_flight_positions(LiveFlightPositionRequest(bounds=REGION, squawks=['7700'])),
+                await client.get_live_flight_positions(LiveFlightPositionRequest(flights=['SK1'], bounds=REGION)),
+            ]
+
+    nordic, western, emergency, upstream = asyncio.run(lookup())
+
+    assert [position.fr24_id for position in nordic] == ['a']
+    assert sorted(position.fr24_id for position in western) == ['b', 'c']
+    assert [position.fr24_id for position in emergency] == ['c']
+    assert len(upstream) == 4
+    assert len(_fetches(api)) == 3
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.clients.rate_limiter import RateLimiter
+from flight_radar.models import FlightSummaryRequest, HistoricFlightPositionRequest, LiveFlightPositionRequest
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.planner import PlannerConfig, estimate
+from flight_radar.services.service import FlightRadarClient
+from flight_radar.services.tiling import WORLD_BOUNDS, TilingConfig
+from flight_radar.services.windowing import WindowingConfig
+
+BASE_URL = 'https://api.flightradar24.com'
+NOW = datetime.now(tz=timezone.utc).replace(microsecond=0)
+CONFIG = PlannerConfig(
+    credits_per_row={'/live/flight-positions/light': 2, '/flight-summary/full': 3, '/flight-tracks': 10},
+    request_latency=1.0,
+    row_latency=0.0,
+    max_workers=4,
+)
+
+
+def _record_count(url: str, params: dict) -> int:
+    if url.endswith('/live/flight-positions/count') and params.get('bounds'):
+        # 60 flights around (30, -100) and 40 flights around (-30, 100)
+        north, south, west, east = map(float, params['bounds'].split(','))
+        clusters = [(30, -100, 60), (-30, 100, 40)]
+        return sum(flights for lat, lon, flights in clusters if south <= lat <= north and west <= lon <= east)
+    if url.endswith('/flight-summary/count') and params.get('flight_datetime_from'):
+        # 1000 flights a day, each of them seen for a moment
+        span = datetime.fromisoformat(params['flight_datetime_to']) - datetime.fromisoformat(
+            params['flight_datetime_from']
+        )
+        return round(1000 * span / timedelta(days=1))
+
+    return 1000
+
+
+def _counts(path: str, params: dict) -> dict:
+    return {'record_count': _record_count(path, params)}
+
+
+@pytest.fixture
+def api(fake_api):
+    return fake_api(_counts)
+
+
+@pytest.fixture
+def planner(api):
+    return FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test')).planner(CONFIG)
+
+
+def test_estimate_should_run_sub_requests_in_waves_of_workers():
+    plan = estimate('/flight-tracks', 10, 10, 0, CONFIG)
+
+    assert plan.expected_credits == 100
+    assert plan.estimated_seconds == 3.0
+
+
+def test_estimate_should_not_be_faster_than_the_rate_limiter_allows():
+    plan = estimate('/flight-tracks', 10, 10, 0, CONFIG, RateLimiter(requests_per_minute=60))
+
+    assert plan.estimated_seconds == 10.0
+
+
+def test_estimate_should_charge_nothing_for_unknown_endpoints():
+    assert estimate('/unknown', 10, 1, 0, CONFIG).expected_credits == 0
+
+
+def test_should_plan_a_live_query_with_a_single_count(api, planner):
+    plan = planner.plan_live_flight_positions(LiveFlightPositionRequest(callsigns=['WJA329'], limit=500), light=True)
+
+    assert [path for path, _ in api.calls] == ['/live/flight-positions/count']
+    assert plan.endpoint == '/live/flight-positions/light'
+    assert plan.expected_rows == 500
+    assert plan.expected_credits == 1000
+    assert (plan.sub_requests, plan.count_requests) == (1, 1)
+
+
+def test_should_plan_a_tiled_live_query_from_the_tile_counts(api, planner):
+    plan = planner.plan_live_flight_positions(
+        LiveFlightPositionRequest(bounds=WORLD_BOUNDS), light=True, tiling=TilingConfig(max_tile_count=60)
+    )
+
+    assert plan.expected_rows == 100
+    assert plan.sub_requests == 2
+    assert plan.count_requests == len(api.calls) == 5
+
+
+def test_should_cap_historic_rows_at_the_limit(api, planner):
+    plan = planner.plan_historic_positions(
+        HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['WJA329'], limit=10)
+    )
+
+    assert api.calls[0][0] == '/historic/flight-positions/count'
+    assert api.calls[0][1]['timestamp'] == 1702383145
+    assert plan.expected_rows == 10
+
+
+def test_should_plan_a_flight_summary_query(api, planner):
+    plan = planner.plan_flight_summary(
+        FlightSummaryRequest(flight_datetime_from=NOW - timedelta(days=1), flight_datetime_to=NOW, callsigns=['X'])
+    )
+
+    assert api.calls[0][0] == '/flight-summary/count'
+    assert plan.expected_rows == 1000
+    assert plan.expected_credits == 3000
+
+
+def test_should_plan_a_windowed_flight_summary_query_per_window(planner):
+    start = NOW - timedelta(days=3)
+    plan = planner.plan_flight_summary_windowed(
+        start, start + timedelta(days=3), config=WindowingConfig(max_window=timedelta(days=1)), callsigns=['X']
+    )
+
+    assert plan.sub_requests == 3
+    # The flights first seen after the first two windows are counted too
+    assert plan.count_requests == 5
+    assert plan.expected_rows == 3000
+
+
+def test_should_plan_tracks_and_events_without_counting(api, planner):
+    tracks = planner.plan_flight_tracks(['a', 'b', 'a'])
+    events = planner.plan_historic_flight_events([str(index) for index in range(16)], light=True)
+
+    assert api.calls == []
+    assert (tracks.expected_rows, tracks.sub_requests, tracks.expected_credits) == (2, 2, 20)
+    assert (events.expected_rows, events.sub_requests) == (16, 2)
+
+
+@pytest.mark.parametrize('tiling', [None, TilingConfig(max_tile_count=60)])
+def test_async_should_plan_live_queries(api, tiling):
+    async def plan():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as http_client:
+            client = AsyncFlightRadarClient(AsyncFlightRadarApiClient(http_client, BASE_URL, 'test'))
+            return await client.planner(CONFIG).plan_live_flight_positions(
+                LiveFlightPositionRequest(bounds=WORLD_BOUNDS), light=True, tiling=tiling
+            )
+
+    result = asyncio.run(plan())
+
+    assert result.expected_rows == 100
+    assert result.sub_requests == (1 if tiling is None else 2)
+
+
+def test_async_should_plan_historic_and_summary_queries(api):
+    async def plan():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as http_client:
+            planner = AsyncFlightRadarClient(AsyncFlightRadarApiClient(http_client, BASE_URL, 'test')).planner(CONFIG)
+            start = NOW - timedelta(days=3)
+            return (
+                await planner.plan_historic_positions(
+                    HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['WJA329'])
+                ),
+                await planner.plan_flight_summary(FlightSummaryRequest(flight_ids=['34242a02'])),
+                await planner.plan_flight_summary_windowed(
+                    start,
+                    start + timedelta(days=2),
+                    callsigns=['X'],
+                    config=WindowingConfig(max_window=timedelta(days=1)),
+                ),
+            )
+
+    historic, summary, windowed = asyncio.run(plan())
+
+    assert historic.expected_rows == summary.expected_rows == 1000
+    assert windowed.expected_rows == 2000
@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+
+from flight_radar.clients.api_client import FlightRadarApiClient
+from flight_radar.clients.async_api_client import AsyncFlightRadarApiClient
+from flight_radar.models import (
+    FlightPosition,
+    FlightPositionLight,
+    FlightSummaryRequest,
+    HistoricFlightPositionRequest,
+    LiveFlightPositionRequest,
+)
+from flight_radar.models.historic_flight_event import HistoricFlightEventRequest
+from flight_radar.services.async_service import AsyncFlightRadarClient
+from flight_radar.services.projection import (
+    HISTORIC_FLIGHT_POSITIONS,
+    LIVE_FLIGHT_POSITIONS,
+    projected_model,
+    resolve,
+    select_variant,
+)
+from flight_radar.services.service import FlightRadarClient
+
+BASE_URL = 'https://api.flightradar24.com'
+POSITION = {
+    'fr24_id': '321a0cc3',
+    'flight': 'AF1463',
+    'callsign': 'AFR1463',
+    'lat': -0.08806,
+    'lon': -168.07118,
+    'track': 219,
+    'alt': 38000,
+    'gspeed': 500,
+    'vspeed': 340,
+    'squawk': 6135,
+    'timestamp': '2023-11-08T10:10:00Z',
+    'source': 'ADSB',
+    'hex': '394C19',
+    'type': 'A321',
+    'reg': 'F-GTAZ',
+    'painted_as': 'THY',
+    'operating_as': 'THY',
+    'orig_iata': 'ARN',
+    'orig_icao': 'ESSA',
+    'dest_iata': 'LHR',
+    'dest_icao': 'EGLL',
+    'eta': '2023-11-08T10:10:00Z',
+}
+
+
+def test_select_variant_should_pick_the_light_variant_when_it_covers_the_fields():
+    assert select_variant(LIVE_FLIGHT_POSITIONS, ['lat', 'lon', 'alt']).model is FlightPositionLight
+    assert select_variant(LIVE_FLIGHT_POSITIONS, ['lat', 'reg']).model is FlightPosition
+
+
+def test_select_variant_should_reject_unknown_fields():
+    with pytest.raises(ValueError, match='altitude'):
+        select_variant(HISTORIC_FLIGHT_POSITIONS, ['lat', 'altitude'])
+
+
+def test_resolve_should_reject_an_empty_projection():
+    with pytest.raises(ValueError):
+        resolve(LIVE_FLIGHT_POSITIONS, [])
+
+
+def test_projected_model_should_keep_only_the_requested_fields_and_their_validation():
+    model = projected_model(FlightPositionLight, frozenset({'squawk', 'alt'}))
+
+    position = model.model_validate(POSITION)
+
+    assert position.model_dump() == {'alt': 38000, 'squawk': '6135'}
+    assert projected_model(FlightPositionLight, frozenset({'alt', 'squawk'})) is model
+
+
+@pytest.mark.parametrize('fast_decode', [False, True])
+@pytest.mark.parametrize(
+    'fields, url',
+    [(['lat', 'lon', 'alt'], '/live/flight-positions/light'), (['alt', 'reg'], '/live/flight-positions/full')],
+)
+def test_should_call_the_cheapest_variant_and_decode_only_the_fields(fake_api, fields, url, fast_decode):
+    api = fake_api(lambda path, params: {'data': [POSITION]})
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test', fast_decode=fast_decode))
+
+    [position] = client.get_live_flight_positions_projected(LiveFlightPositionRequest(callsigns=['AFR1463']), fields)
+
+    assert api.calls[0][0] == url
+    assert api.calls[0][1]['callsigns'] == 'AFR1463'
+    assert position.model_dump() == {field: POSITION[field] for field in fields}
+
+
+def test_should_project_flight_summaries_and_events(fake_api):
+    api = fake_api(
+        lambda path, params: {'data': [{'fr24_id': '34242a02', 'callsign': 'SAS1', 'hex': '4B1', 'events': []}]}
+    )
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    [summary] = client.get_flight_summary_projected(FlightSummaryRequest(flight_ids=['34242a02']), ['fr24_id'])
+    [entry] = client.get_historic_flight_events_projected(
+        HistoricFlightEventRequest(flight_ids=['34242a02'], event_types=['all']), ['callsign']
+    )
+
+    assert [path for path, _ in api.calls] == ['/flight-summary/light', '/historic/flight-events/light']
+    assert summary.fr24_id == '34242a02'
+    assert entry.callsign == 'SAS1'
+
+
+def test_should_project_historic_positions(fake_api):
+    api = fake_api(lambda path, params: {'data': [POSITION]})
+    client = FlightRadarClient(FlightRadarApiClient(api.session(), BASE_URL, 'test'))
+
+    [position] = client.get_historic_positions_projected(
+        HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463']), ['lat', 'lon']
+    )
+
+    assert api.calls[0][0] == '/historic/flight-positions/light'
+    assert (position.lat, position.lon) == (POSITION['lat'], POSITION['lon'])
+
+
+def test_async_should_call_the_cheapest_variant(fake_api):
+    api = fake_api(lambda path, params: {'data': [POSITION]})
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as http_client:
+            client = AsyncFlightRadarClient(AsyncFlightRadarApiClient(http_client, BASE_URL, 'test'))
+            request = LiveFlightPositionRequest(callsigns=['AFR1463'])
+            return (
+                await client.get_live_flight_positions_projected(request, ['gspeed']),
+                await client.get_historic_positions_projected(
+                    HistoricFlightPositionRequest(timestamp=1702383145, callsigns=['AFR1463']), ['type']
+                ),
+                await client.get_flight_summary_projected(FlightSummaryRequest(flight_ids=['321a0cc3']), ['fr24_id']),
+                await client.get_historic_flight_events_projected(
+                    HistoricFlightEventRequest(flight_ids=['321a0cc3'], event_types=['all']), ['fr24_id']
+                ),
+            )
+
+    live, historic, summaries, events = asyncio.run(fetch())
+
+    assert [path for path, _ in api.calls] == [
+        '/live/flight-positions/light',
+        '/historic/flight-positions/full',
+        '/flight-summary/light',
+        '/historic/flight-events/light',
+    ]
+    assert live[0].gspeed == 500
+    assert historic[0].type == 'A321'
+    assert summaries[0].fr24_id == events[0].fr24_id == '321a0cc3'
@@ -0,0 +1,469 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from flight_radar.cache import CacheStats
+from flight_radar.errors import BadRequestError, InternalServerError, NotFoundError
+from flight_radar.metrics import InMemoryMetricsSink
+from flight_radar.models import Airline, Airport
+from flight_radar.services.reference_data import (
+    ReferenceDataCache,
+    ReferenceDataConfig,
+    ReferenceDataStats,
+    reference_key,
+)
+
+
+@pytest.fixture
+def open_cache():
+    caches = []
+
+    def factory(*args, **kwargs) -> ReferenceDataCache:
+        caches.append(ReferenceDataCache(*args, **kwargs))
+        return caches[-1]
+
+    yield factory
+    for cache in caches:
+        cache.close()
+
+
+def _reference(payloads: dict, failures: dict | None = None) -> Callable[[str, dict], tuple[int, dict]]:
+    """Answers the paths of ``payloads``, with the status of ``failures`` for the paths listed there."""
+
+    def respond(path: str, params: dict) -> tuple[int, dict]:
+        status_code = (failures or {}).get(path) or (200 if path in payloads else 404)
+        return status_code, payloads.get(path, {'message': 'Not found'})
+
+    return respond
+
+
+def test_should_answer_repeated_lookups_from_memory(
+    fake_api, mock_get_airport_response, mock_get_airlines_light_response
+):
+    api = fake_api(
+        _reference(
+            {
+                '/static/airports/ESSA/full': mock_get_airport_response,
+                '/static/airlines/SAS/light': mock_get_airlines_light_response,
+            }
+        )
+    )
+    client = api.client(reference_data=ReferenceDataCache())
+
+    airport = client.get_airports('ESSA')
+    airline = client.get_airlines_light('SAS')
+
+    assert client.get_airports('essa') is airport
+    assert client.get_airlines_light('SAS') is airline
+    assert len(api.calls) == 2
+
+
+def test_should_refetch_expired_entries(fake_api, clock, mock_get_airports_light_response):
+    api = fake_api(_reference({'/static/airports/ARN/light': mock_get_airports_light_response}))
+    client = api.client(reference_data=ReferenceDataCache(ReferenceDataConfig(ttl=timedelta(hours=1)), clock=clock))
+
+    client.get_airports_light('ARN')
+    clock.now += 3599
+    client.get_airports_light('ARN')
+    clock.now += 1
+    client.get_airports_light('ARN')
+
+    assert len(api.calls) == 2
+
+
+def test_should_survive_restarts_through_the_disk_tier(tmp_path, fake_api, open_cache, mock_get_airport_response):
+    config = ReferenceDataConfig(path=tmp_path / 'reference.db')
+    payloads = {'/static/airports/ESSA/full': mock_get_airport_response}
+    api = fake_api(_reference(payloads))
+    airport = api.client(reference_data=open_cache(config)).get_airports('ESSA')
+
+    payloads.clear()
+    restarted = api.client(reference_data=open_cache(config))
+
+    assert restarted.get_airports('ESSA') == airport
+    assert isinstance(restarted.get_airports('ESSA'), Airport)
+    assert len(api.calls) == 1
+
+
+def test_should_ignore_expired_entries_on_disk(tmp_path, clock, open_cache, mock_get_airlines_light_response):
+    cache = open_cache(ReferenceDataConfig(path=tmp_path / 'reference.db', ttl=timedelta(days=1)), clock=clock)
+    cache.set(reference_key('airlines/light', 'SAS'), Airline.model_validate(mock_get_airlines_light_response))
+    clock.now += timedelta(days=2).total_seconds()
+
+    restarted = open_cache(cache.config, clock=clock)
+
+    assert restarted.get(reference_key('airlines/light', 'SAS'), Airline) is None
+
+
+def test_should_invalidate_and_clear_both_tiers(tmp_path, open_cache, mock_get_airlines_light_response):
+    cache = open_cache(ReferenceDataConfig(path=tmp_path / 'reference.db'))
+    airline = Airline.model_validate(mock_get_airlines_light_response)
+    cache.set('a', airline)
+    cache.set('b', airline)
+
+    cache.invalidate('a')
+    assert cache.get('a', Airline) is None
+    cache.clear()
+    assert cache.get('b', Airline) is None
+    assert ReferenceDataCache().get('b', Airline) is None
+
+
+def test_should_prewarm_codes_concurrently_and_report_failures(fake_api, mock_get_airport_response):
+    api = fake_api(_reference({'/static/airports/ESSA/full': mock_get_airport_response}))
+    client = api.client(reference_data=ReferenceDataCache())
+
+    results = client.prewarm_airports(['ESSA', 'XXXX'], max_workers=2)
+
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, NotFoundError)
+    client.get_airports('ESSA')
+    assert len(api.calls) == 2
+
+
+def test_should_prewarm_light_airports_and_airlines(
+    fake_api, mock_get_airports_light_response, mock_get_airlines_light_response
+):
+    api = fake_api(
+        _reference(
+            {
+                '/static/airports/ARN/light': mock_get_airports_light_response,
+                '/static/airlines/SAS/light': mock_get_airlines_light_response,
+            }
+        )
+    )
+    client = api.client(reference_data=ReferenceDataCache())
+
+    assert client.prewarm_airports(['ARN'], light=True)[0].ok
+    assert client.prewarm_airlines(['SAS'])[0].ok
+    client.get_airports_light('ARN')
+    client.get_airlines_light('SAS')
+    assert len(api.calls) == 2
+
+
+def test_async_should_answer_repeated_lookups_from_the_cache(
+    fake_api, mock_get_airport_response, mock_get_airports_light_response, mock_get_airlines_light_response
+):
+    api = fake_api(
+        _reference(
+            {
+                '/static/airports/ESSA/full': mock_get_airport_response,
+                '/static/airports/ARN/light': mock_get_airports_light_response,
+                '/static/airlines/SAS/light': mock_get_airlines_light_response,
+            }
+        )
+    )
+
+    async def lookup():
+        async with api.async_client(reference_data=ReferenceDataCache()) as client:
+            warmed = [
+                *await client.prewarm_airports(['ESSA']),
+                *await client.prewarm_airports(['ARN'], light=True),
+                *await client.prewarm_airlines(['SAS']),
+            ]
+            await client.get_airports('ESSA')
+            await client.get_airports_light('ARN')
+            await client.get_airlines_light('SAS')
+            return warmed
+
+    warmed = asyncio.run(lookup())
+
+    assert all(result.ok for result in warmed)
+    assert len(api.calls) == 3
+
+
+def test_should_answer_repeated_misses_from_the_negative_cache(fake_api, clock):
+    api = fake_api(_reference({}))
+    cache = ReferenceDataCache(ReferenceDataConfig(negative_ttl=timedelta(minutes=10)), clock=clock)
+    client = api.client(reference_data=cache)
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError) as error:
+            client.get_airports('XXXX')
+        assert error.value.args == ({'message': 'Not found'},)
+
+    assert len(api.calls) == 1
+    assert cache.stats() == ReferenceDataStats(hits=0, negative_hits=2, misses=1)
+
+    clock.now += 600
+    with pytest.raises(NotFoundError):
+        client.get_airports('xxxx')
+    assert len(api.calls) == 2
+
+
+def test_should_keep_misses_on_disk_and_count_hits(tmp_path, fake_api, open_cache, mock_get_airlines_light_response):
+    config = ReferenceDataConfig(path=tmp_path / 'reference.db')
+    payloads = {'/static/airlines/SAS/light': mock_get_airlines_light_response}
+    api = fake_api(_reference(payloads))
+    client = api.client(reference_data=open_cache(config))
+    client.get_airlines_light('SAS')
+    client.get_airlines_light('SAS')
+    with pytest.raises(NotFoundError):
+        client.get_airlines_light('XXX')
+    assert client.reference_data.stats() == ReferenceDataStats(hits=1, negative_hits=0, misses=2)
+
+    payloads.clear()
+    restarted = api.client(reference_data=open_cache(config))
+
+    with pytest.raises(NotFoundError) as error:
+        restarted.get_airlines_light('XXX')
+    assert error.value.args == ({'message': 'Not found'},)
+    assert len(api.calls) == 2
+    assert restarted.reference_data.stats().negative_hits == 1
+
+
+def test_should_not_cache_misses_when_negative_ttl_is_zero(fake_api):
+    api = fake_api(_reference({}))
+    client = api.client(reference_data=ReferenceDataCache(ReferenceDataConfig(negative_ttl=timedelta(0))))
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            client.get_airlines_light('XXX')
+
+    assert len(api.calls) == 2
+
+
+def test_async_should_answer_repeated_misses_from_the_negative_cache(fake_api):
+    api = fake_api(_reference({}))
+
+    async def lookup():
+        async with api.async_client(reference_data=ReferenceDataCache()) as client:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    await client.get_airports_light('XXX')
+            return client.reference_data.stats()
+
+    stats = asyncio.run(lookup())
+
+    assert stats.negative_hits == 1
+    assert len(api.calls) == 1
+
+
+def test_should_keep_statistics_per_kind_of_lookup(
+    tmp_path, fake_api, clock, open_cache, mock_get_airport_response, mock_get_airlines_light_response
+):
+    metrics = InMemoryMetricsSink()
+    cache = open_cache(ReferenceDataConfig(path=tmp_path / 'reference.db'), clock=clock, metrics=metrics)
+    api = fake_api(
+        _reference(
+            {
+                '/static/airports/ESSA/full': mock_get_airport_response,
+                '/static/airlines/SAS/light': mock_get_airlines_light_response,
+            }
+        )
+    )
+    client = api.client(reference_data=cache)
+    client.get_airports('ESSA')
+    client.get_airports('ESSA')
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            client.get_airports('XXXX')
+    clock.now += 10
+    client.get_airlines_light('SAS')
+
+    stats = cache.endpoint_stats()
+
+    assert stats.keys() == {'airports/full', 'airlines/light'}
+    assert stats['airports/full'].model_dump(include={'hits', 'negative_hits', 'misses', 'entries'}) == {
+        'hits': 1,
+        'negative_hits': 1,
+        'misses': 2,
+        'entries': 2,
+    }
+    assert stats['airports/full'].mean_entry_age == 10.0
+    assert stats['airlines/light'].bytes_stored > 0
+    assert cache.stats() == ReferenceDataStats(hits=1, negative_hits=1, misses=3)
+    assert metrics.snapshot().counters['cache.negative_hits{cache=reference_data,endpoint=airports/full}'] == 1
+
+
+def test_should_count_evictions_of_the_last_tier(fake_api, clock, mock_get_airlines_light_response):
+    cache = ReferenceDataCache(ReferenceDataConfig(max_entries=1), clock=clock)
+    client = fake_api(_reference({'/static/airlines/SAS/light': mock_get_airlines_light_response})).client(
+        reference_data=cache
+    )
+    client.get_airlines_light('SAS')
+    with pytest.raises(NotFoundError):
+        client.get_airlines_light('XXX')
+
+    assert cache.endpoint_stats() == {
+        'airlines/light': CacheStats(misses=2, evictions=1, entries=1, mean_entry_age=0.0),
+    }
+
+
+def test_async_should_read_the_persistent_tier_off_the_event_loop(
+    fake_api, slow_backend, mock_get_airlines_light_response
+):
+    api = fake_api(_reference({'/static/airlines/SAS/light': mock_get_airlines_light_response}))
+
+    async def lookup():
+        async with api.async_client(reference_data=ReferenceDataCache(disk=slow_backend)) as client:
+            started = time.monotonic()
+
+            async def tick() -> float:
+                await asyncio.sleep(0.01)
+                return time.monotonic() - started
+
+            _, ticked = await asyncio.gather(client.get_airlines_light('SAS'), tick())
+            await client.get_airlines_light('SAS')
+            return ticked, client.reference_data.stats()
+
+    ticked, stats = asyncio.run(lookup())
+
+    assert ticked < slow_backend.delay
+    assert stats == ReferenceDataStats(hits=1, negative_hits=0, misses=1)
+
+
+def test_should_serve_expired_models_when_the_api_fails(fake_api, clock, mock_get_airport_response):
+    failures = {}
+    cache = ReferenceDataCache(
+        ReferenceDataConfig(ttl=timedelta(hours=1), stale_if_error=timedelta(hours=2)), clock=clock
+    )
+    api = fake_api(_reference({'/static/airports/ESSA/full': mock_get_airport_response}, failures))
+    client = api.client(reference_data=cache)
+    airport = client.get_airports('ESSA')
+
+    failures['/static/airports/ESSA/full'] = 500
+    clock.now += 3600
+    assert client.get_airports('ESSA') == airport
+    failures['/static/airports/ESSA/full'] = 429
+    assert client.get_airports('ESSA') == airport
+
+    clock.now += 7200
+    with pytest.raises(InternalServerError):
+        failures['/static/airports/ESSA/full'] = 500
+        client.get_airports('ESSA')
+    with pytest.raises(BadRequestError):
+        failures['/static/airports/ESSA/full'] = 400
+        client.get_airports('ESSA')
+    assert cache.endpoint_stats()['airports/full'].stale_hits == 2
+
+
+def test_should_serve_expired_models_from_disk_while_refreshing_them(
+    tmp_path, fake_api, clock, open_cache, mock_get_airport_response
+):
+    failures = {}
+    config = ReferenceDataConfig(
+        ttl=timedelta(hours=1), stale_while_revalidate=timedelta(hours=1), path=tmp_path / 'reference.db'
+    )
+    api = fake_api(_reference({'/static/airports/ESSA/full': mock_get_airport_response}, failures))
+    airport = api.client(reference_data=open_cache(config, clock=clock)).get_airports('ESSA')
+
+    def wait_for_refreshes(cache: ReferenceDataCache) -> None:
+        while cache._refreshing:
+            time.sleep(0.01)
+
+    clock.now += 3600
+    restarted = open_cache(config, clock=clock)
+    client = api.client(reference_data=restarted)
+    failures['/static/airports/ESSA/full'] = 500
+    assert client.get_airports('ESSA') == airport
+    wait_for_refreshes(restarted)
+    failures.clear()
+    assert client.get_airports('ESSA') == airport
+    wait_for_refreshes(restarted)
+
+    assert len(api.calls) == 3
+    assert restarted.get(reference_key('airports/full', 'ESSA'), Airport) == airport
+    assert restarted.stats() == ReferenceDataStats(hits=1, negative_hits=0, misses=0)
+    assert restarted._start_refresh('key') and not restarted._start_refresh('key')
+
+
+def test_async_should_serve_expired_models_while_refreshing_and_when_the_api_fails(
+    fake_api, clock, mock_get_airlines_light_response
+):
+    statuses = []
+    api = fake_api(lambda path, params: (statuses.pop(0) if statuses else 200, mock_get_airlines_light_response))
+
+    async def lookup():
+        cache = ReferenceDataCache(
+            ReferenceDataConfig(ttl=timedelta(hours=1), stale_while_revalidate=timedelta(hours=1)), clock=clock
+        )
+        async with api.async_client(reference_data=cache) as client:
+            airline = await client.get_airlines_light('SAS')
+            clock.now += 3600
+            statuses.append(500)
+            assert await client.get_airlines_light('SAS') == airline
+            await asyncio.gather(*cache._refresh_tasks)
+            assert await client.get_airlines_light('SAS') == airline
+            await asyncio.gather(*cache._refresh_tasks)
+            assert await client.get_airlines_light('SAS') == airline
+
+            # Past the revalidation window, the API is asked first and the model only stands in for its error
+            clock.now += 7200
+            statuses.append(500)
+            assert await client.get_airlines_light('SAS') == airline
+            with pytest.raises(NotFoundError):
+                statuses.append(404)
+                await client.get_airlines_light('XXX')
+            with pytest.raises(BadRequestError):
+                statuses.append(400)
+                await client.get_airlines_light('SAS')
+            cache.close()
+            return cache.endpoint_stats()['airlines/light']
+
+    stats = asyncio.run(lookup())
+
+    assert (stats.hits, stats.misses, stats.stale_hits) == (1, 4, 3)
+
+
+def test_async_close_should_cancel_pending_refreshes(fake_api, clock, mock_get_airlines_light_response):
+    api = fake_api(_reference({'/static/airlines/SAS/light': mock_get_airlines_light_response}))
+
+    async def lookup():
+        cache = ReferenceDataCache(
+            ReferenceDataConfig(ttl=timedelta(hours=1), stale_while_revalidate=timedelta(hours=1)), clock=clock
+        )
+        async with api.async_client(reference_data=cache) as client:
+            await client.get_airlines_light('SAS')
+            clock.now += 3600
+            await client.get_airlines_light('SAS')
+            tasks = set(cache._refresh_tasks)
+            cache.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return tasks
+
+    tasks = asyncio.run(lookup())
+
+    assert tasks and all(task.cancelled() for task in tasks)
+
+
+def test_closing_the_client_should_close_its_caches(tmp_path, fake_api, clock, mock_get_airport_response):
+    cache = ReferenceDataCache(
+        ReferenceDataConfig(
+            ttl=timedelta(hours=1), stale_while_revalidate=timedelta(hours=1), path=tmp_path / 'reference.db'
+        ),
+        clock=clock,
+    )
+    api = fake_api(_reference({'/static/airports/ESSA/full': mock_get_airport_response}))
+    historic_cache = MagicMock()
+    with api.client(reference_data=cache, historic_cache=historic_cache) as client:
+        client.get_airports('ESSA')
+        clock.now += 3600
+        client.get_airports('ESSA')
+
+    assert cache._refresh_executor._shutdown
+    assert cache.disk._connections == []
+    historic_cache.close.assert_called_once()
+
+
+def test_async_closing_the_client_should_close_its_caches(fake_api, clock, mock_get_airlines_light_response):
+    api = fake_api(_reference({'/static/airlines/SAS/light': mock_get_airlines_light_response}))
+    cache = ReferenceDataCache(
+        ReferenceDataConfig(ttl=timedelta(hours=1), stale_while_revalidate=timedelta(hours=1)), clock=clock
+    )
+    live_snapshot = MagicMock()
+
+    async def lookup():
+        async with api.async_client(reference_data=cache, live_snapshot=live_snapshot) as client:
+            await client.get_airlines_light('SAS')
+            clock.now += 3600
+            await client.get_airlines_light('SAS')
+            return set(cache._refresh_tasks)
+
+    tasks = asyncio.run(lookup())
+
+    assert tasks and all(task.cancelled() for task in tasks)
+    live_snapshot.close.assert_called_once()